@@ -3,11 +3,15 @@ from __future__ import annotations
 
 import logging
 
-from homeassistant.config_entries import ConfigEntry
+import homeassistant.helpers.config_validation as cv
+import voluptuous as vol
+from homeassistant.config_entries import ConfigEntry, ConfigEntryState
 from homeassistant.const import (CONF_HOST, CONF_ID, CONF_PORT, CONF_TOKEN,
                                  Platform)
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.typing import ConfigType
 from msmart import __version__ as MSMART_VERSION
 from msmart.base_device import Device
 from msmart.const import DeviceType
@@ -15,24 +19,87 @@ from msmart.device import AirConditioner as AC
 from msmart.device import CommercialAirConditioner as CC
 from msmart.lan import AuthenticationError
 
-from .const import (CONF_ADDITIONAL_OPERATION_MODES, CONF_DEVICE_TYPE,
-                    CONF_ENERGY_DATA_FORMAT, CONF_ENERGY_DATA_SCALE,
-                    CONF_ENERGY_SENSOR, CONF_KEY, CONF_MAX_CONNECTION_LIFETIME,
-                    CONF_POWER_SENSOR, CONF_SHOW_ALL_PRESETS,
-                    CONF_USE_FAN_ONLY_WORKAROUND, CONF_WORKAROUNDS, DOMAIN,
-                    EnergyFormat)
+from .capabilities import MideaCapabilityStore
+from .const import (CONF_ADDITIONAL_OPERATION_MODES, CONF_BEEP,
+                    CONF_DEVICE_TYPE, CONF_ENERGY_DATA_FORMAT,
+                    CONF_ENERGY_DATA_SCALE, CONF_ENERGY_SENSOR,
+                    CONF_FAN_SPEED_STEP, CONF_FAST_START, CONF_KEY,
+                    CONF_MAX_CONCURRENT_STARTUPS, CONF_MAX_CONNECTION_LIFETIME,
+                    CONF_MAX_UPDATE_INTERVAL, CONF_MIN_UPDATE_INTERVAL,
+                    CONF_NUMBER_DEBOUNCE_WINDOW, CONF_OPTIMISTIC,
+                    CONF_POWER_SENSOR, CONF_REFRESH_AFTER_APPLY,
+                    CONF_SENSOR_FILTER, CONF_SHOW_ALL_PRESETS, CONF_TEMP_STEP,
+                    CONF_USE_FAN_ONLY_WORKAROUND, CONF_WORKAROUNDS,
+                    DATA_CAPABILITY_STORE, DATA_PLATFORMS, DATA_SCHEDULER,
+                    DATA_SESSIONS, DATA_SNAPSHOT_STORE, DATA_STARTUP, DOMAIN,
+                    MAX_CONCURRENT_STARTUPS, MAX_UPDATE_INTERVAL,
+                    MIN_UPDATE_INTERVAL, SIGNAL_OPTIONS_UPDATED, EnergyFormat,
+                    MideaDevice)
 from .coordinator import MideaDeviceUpdateCoordinator
+from .features import PLATFORM_ENTITIES
+from .scheduler import MideaRequestScheduler
+from .services import async_setup_services, async_unload_services
+from .session import MideaSessionManager
+from .snapshot import MideaSnapshotStore
+from .startup import MideaStartupCoordinator
 
 _LOGGER = logging.getLogger(__name__)
-_PLATFORMS = [
-    Platform.BINARY_SENSOR,
-    Platform.BUTTON,
-    Platform.CLIMATE,
-    Platform.NUMBER,
-    Platform.SELECT,
-    Platform.SENSOR,
-    Platform.SWITCH
-]
+
+# Settings shared by all devices
+CONFIG_SCHEMA = vol.Schema(
+    {
+        DOMAIN: vol.Schema({
+            vol.Optional(CONF_MAX_CONCURRENT_STARTUPS, default=MAX_CONCURRENT_STARTUPS): vol.All(
+                vol.Coerce(int),
+                vol.Range(min=1)
+            ),
+        })
+    },
+    extra=vol.ALLOW_EXTRA,
+)
+
+# Options which can be applied without reloading the entry
+_HOT_OPTIONS = {
+    CONF_BEEP,
+    CONF_TEMP_STEP,
+    CONF_FAN_SPEED_STEP,
+    CONF_NUMBER_DEBOUNCE_WINDOW,
+    CONF_ENERGY_SENSOR,
+    CONF_POWER_SENSOR,
+    CONF_SENSOR_FILTER,
+    CONF_MAX_CONNECTION_LIFETIME,
+    CONF_MIN_UPDATE_INTERVAL,
+    CONF_MAX_UPDATE_INTERVAL,
+    CONF_REFRESH_AFTER_APPLY,
+    CONF_OPTIMISTIC,
+    CONF_FAST_START,
+}
+
+
+def _get_platforms(device: MideaDevice) -> list[Platform]:
+    """Get the platforms which will create entities for a device."""
+
+    # Climate and sensor entities are always created
+    platforms = [Platform.CLIMATE, Platform.SENSOR]
+
+    # Other platforms only create entities for supported features
+    for platform, get_supported_entities in PLATFORM_ENTITIES.items():
+        if get_supported_entities(device):
+            platforms.append(platform)
+
+    return platforms
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Setup the Midea Smart AC integration."""
+
+    # Limit concurrent startups of all devices
+    max_concurrent_startups = config.get(DOMAIN, {}).get(
+        CONF_MAX_CONCURRENT_STARTUPS, MAX_CONCURRENT_STARTUPS)
+    hass.data.setdefault(DOMAIN, {})[DATA_STARTUP] = MideaStartupCoordinator(
+        max_concurrent_startups)
+
+    return True
 
 
 async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
@@ -41,6 +108,20 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
     # Ensure the global data dict exists
     hass.data.setdefault(DOMAIN, {})
 
+    # Share a request scheduler and caches between all devices
+    scheduler = hass.data[DOMAIN].setdefault(
+        DATA_SCHEDULER, MideaRequestScheduler())
+    capability_store = hass.data[DOMAIN].setdefault(
+        DATA_CAPABILITY_STORE, MideaCapabilityStore(hass))
+    snapshot_store = hass.data[DOMAIN].setdefault(
+        DATA_SNAPSHOT_STORE, MideaSnapshotStore(hass))
+    sessions = hass.data[DOMAIN].setdefault(
+        DATA_SESSIONS, MideaSessionManager())
+    startup_coordinator = hass.data[DOMAIN][DATA_STARTUP]
+
+    # Register domain services shared by all devices
+    async_setup_services(hass)
+
     device_type = config_entry.data[CONF_DEVICE_TYPE]
     id = config_entry.data[CONF_ID]
     host = config_entry.data[CONF_HOST]
@@ -58,43 +139,160 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
     )
     assert isinstance(device, (AC, CC))
 
+    # Reuse the authenticated session of V3 devices across reloads
+    token = config_entry.data[CONF_TOKEN]
+    key = config_entry.data[CONF_KEY]
+    protocol_version = 3 if token and key else 2
+    session = None
+    if protocol_version == 3:
+        session = sessions.async_get(device.id, host, port, token, key)
+        session.attach(device)
+
     # Configure the connection lifetime
     if (lifetime := config_entry.options.get(CONF_MAX_CONNECTION_LIFETIME)) is not None:
         _LOGGER.info(
             "Setting maximum connection lifetime to %s seconds for device ID %s.", lifetime, device.id)
         device.set_max_connection_lifetime(lifetime)
 
-    # Configure token and k1 as needed
-    token = config_entry.data[CONF_TOKEN]
-    key = config_entry.data[CONF_KEY]
-    if token and key:
-        try:
-            await device.authenticate(token, key)
-        except AuthenticationError as e:
-            raise ConfigEntryNotReady(
-                "Failed to authenticate with device.") from e
-
-    # Query device capabilities
-    _LOGGER.info("Querying capabilities for device ID %s.", device.id)
-    await device.get_capabilities()
+    # Use cached capabilities if available
+    capabilities_cached = await capability_store.async_restore(device, protocol_version)
+
+    # Restore the last known state to skip waiting for the device at startup
+    await snapshot_store.async_load()
+    fast_start = (config_entry.options.get(CONF_FAST_START, False)
+                  and capabilities_cached
+                  and await snapshot_store.async_restore(device))
+
+    # Create device coordinator
+    coordinator = MideaDeviceUpdateCoordinator(
+        hass,
+        device,  # type: ignore
+        min_update_interval=config_entry.options.get(
+            CONF_MIN_UPDATE_INTERVAL, MIN_UPDATE_INTERVAL),
+        max_update_interval=config_entry.options.get(
+            CONF_MAX_UPDATE_INTERVAL, MAX_UPDATE_INTERVAL),
+        refresh_after_apply=config_entry.options.get(
+            CONF_REFRESH_AFTER_APPLY, False),
+        optimistic=config_entry.options.get(CONF_OPTIMISTIC, False),
+        scheduler=scheduler,
+        session=session,
+    )
 
-    # Create device coordinator and fetch data
-    coordinator = MideaDeviceUpdateCoordinator(hass, device)  # type: ignore
-    await coordinator.async_config_entry_first_refresh()
+    # Limit concurrent startups and bound the time spent in each phase
+    async with startup_coordinator.async_startup(device.id) as startup:
+        # Authenticate unless a session can be reused or setup shouldn't wait
+        if session is not None and session.renewal_due and not fast_start:
+            async with startup.async_phase("authenticate"):
+                try:
+                    await session.async_authenticate(device)
+                except AuthenticationError as e:
+                    raise ConfigEntryNotReady(
+                        "Failed to authenticate with device.") from e
+
+        # Query the device capabilities unless cached
+        if capabilities_cached:
+            _LOGGER.info(
+                "Using cached capabilities for device ID %s.", device.id)
+        else:
+            _LOGGER.info(
+                "Querying capabilities for device ID %s.", device.id)
+            async with startup.async_phase("capabilities"):
+                await capability_store.async_update(device, protocol_version)
+
+        # Use restored state or fetch data before creating entities
+        if fast_start:
+            _LOGGER.info(
+                "Using last known state for device ID %s until first refresh.", device.id)
+            coordinator.async_restore_state()
+        else:
+            async with startup.async_phase("refresh"):
+                await coordinator.async_config_entry_first_refresh()
+
+    # Register device with scheduler to stagger polls
+    scheduler.register()
 
     # Store coordinator in global data
     hass.data[DOMAIN][config_entry.entry_id] = coordinator
 
-    # Forward setup to all platforms
-    await hass.config_entries.async_forward_entry_setups(config_entry, _PLATFORMS)
+    # Forward setup only to platforms which will create entities
+    platforms = _get_platforms(device)
+    hass.data[DOMAIN].setdefault(DATA_PLATFORMS, {})[
+        config_entry.entry_id] = platforms
+    _LOGGER.debug("Forwarding setup for device ID %s to platforms %s.",
+                  device.id, [str(p) for p in platforms])
+    await hass.config_entries.async_forward_entry_setups(config_entry, platforms)
+
+    # Save the device state whenever it changes
+    @callback
+    def _async_save_snapshot() -> None:
+        if coordinator.data is not None:
+            snapshot_store.async_save(device, coordinator.data)
 
-    # Reload entry when its updated
     config_entry.async_on_unload(
-        config_entry.add_update_listener(async_reload_entry))
+        coordinator.async_add_listener(_async_save_snapshot))
+
+    # Refresh state and cached capabilities in the background
+    async def _async_background_refresh() -> None:
+        if fast_start:
+            await coordinator.async_refresh()
+
+        # Reload if capabilities changed
+        if capabilities_cached and await coordinator.async_update_capabilities(capability_store, protocol_version):
+            _LOGGER.info(
+                "Capabilities changed for device ID %s. Reloading.", device.id)
+            hass.config_entries.async_schedule_reload(config_entry.entry_id)
+
+    config_entry.async_create_background_task(
+        hass, _async_background_refresh(), f"{DOMAIN} {device.id} refresh")
+
+    # Apply options in place when possible, otherwise reload the entry
+    previous_entry = (dict(config_entry.data), dict(config_entry.options))
+
+    async def _async_entry_updated(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
+        nonlocal previous_entry
+        data, options = previous_entry
+        previous_entry = (dict(config_entry.data), dict(config_entry.options))
+
+        changed = {
+            key for key in options.keys() | config_entry.options.keys()
+            if options.get(key) != config_entry.options.get(key)
+        }
+        if data != config_entry.data or not changed <= _HOT_OPTIONS:
+            await async_reload_entry(hass, config_entry)
+            return
+
+        _LOGGER.info("Applying updated options %s to device ID %s.",
+                     sorted(changed), device.id)
+        _apply_options(hass, config_entry, coordinator)
+
+    config_entry.async_on_unload(
+        config_entry.add_update_listener(_async_entry_updated))
 
     return True
 
 
+def _apply_options(hass: HomeAssistant, config_entry: ConfigEntry, coordinator: MideaDeviceUpdateCoordinator) -> None:
+    """Apply updated options to a running device and its entities."""
+    options = config_entry.options
+    device = coordinator.device
+
+    device.set_max_connection_lifetime(
+        options.get(CONF_MAX_CONNECTION_LIFETIME))
+
+    coordinator.configure(
+        min_update_interval=options.get(
+            CONF_MIN_UPDATE_INTERVAL, MIN_UPDATE_INTERVAL),
+        max_update_interval=options.get(
+            CONF_MAX_UPDATE_INTERVAL, MAX_UPDATE_INTERVAL),
+        refresh_after_apply=options.get(CONF_REFRESH_AFTER_APPLY, False),
+        optimistic=options.get(CONF_OPTIMISTIC, False),
+    )
+
+    # Notify entities of the new options
+    async_dispatcher_send(
+        hass, SIGNAL_OPTIONS_UPDATED.format(device.id), options)
+
+
 async def async_migrate_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
     """Migrate config entry."""
 
@@ -173,6 +371,13 @@ async def async_migrate_entry(hass: HomeAssistant, config_entry: ConfigEntry) ->
     return True
 
 
+async def async_remove_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
+    """Handle removal of a config entry."""
+    # Close any session kept for reloads
+    if (sessions := hass.data.get(DOMAIN, {}).get(DATA_SESSIONS)) is not None:
+        sessions.remove(int(config_entry.data[CONF_ID]))
+
+
 async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     # Remove the coordinator from global data
@@ -180,14 +385,37 @@ async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry) ->
         hass.data[DOMAIN].pop(config_entry.entry_id)
     except KeyError:
         _LOGGER.warning("Failed remove device from global data.")
+    else:
+        hass.data[DOMAIN][DATA_SCHEDULER].unregister()
 
-    # Forward unload to all platforms
-    for platform in _PLATFORMS:
+    # Forward unload to the platforms which were set up
+    platforms = hass.data[DOMAIN].get(
+        DATA_PLATFORMS, {}).pop(config_entry.entry_id, [])
+    for platform in platforms:
         await hass.config_entries.async_forward_entry_unload(config_entry, platform)
 
+    # Remove domain services with the last entry
+    if not hass.config_entries.async_loaded_entries(DOMAIN):
+        async_unload_services(hass)
+
+    # Close the session once unloaded unless a reload set the entry up again
+    if (sessions := hass.data[DOMAIN].get(DATA_SESSIONS)) is not None:
+        hass.async_create_task(_async_release_session(
+            config_entry, sessions, int(config_entry.data[CONF_ID])))
+
     return True
 
 
+async def _async_release_session(config_entry: ConfigEntry,
+                                 sessions: MideaSessionManager,
+                                 device_id: int) -> None:
+    """Close the session of an entry which won't be set up again."""
+    # Reloads hold the setup lock until the entry is set up again
+    async with config_entry.setup_lock:
+        if config_entry.state in (ConfigEntryState.NOT_LOADED, ConfigEntryState.SETUP_ERROR):
+            sessions.remove(device_id)
+
+
 async def async_reload_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
     """Reload a config entry."""
     await hass.config_entries.async_reload(config_entry.entry_id)
@@ -12,6 +12,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN
 from .coordinator import MideaCoordinatorEntity, MideaDeviceUpdateCoordinator
+from .features import get_supported_binary_sensors
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -30,15 +31,16 @@ async def async_setup_entry(
     device = coordinator.device
 
     # Create entities for supported features
+    supported = get_supported_binary_sensors(device)
     entities = []
-    if hasattr(device, "filter_alert") and getattr(device, "supports_filter_reminder", False):
+    if "filter_alert" in supported:
         entities.append(MideaBinarySensor(coordinator,
                                           "filter_alert",
                                           BinarySensorDeviceClass.PROBLEM,
                                           "filter_alert"
                                           ))
 
-    if hasattr(device, "self_clean_active") and getattr(device, "supports_self_clean", False):
+    if "self_clean_active" in supported:
         entities.append(MideaBinarySensor(coordinator,
                                           "self_clean_active",
                                           BinarySensorDeviceClass.RUNNING,
@@ -58,7 +60,7 @@ class MideaBinarySensor(MideaCoordinatorEntity, BinarySensorEntity):
                  translation_key: str | None = None,
                  *,
                  entity_category: EntityCategory = None) -> None:
-        MideaCoordinatorEntity.__init__(self, coordinator)
+        MideaCoordinatorEntity.__init__(self, coordinator, [prop])
 
         self._prop = prop
         self._device_class = device_class
@@ -11,6 +11,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN
 from .coordinator import MideaCoordinatorEntity, MideaDeviceUpdateCoordinator
+from .features import get_supported_buttons
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -30,7 +31,7 @@ async def async_setup_entry(
 
     # Create entities for supported features
     entities = []
-    if hasattr(device, "start_self_clean") and getattr(device, "supports_self_clean", False):
+    if "start_self_clean" in get_supported_buttons(device):
         entities.append(MideaButton(coordinator,
                                     "start_self_clean",
                                     "self_clean",
@@ -48,7 +49,8 @@ class MideaButton(MideaCoordinatorEntity, ButtonEntity):
                  translation_key:  str | None = None,
                  *,
                  entity_category: EntityCategory = None) -> None:
-        MideaCoordinatorEntity.__init__(self, coordinator)
+        # Buttons have no state that depends on device properties
+        MideaCoordinatorEntity.__init__(self, coordinator, [])
 
         self._method = method
         self._entity_category = entity_category
@@ -0,0 +1,120 @@
+"""Persistent device capability cache for Midea Smart AC."""
+
+import logging
+from asyncio import Lock
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+from msmart import __version__ as MSMART_VERSION
+from msmart.device import AirConditioner as AC
+from msmart.device.AC.command import CapabilitiesResponse
+from msmart.device.CC.command import QueryResponse
+
+from .const import DOMAIN, MideaDevice
+
+_LOGGER = logging.getLogger(__name__)
+
+_STORAGE_KEY = f"{DOMAIN}.capabilities"
+_STORAGE_VERSION = 1
+_SAVE_DELAY = 10
+
+
+def _serialize_response(response: CapabilitiesResponse | QueryResponse) -> dict[str, Any]:
+    """Serialize a capabilities response."""
+    if isinstance(response, CapabilitiesResponse):
+        # AC capabilities may be merged from multiple responses
+        return {"raw": dict(response.raw_capabilities)}
+
+    return {"payload": response.payload.hex()}
+
+
+def _restore_response(device: MideaDevice, data: dict[str, Any]) -> CapabilitiesResponse | QueryResponse:
+    """Rebuild a capabilities response from serialized data."""
+    if isinstance(device, AC):
+        response = CapabilitiesResponse.__new__(CapabilitiesResponse)
+        response._capabilities = dict(data["raw"])
+        response._additional_capabilities = False
+        return response
+
+    response = QueryResponse(memoryview(bytes.fromhex(data["payload"])))
+    response.parse_capabilities()
+    return response
+
+
+class MideaCapabilityStore:
+    """Cache device capabilities across restarts."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._store = Store[dict[str, Any]](
+            hass, _STORAGE_VERSION, _STORAGE_KEY)
+        self._load_lock = Lock()
+        self._data: dict[str, Any] | None = None
+
+    async def _async_load(self) -> dict[str, Any]:
+        """Load cached capabilities once for all devices."""
+        async with self._load_lock:
+            if self._data is None:
+                self._data = await self._store.async_load() or {}
+
+        return self._data
+
+    @staticmethod
+    def _get_version(device: MideaDevice, protocol_version: int) -> str:
+        """Get a version string which invalidates the cache when changed."""
+
+        # Device version is unknown until connected so use the configured protocol
+        return f"{device.type}-{protocol_version}-{MSMART_VERSION}"
+
+    async def async_restore(self, device: MideaDevice, protocol_version: int) -> bool:
+        """Restore cached capabilities of a device."""
+
+        data = await self._async_load()
+        entry = data.get(str(device.id))
+        if entry is None or entry.get("version") != self._get_version(device, protocol_version):
+            return False
+
+        try:
+            device._update_capabilities(
+                _restore_response(device, entry["capabilities"]))
+        except (AttributeError, KeyError, ValueError, IndexError, TypeError, AssertionError) as e:
+            _LOGGER.warning(
+                "Failed to restore cached capabilities for device ID %s: %s", device.id, e)
+            return False
+
+        return True
+
+    async def async_update(self, device: MideaDevice, protocol_version: int) -> bool:
+        """Query capabilities from a device and cache them.
+
+        Returns True if the capabilities differ from those previously known.
+        """
+
+        previous = device.capabilities_dict()
+
+        # Capture the response used to update the device
+        responses = []
+        update_capabilities = device._update_capabilities
+
+        def _capture(response: CapabilitiesResponse | QueryResponse) -> None:
+            responses.append(response)
+            update_capabilities(response)
+
+        device._update_capabilities = _capture  # type: ignore[method-assign]
+        try:
+            await device.get_capabilities()
+        finally:
+            del device._update_capabilities
+
+        # Keep any cached capabilities if the query failed
+        if not responses:
+            return False
+
+        data = await self._async_load()
+        data[str(device.id)] = {
+            "version": self._get_version(device, protocol_version),
+            "capabilities": _serialize_response(responses[-1]),
+        }
+        self._store.async_delay_save(lambda: data, _SAVE_DELAY)
+
+        return device.capabilities_dict() != previous
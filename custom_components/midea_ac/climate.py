@@ -7,7 +7,10 @@ from typing import Any, ClassVar, Generic, Mapping, Sequence
 
 import voluptuous as vol
 from homeassistant.components.climate import ClimateEntity
-from homeassistant.components.climate.const import (ATTR_HVAC_MODE,
+from homeassistant.components.climate.const import (ATTR_FAN_MODE,
+                                                    ATTR_HVAC_MODE,
+                                                    ATTR_PRESET_MODE,
+                                                    ATTR_SWING_MODE,
                                                     PRESET_AWAY, PRESET_BOOST,
                                                     PRESET_ECO, PRESET_NONE,
                                                     PRESET_SLEEP,
@@ -16,7 +19,8 @@ from homeassistant.components.climate.const import (ATTR_HVAC_MODE,
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (ATTR_TEMPERATURE, CONF_ENABLED,
                                  UnitOfTemperature)
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import ServiceValidationError
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers import entity_platform
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
@@ -33,6 +37,17 @@ from .coordinator import MideaCoordinatorEntity, MideaDeviceUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+# Fields of the set_state service shared with the group_set_state service
+SET_STATE_FIELDS = {
+    vol.Optional(ATTR_HVAC_MODE): vol.Coerce(HVACMode),
+    vol.Optional(ATTR_TEMPERATURE): vol.Coerce(float),
+    vol.Optional(ATTR_FAN_MODE): cv.string,
+    vol.Optional(ATTR_SWING_MODE): cv.string,
+    vol.Optional(ATTR_PRESET_MODE): cv.string,
+}
+SET_STATE_ATTRS = (ATTR_HVAC_MODE, ATTR_TEMPERATURE, ATTR_FAN_MODE,
+                   ATTR_SWING_MODE, ATTR_PRESET_MODE)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -47,13 +62,23 @@ async def async_setup_entry(
     coordinator = hass.data[DOMAIN][config_entry.entry_id]
     device = coordinator.device
 
+    # Add a service to set multiple properties in a single write
+    platform = entity_platform.async_get_current_platform()
+    platform.async_register_entity_service(
+        "set_state",
+        vol.All(
+            cv.make_entity_service_schema(SET_STATE_FIELDS),
+            cv.has_at_least_one_key(*SET_STATE_ATTRS),
+        ),
+        "async_set_state",
+    )
+
     entities = []
     if device.type == DeviceType.AIR_CONDITIONER:
         entities.append(
             MideaClimateACDevice(hass, coordinator, config_entry.options))
 
         # Add a service to control 'follow me' function
-        platform = entity_platform.async_get_current_platform()
         platform.async_register_entity_service(
             "set_follow_me",
             {
@@ -89,13 +114,34 @@ class MideaClimateDevice(MideaCoordinatorEntity[MideaDevice], ClimateEntity, Gen
     _OPERATIONAL_MODE_TO_HVAC_MODE: ClassVar[Mapping[Any, HVACMode]]
     _HVAC_MODE_TO_OPERATIONAL_MODE: ClassVar[Mapping[HVACMode, Any]]
 
+    # Device properties reflected in the climate entity state
+    _DEVICE_PROPERTIES: ClassVar[Sequence[str]] = [
+        "power_state",
+        "operational_mode",
+        "target_temperature",
+        "indoor_temperature",
+        "target_humidity",
+        "indoor_humidity",
+        "fan_speed",
+        "swing_mode",
+        "eco",
+        "ieco",
+        "turbo",
+        "freeze_protection",
+        "silent",
+        "sleep",
+        "follow_me",
+        "error_code",
+    ]
+
     def __init__(self,
                  hass: HomeAssistant,
                  coordinator: MideaDeviceUpdateCoordinator[MideaDevice],
                  config: ClimateConfig
                  ) -> None:
         """Initialize the climate device."""
-        MideaCoordinatorEntity.__init__(self, coordinator)
+        MideaCoordinatorEntity.__init__(
+            self, coordinator, self._DEVICE_PROPERTIES)
 
         self.hass = hass
 
@@ -155,6 +201,12 @@ class MideaClimateDevice(MideaCoordinatorEntity[MideaDevice], ClimateEntity, Gen
         _LOGGER.debug("Target temperature step: %f, min: %f, max: %f.",
                       self._target_temperature_step, self._min_temperature, self._max_temperature)
 
+    @callback
+    def _async_options_updated(self, options: Mapping[str, Any]) -> None:
+        """Apply updated options to the entity."""
+        self._target_temperature_step = options.get(CONF_TEMP_STEP, 1.0)
+        self.async_write_ha_state()
+
     async def _apply(self) -> None:
         """Apply changes to the device."""
         # Apply via the coordinator
@@ -229,10 +281,12 @@ class MideaClimateDevice(MideaCoordinatorEntity[MideaDevice], ClimateEntity, Gen
 
         # Round temperature to nearest .5
         self._device.target_temperature = round(temperature * 2) / 2
-        await self._apply()
 
+        # Include HVAC mode in the same write if provided
         if (mode := kwargs.get(ATTR_HVAC_MODE, None)) is not None:
-            await self.async_set_hvac_mode(mode)
+            self._set_hvac_mode(mode)
+
+        await self._apply()
 
     @property
     def current_humidity(self) -> float | None:
@@ -259,11 +313,14 @@ class MideaClimateDevice(MideaCoordinatorEntity[MideaDevice], ClimateEntity, Gen
         """Return the current swing mode."""
         return self._device.swing_mode.name.lower()
 
-    async def async_set_swing_mode(self, swing_mode: str) -> None:
-        """Set the swing mode."""
+    def _set_swing_mode(self, swing_mode: str) -> None:
+        """Update the device with a new swing mode without applying it."""
         self._device.swing_mode = self._device_class.SwingMode.get_from_name(
             swing_mode.upper(), self._device.swing_mode)
 
+    async def async_set_swing_mode(self, swing_mode: str) -> None:
+        """Set the swing mode."""
+        self._set_swing_mode(swing_mode)
         await self._apply()
 
     @property
@@ -276,11 +333,14 @@ class MideaClimateDevice(MideaCoordinatorEntity[MideaDevice], ClimateEntity, Gen
         """Return the current fan speed mode."""
         return self._device.fan_speed.name.lower()
 
-    async def async_set_fan_mode(self, fan_mode: str) -> None:
-        """Set the fan mode."""
-
+    def _set_fan_mode(self, fan_mode: str) -> None:
+        """Update the device with a new fan mode without applying it."""
         self._device.fan_speed = self._device_class.FanSpeed.get_from_name(
             fan_mode.upper())
+
+    async def async_set_fan_mode(self, fan_mode: str) -> None:
+        """Set the fan mode."""
+        self._set_fan_mode(fan_mode)
         await self._apply()
 
     @property
@@ -296,8 +356,8 @@ class MideaClimateDevice(MideaCoordinatorEntity[MideaDevice], ClimateEntity, Gen
 
         return self._OPERATIONAL_MODE_TO_HVAC_MODE.get(self._device.operational_mode, HVACMode.OFF)
 
-    async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
-        """Set the HVAC mode."""
+    def _set_hvac_mode(self, hvac_mode: HVACMode) -> None:
+        """Update the device with a new HVAC mode without applying it."""
         if hvac_mode == HVACMode.OFF:
             self._device.power_state = False
         else:
@@ -308,6 +368,9 @@ class MideaClimateDevice(MideaCoordinatorEntity[MideaDevice], ClimateEntity, Gen
 
             self._device.operational_mode = mode
 
+    async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
+        """Set the HVAC mode."""
+        self._set_hvac_mode(hvac_mode)
         await self._apply()
 
     @property
@@ -320,10 +383,74 @@ class MideaClimateDevice(MideaCoordinatorEntity[MideaDevice], ClimateEntity, Gen
         """Get the current preset mode."""
         raise NotImplementedError("Derived class must implement preset_mode.")
 
+    def _set_preset_mode(self, preset_mode: str) -> None:
+        """Update the device with a new preset mode without applying it."""
+        raise NotImplementedError(
+            "Derived class must implement _set_preset_mode.")
+
     async def async_set_preset_mode(self, preset_mode: str) -> None:
         """Set the preset mode."""
-        raise NotImplementedError(
-            "Derived class must implement async_set_preset_mode.")
+        self._set_preset_mode(preset_mode)
+        await self._apply()
+
+    def _validate_option(self, field: str, value: str, options: Sequence[str]) -> None:
+        """Raise a validation error if a value isn't a supported option."""
+        if value not in options:
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="invalid_option",
+                translation_placeholders={
+                    "field": field,
+                    "value": value,
+                    "options": ", ".join(options),
+                },
+            )
+
+    async def async_set_state(self,
+                              hvac_mode: HVACMode | None = None,
+                              temperature: float | None = None,
+                              fan_mode: str | None = None,
+                              swing_mode: str | None = None,
+                              preset_mode: str | None = None,
+                              ) -> None:
+        """Set multiple properties and apply them in a single write."""
+
+        # Validate all values before changing the device
+        if hvac_mode is not None:
+            self._validate_option(ATTR_HVAC_MODE, hvac_mode, self.hvac_modes)
+        if fan_mode is not None:
+            self._validate_option(ATTR_FAN_MODE, fan_mode, self.fan_modes)
+        if swing_mode is not None:
+            self._validate_option(
+                ATTR_SWING_MODE, swing_mode, self.swing_modes)
+        if preset_mode is not None:
+            self._validate_option(
+                ATTR_PRESET_MODE, preset_mode, self._preset_modes)
+
+        if temperature is not None and not self.min_temp <= temperature <= self.max_temp:
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="temperature_out_of_range",
+                translation_placeholders={
+                    "temperature": str(temperature),
+                    "min_temp": str(self.min_temp),
+                    "max_temp": str(self.max_temp),
+                },
+            )
+
+        if hvac_mode is not None:
+            self._set_hvac_mode(hvac_mode)
+        if temperature is not None:
+            # Round temperature to nearest .5
+            self._device.target_temperature = round(temperature * 2) / 2
+        if fan_mode is not None:
+            self._set_fan_mode(fan_mode)
+        if swing_mode is not None:
+            self._set_swing_mode(swing_mode)
+        if preset_mode is not None:
+            self._set_preset_mode(preset_mode)
+
+        await self._apply()
 
     async def async_turn_off(self) -> None:
         """Turn the device off."""
@@ -416,15 +543,16 @@ class MideaClimateACDevice(MideaClimateDevice[AC]):
                 _LOGGER.info("Adding additional mode '%s'.", mode)
                 self._hvac_modes.append(mode)
 
+    @callback
+    def _async_options_updated(self, options: Mapping[str, Any]) -> None:
+        """Apply updated options to the entity."""
+        self._device.beep = options.get(CONF_BEEP, False)
+        super()._async_options_updated(options)
+
     @property
     def assumed_state(self) -> bool:
         """Assume state rather than refresh to workaround fan_only bug."""
-        return self._use_fan_only_workaround
-
-    @property
-    def should_poll(self) -> bool:
-        """Poll the appliance for changes, there is no notification capability in the Midea API"""
-        return not self._use_fan_only_workaround
+        return self._use_fan_only_workaround or super().assumed_state
 
     @property
     def extra_state_attributes(self) -> dict[str, str]:
@@ -483,6 +611,15 @@ class MideaClimateACDevice(MideaClimateDevice[AC]):
         # Never expect to get here
         assert False, "fan_mode is neither int or AC.FanSpeed"
 
+    def _set_fan_mode(self, fan_mode: str) -> None:
+        """Update the device with a new fan mode without applying it."""
+
+        # Don't override custom fan speeds
+        if fan_mode == self._FAN_CUSTOM:
+            return
+
+        self._device.fan_speed = AC.FanSpeed.get_from_name(fan_mode.upper())
+
     async def async_set_fan_mode(self, fan_mode: str) -> None:
         """Set the fan mode."""
 
@@ -490,7 +627,7 @@ class MideaClimateACDevice(MideaClimateDevice[AC]):
         if fan_mode == self._FAN_CUSTOM:
             return
 
-        self._device.fan_speed = AC.FanSpeed.get_from_name(fan_mode.upper())
+        self._set_fan_mode(fan_mode)
         await self._apply()
 
     @property
@@ -506,8 +643,8 @@ class MideaClimateACDevice(MideaClimateDevice[AC]):
 
         return self._OPERATIONAL_MODE_TO_HVAC_MODE.get(mode, HVACMode.OFF)
 
-    async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
-        """Set the HVAC mode."""
+    def _set_hvac_mode(self, hvac_mode: HVACMode) -> None:
+        """Update the device with a new HVAC mode without applying it."""
         if hvac_mode == HVACMode.OFF:
             self._device.power_state = False
         else:
@@ -521,8 +658,6 @@ class MideaClimateACDevice(MideaClimateDevice[AC]):
 
             self._device.operational_mode = mode
 
-        await self._apply()
-
     @property
     def preset_modes(self) -> list[str]:
         """Return the supported preset modes for the current operation mode."""
@@ -571,8 +706,8 @@ class MideaClimateACDevice(MideaClimateDevice[AC]):
         else:
             return PRESET_NONE
 
-    async def async_set_preset_mode(self, preset_mode: str) -> None:
-        """Set the preset mode."""
+    def _set_preset_mode(self, preset_mode: str) -> None:
+        """Update the device with a new preset mode without applying it."""
         self._device.eco = preset_mode == PRESET_ECO
         self._device.turbo = preset_mode == PRESET_BOOST
         self._device.freeze_protection = preset_mode == PRESET_AWAY
@@ -582,8 +717,6 @@ class MideaClimateACDevice(MideaClimateDevice[AC]):
         if self._device.supports_ieco:
             self._device.ieco = preset_mode == PRESET_IECO
 
-        await self._apply()
-
 
 class MideaClimateCCDevice(MideaClimateDevice[CC]):
     """Climate entity for Midea CC device."""
@@ -658,11 +791,9 @@ class MideaClimateCCDevice(MideaClimateDevice[CC]):
         else:
             return PRESET_NONE
 
-    async def async_set_preset_mode(self, preset_mode: str) -> None:
-        """Set the preset mode."""
+    def _set_preset_mode(self, preset_mode: str) -> None:
+        """Update the device with a new preset mode without applying it."""
         # Enable proper mode
         self._device.eco = preset_mode == PRESET_ECO
         self._device.silent = preset_mode == PRESET_SILENT
         self._device.sleep = preset_mode == PRESET_SLEEP
-
-        await self._apply()
@@ -9,7 +9,8 @@ import voluptuous as vol
 from homeassistant.config_entries import (ConfigEntry, ConfigFlow,
                                           ConfigFlowResult, OptionsFlow)
 from homeassistant.const import (CONF_COUNTRY_CODE, CONF_HOST, CONF_ID,
-                                 CONF_PORT, CONF_TOKEN, DEGREE)
+                                 CONF_PORT, CONF_SCAN_INTERVAL, CONF_TOKEN,
+                                 DEGREE, PERCENTAGE, UnitOfPower, UnitOfTime)
 from homeassistant.core import callback
 from homeassistant.data_entry_flow import section
 from homeassistant.helpers import httpx_client
@@ -33,11 +34,17 @@ from .const import (CONF_ADDITIONAL_OPERATION_MODES, CONF_BEEP,
                     CONF_CLOUD_COUNTRY_CODES, CONF_DEFAULT_CLOUD_COUNTRY,
                     CONF_DEVICE_TYPE, CONF_ENERGY_DATA_FORMAT,
                     CONF_ENERGY_DATA_SCALE, CONF_ENERGY_SENSOR,
-                    CONF_FAN_SPEED_STEP, CONF_KEY,
-                    CONF_MAX_CONNECTION_LIFETIME, CONF_POWER_SENSOR,
+                    CONF_FAN_SPEED_STEP, CONF_FAST_START,
+                    CONF_HUMIDITY_DEADBAND, CONF_KEY,
+                    CONF_MAX_CONNECTION_LIFETIME, CONF_MAX_QUIET_TIME,
+                    CONF_MAX_UPDATE_INTERVAL, CONF_MIN_PUBLISH_INTERVAL,
+                    CONF_MIN_UPDATE_INTERVAL, CONF_NUMBER_DEBOUNCE_WINDOW,
+                    CONF_OPTIMISTIC, CONF_POWER_DEADBAND, CONF_POWER_SENSOR,
+                    CONF_REFRESH_AFTER_APPLY, CONF_SENSOR_FILTER,
                     CONF_SHOW_ALL_PRESETS, CONF_SWING_ANGLE_RTL,
-                    CONF_TEMP_STEP, CONF_USE_FAN_ONLY_WORKAROUND,
-                    CONF_WORKAROUNDS, DOMAIN, UPDATE_INTERVAL, EnergyFormat)
+                    CONF_TEMP_STEP, CONF_TEMPERATURE_DEADBAND,
+                    CONF_USE_FAN_ONLY_WORKAROUND, CONF_WORKAROUNDS, DOMAIN,
+                    UPDATE_INTERVAL, EnergyFormat)
 
 _DEFAULT_OPTIONS = {
     CONF_TEMP_STEP: 1.0,
@@ -444,6 +451,46 @@ class MideaConfigFlow(ConfigFlow, domain=DOMAIN):
 class MideaOptionsFlow(OptionsFlow):
     """Options flow from Midea Smart AC."""
 
+    _SENSOR_FILTER_SCHEMA = section(
+        vol.Schema(
+            {
+                vol.Optional(CONF_TEMPERATURE_DEADBAND): NumberSelector(
+                    NumberSelectorConfig(
+                        min=0,
+                        max=5,
+                        step=.1,
+                        unit_of_measurement=DEGREE
+                    )
+                ),
+                vol.Optional(CONF_HUMIDITY_DEADBAND): NumberSelector(
+                    NumberSelectorConfig(
+                        min=0,
+                        max=20,
+                        step=1,
+                        unit_of_measurement=PERCENTAGE
+                    )
+                ),
+                vol.Optional(CONF_POWER_DEADBAND): NumberSelector(
+                    NumberSelectorConfig(
+                        min=0,
+                        step="any",
+                        mode=NumberSelectorMode.BOX,
+                        unit_of_measurement=UnitOfPower.WATT
+                    )
+                ),
+                vol.Optional(CONF_MIN_PUBLISH_INTERVAL): vol.All(
+                    vol.Coerce(float),
+                    vol.Range(min=0)
+                ),
+                vol.Optional(CONF_MAX_QUIET_TIME): vol.All(
+                    vol.Coerce(int),
+                    vol.Range(min=0)
+                ),
+            }
+        ),
+        {"collapsed": True}
+    )
+
     _BASE_SCHEMA = vol.Schema(
         {
             vol.Optional(CONF_SWING_ANGLE_RTL): cv.boolean,
@@ -459,6 +506,18 @@ class MideaOptionsFlow(OptionsFlow):
                 vol.Coerce(int),
                 vol.Range(min=UPDATE_INTERVAL)
             ),
+            vol.Optional(CONF_MIN_UPDATE_INTERVAL): vol.All(
+                vol.Coerce(int),
+                vol.Range(min=1)
+            ),
+            vol.Optional(CONF_MAX_UPDATE_INTERVAL): vol.All(
+                vol.Coerce(int),
+                vol.Range(min=1)
+            ),
+            vol.Optional(CONF_REFRESH_AFTER_APPLY): cv.boolean,
+            vol.Optional(CONF_OPTIMISTIC): cv.boolean,
+            vol.Optional(CONF_FAST_START): cv.boolean,
+            vol.Optional(CONF_SENSOR_FILTER): _SENSOR_FILTER_SCHEMA,
         }
     )
 
@@ -477,6 +536,10 @@ class MideaOptionsFlow(OptionsFlow):
                     NumberSelectorConfig(
                         min=.001, step="any", mode=NumberSelectorMode.BOX)
                 ),
+                vol.Optional(CONF_SCAN_INTERVAL): vol.All(
+                    vol.Coerce(int),
+                    vol.Range(min=UPDATE_INTERVAL)
+                ),
             }
         ),
         {"collapsed": True}
@@ -488,6 +551,14 @@ class MideaOptionsFlow(OptionsFlow):
             vol.Optional(CONF_FAN_SPEED_STEP): NumberSelector(
                 NumberSelectorConfig(min=1, max=20, step=1)
             ),
+            vol.Optional(CONF_NUMBER_DEBOUNCE_WINDOW): NumberSelector(
+                NumberSelectorConfig(
+                    min=0,
+                    max=5,
+                    step=.1,
+                    unit_of_measurement=UnitOfTime.SECONDS
+                )
+            ),
             vol.Optional(CONF_ENERGY_SENSOR): _ENERGY_SENSOR_SCHEMA,
             vol.Optional(CONF_POWER_SENSOR): _ENERGY_SENSOR_SCHEMA,
             vol.Optional(CONF_WORKAROUNDS): section(
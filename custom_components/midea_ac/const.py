@@ -6,11 +6,45 @@ from msmart.device import CommercialAirConditioner as CC
 
 DOMAIN = "midea_ac"
 UPDATE_INTERVAL = 15
+MIN_UPDATE_INTERVAL = 5
+MAX_UPDATE_INTERVAL = 60
+FAST_UPDATE_WINDOW = 30
+APPLY_COALESCE_WINDOW = 0.1
+NUMBER_DEBOUNCE_WINDOW = 0.5
+ENERGY_UPDATE_INTERVAL = 300
+POWER_UPDATE_INTERVAL = 60
+SENSOR_MAX_QUIET_TIME = 900
+MAX_CONCURRENT_REQUESTS = 8
+OFFLINE_FAILURE_THRESHOLD = 3
+OFFLINE_BACKOFF_MAX = 300
+REACHABILITY_TIMEOUT = 2
+SESSION_RENEWAL_FRACTION = 0.9
+SESSION_EXPIRATION = 43200
+OPTIMISTIC_CONFIRM_TIMEOUT = 10
+MAX_CONCURRENT_STARTUPS = 4
+STARTUP_PHASE_TIMEOUT = 30
+GROUP_MAX_CONCURRENCY = 4
+GROUP_COMMAND_TIMEOUT = 15
+GROUP_COMMAND_RETRIES = 1
+
+DATA_SCHEDULER = "scheduler"
+DATA_CAPABILITY_STORE = "capability_store"
+DATA_SNAPSHOT_STORE = "snapshot_store"
+DATA_SESSIONS = "sessions"
+DATA_PLATFORMS = "platforms"
+DATA_STARTUP = "startup"
+
+SIGNAL_OPTIONS_UPDATED = f"{DOMAIN}_options_updated_{{}}"
+
+ATTR_MAX_CONCURRENCY = "max_concurrency"
+ATTR_TIMEOUT = "timeout"
+ATTR_RETRIES = "retries"
 
 CONF_KEY = "k1"
 CONF_BEEP = "prompt_tone"
 CONF_TEMP_STEP = "temp_step"
 CONF_FAN_SPEED_STEP = "fan_speed_step"
+CONF_NUMBER_DEBOUNCE_WINDOW = "number_debounce_window"
 CONF_WORKAROUNDS = "workarounds"
 CONF_USE_FAN_ONLY_WORKAROUND = "use_fan_only_workaround"
 CONF_ADDITIONAL_OPERATION_MODES = "additional_operation_modes"
@@ -18,12 +52,24 @@ CONF_SHOW_ALL_PRESETS = "show_all_presets"
 CONF_MAX_CONNECTION_LIFETIME = "max_connection_lifetime"
 CONF_ENERGY_SENSOR = "energy_sensor"
 CONF_POWER_SENSOR = "power_sensor"
+CONF_SENSOR_FILTER = "sensor_filter"
+CONF_TEMPERATURE_DEADBAND = "temperature_deadband"
+CONF_HUMIDITY_DEADBAND = "humidity_deadband"
+CONF_POWER_DEADBAND = "power_deadband"
+CONF_MIN_PUBLISH_INTERVAL = "min_publish_interval"
+CONF_MAX_QUIET_TIME = "max_quiet_time"
 CONF_ENERGY_DATA_FORMAT = "energy_data_format"
 CONF_ENERGY_DATA_SCALE = "energy_data_scale"
 CONF_CLOUD_COUNTRY_CODES = ["DE", "KR", "US"]
 CONF_DEFAULT_CLOUD_COUNTRY = "US"
 CONF_SWING_ANGLE_RTL = "swing_angle_rtl"
 CONF_DEVICE_TYPE = "device_type"
+CONF_MIN_UPDATE_INTERVAL = "min_update_interval"
+CONF_MAX_UPDATE_INTERVAL = "max_update_interval"
+CONF_REFRESH_AFTER_APPLY = "refresh_after_apply"
+CONF_OPTIMISTIC = "optimistic"
+CONF_FAST_START = "fast_start"
+CONF_MAX_CONCURRENT_STARTUPS = "max_concurrent_startups"
 
 PRESET_IECO = "ieco"
 PRESET_SILENT = "silent"
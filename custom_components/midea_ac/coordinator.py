@@ -2,15 +2,28 @@
 
 import datetime
 import logging
-from asyncio import Lock
-from typing import Generic
+import time
+from asyncio import Task, open_connection, shield, sleep, timeout, wait_for
+from typing import Any, Generic, Iterable, Mapping
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.update_coordinator import (CoordinatorEntity,
                                                       DataUpdateCoordinator)
+from msmart.lan import AuthenticationError
 
-from .const import DOMAIN, UPDATE_INTERVAL, MideaDevice
+from .capabilities import MideaCapabilityStore
+from .const import (APPLY_COALESCE_WINDOW, DOMAIN, FAST_UPDATE_WINDOW,
+                    MAX_UPDATE_INTERVAL, MIN_UPDATE_INTERVAL,
+                    OFFLINE_BACKOFF_MAX, OFFLINE_FAILURE_THRESHOLD,
+                    OPTIMISTIC_CONFIRM_TIMEOUT, REACHABILITY_TIMEOUT,
+                    SIGNAL_OPTIONS_UPDATED, UPDATE_INTERVAL, MideaDevice)
+from .metrics import OperationMetrics
+from .properties import discard_updates, is_writable, set_properties
+from .scheduler import MideaDeviceLock, MideaRequestScheduler
+from .session import MideaSession
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -18,12 +31,76 @@ _LOGGER = logging.getLogger(__name__)
 class MideaDeviceUpdateCoordinator(DataUpdateCoordinator,  Generic[MideaDevice]):
     """Device update coordinator for Midea Smart AC."""
 
-    def __init__(self, hass: HomeAssistant, device: MideaDevice) -> None:
+    # Properties which indicate the device is actively changing
+    _ACTIVITY_PROPERTIES = [
+        "power_state",
+        "operational_mode",
+        "target_temperature",
+        "fan_speed",
+        "swing_mode",
+    ]
+
+    # Device properties which are reflected in entity state
+    _STATE_PROPERTIES = [
+        "online",
+        "power_state",
+        "operational_mode",
+        "target_temperature",
+        "indoor_temperature",
+        "outdoor_temperature",
+        "target_humidity",
+        "indoor_humidity",
+        "fan_speed",
+        "swing_mode",
+        "horizontal_swing_angle",
+        "vertical_swing_angle",
+        "cascade_mode",
+        "eco",
+        "ieco",
+        "turbo",
+        "silent",
+        "sleep",
+        "freeze_protection",
+        "follow_me",
+        "purifier",
+        "display_on",
+        "fahrenheit",
+        "filter_alert",
+        "self_clean_active",
+        "breeze_away",
+        "breeze_mild",
+        "breezeless",
+        "flash_cool",
+        "rate_select",
+        "aux_mode",
+        "error_code",
+    ]
+
+    # Energy properties which are reported in multiple data formats
+    _ENERGY_PROPERTIES = [
+        "total_energy_usage",
+        "current_energy_usage",
+        "real_time_power_usage",
+    ]
+
+    def __init__(self,
+                 hass: HomeAssistant,
+                 device: MideaDevice,
+                 *,
+                 min_update_interval: float = MIN_UPDATE_INTERVAL,
+                 max_update_interval: float = MAX_UPDATE_INTERVAL,
+                 refresh_after_apply: bool = False,
+                 optimistic: bool = False,
+                 scheduler: MideaRequestScheduler | None = None,
+                 session: MideaSession | None = None,
+                 ) -> None:
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
             update_interval=datetime.timedelta(seconds=UPDATE_INTERVAL),
+            # Only notify listeners when the state snapshot changes
+            always_update=False,
             request_refresh_debouncer=Debouncer(
                 hass,
                 _LOGGER,
@@ -32,63 +109,588 @@ class MideaDeviceUpdateCoordinator(DataUpdateCoordinator,  Generic[MideaDevice])
             )
         )
 
-        self._lock = Lock()
+        self._lock = MideaDeviceLock()
         self._device: MideaDevice = device
-        self._energy_sensors = 0
+        self._scheduler = scheduler or MideaRequestScheduler()
+
+        # Authenticated session of a V3 device
+        self._session = session
+        self._restored = False
+
+        # Energy request state
+        self._energy_update_intervals: list[float] = []
+        self._next_energy_update = 0.0
+        self._energy_updated = False
+
+        # Adaptive update interval state
+        self._min_update_interval = min_update_interval
+        self._max_update_interval = max(
+            min_update_interval, max_update_interval)
+        self._fast_update_deadline = 0.0
+        self._activity_state: dict[str, Any] | None = None
+
+        # Write coalescing state
+        self._apply_task: Task | None = None
+        self._last_apply_task: Task | None = None
+        self._apply_count = 0
+        self._coalesced_apply_count = 0
+
+        # Post-apply refresh state
+        self._refresh_after_apply = refresh_after_apply
+        self._skipped_refresh_count = 0
+        self._suppressed_apply_count = 0
+        self._pending_changes: dict[str, Any] = {}
+        self._preempted_poll_count = 0
+
+        # Optimistic update state
+        self._optimistic = optimistic
+        self._confirmed_data: dict[str, Any] | None = None
+        self._optimistic_count = 0
+        self._rollback_count = 0
+
+        # Offline backoff state
+        self._failure_count = 0
+        self._backoff_interval: float | None = None
+        self._probe_count = 0
+        self._failed_probe_count = 0
+
+        # Latency metrics
+        self._refresh_metrics = OperationMetrics()
+        self._apply_metrics = OperationMetrics()
+
+        # Change detection state
+        self._unchanged_update_count = 0
+        self._notified_data: dict[str, Any] | None = None
+        self._notified_success = True
+
+    def _get_activity_state(self) -> dict[str, Any]:
+        """Get the current state of properties that indicate activity."""
+        return {
+            prop: getattr(self._device, prop, None)
+            for prop in self._ACTIVITY_PROPERTIES
+        }
+
+    def _get_state_snapshot(self) -> dict[str, Any]:
+        """Get a snapshot of the device properties reflected in entity state."""
+        snapshot = {
+            prop: getattr(self._device, prop, None)
+            for prop in self._STATE_PROPERTIES
+        }
 
-    async def _async_update_data(self) -> None:
+        # Capture energy properties in every format since sensors may use any
+        if hasattr(self._device, "enable_energy_usage_requests"):
+            formats = type(self._device).EnergyDataFormat
+            for prop in self._ENERGY_PROPERTIES:
+                get_method = getattr(self._device, f"get_{prop}")
+                snapshot[prop] = tuple(get_method(f) for f in formats)
+
+        return snapshot
+
+    def _start_fast_updates(self) -> None:
+        """Poll at the minimum interval for a short window."""
+        self._fast_update_deadline = time.monotonic() + FAST_UPDATE_WINDOW
+        self.update_interval = datetime.timedelta(
+            seconds=self._min_update_interval)
+
+    def _adjust_update_interval(self) -> None:
+        """Adjust the update interval based on recent device activity."""
+
+        # Poll quickly after any change in device activity
+        activity_state = self._get_activity_state()
+        if self._activity_state is not None and activity_state != self._activity_state:
+            self._start_fast_updates()
+        self._activity_state = activity_state
+
+        # Remain at the minimum interval during the fast window
+        if time.monotonic() < self._fast_update_deadline:
+            return
+
+        # Otherwise back off toward the maximum interval
+        interval = (self.update_interval or datetime.timedelta(
+            seconds=UPDATE_INTERVAL)).total_seconds()
+        interval = max(self._min_update_interval,
+                       min(interval * 2, self._max_update_interval))
+        self.update_interval = datetime.timedelta(seconds=interval)
+
+    def _update_energy_requests(self) -> bool:
+        """Enable energy requests if they're due on the next refresh."""
+
+        if not hasattr(self._device, "enable_energy_usage_requests"):
+            return False
+
+        # Request energy if sensors are active and the interval has elapsed
+        request = (len(self._energy_update_intervals) > 0
+                   and time.monotonic() >= self._next_energy_update)
+
+        # Skip energy requests while powered off once an initial value is known
+        if self._energy_updated and not self._device.power_state:
+            request = False
+
+        self._device.enable_energy_usage_requests = request
+        return request
+
+    @property
+    def _backoff_active(self) -> bool:
+        """Check if the device has failed enough to back off polling."""
+        return self._failure_count >= OFFLINE_FAILURE_THRESHOLD
+
+    def _update_backoff(self) -> None:
+        """Track consecutive failures and back off polling of an offline device."""
+
+        # Reset on the first successful response
+        if self._device.online:
+            if self._backoff_active:
+                _LOGGER.info(
+                    "Device ID %s is reachable again. Resuming normal updates.", self._device.id)
+            self._failure_count = 0
+            self._backoff_interval = None
+            return
+
+        self._failure_count += 1
+        if not self._backoff_active:
+            return
+
+        # Double the probe interval up to the cap
+        if self._backoff_interval is None:
+            self._backoff_interval = self._max_update_interval
+            _LOGGER.info("Device ID %s failed %d consecutive updates. Backing off.",
+                         self._device.id, self._failure_count)
+        else:
+            self._backoff_interval = min(
+                self._backoff_interval * 2, OFFLINE_BACKOFF_MAX)
+
+        self.update_interval = datetime.timedelta(
+            seconds=self._backoff_interval)
+
+    async def _async_check_reachable(self) -> bool:
+        """Check if the device accepts connections without a full refresh."""
+        try:
+            _, writer = await wait_for(
+                open_connection(self._device.ip, self._device.port), REACHABILITY_TIMEOUT)
+        except (OSError, TimeoutError):
+            return False
+
+        writer.close()
+        return True
+
+    async def _handle_refresh_interval(self, _now: datetime.datetime | None = None) -> None:
+        """Handle a scheduled refresh after staggering it with other devices."""
+        await self._scheduler.async_wait_for_poll(
+            self.update_interval.total_seconds())
+
+        # Cancel any refresh scheduled while waiting so its timer isn't orphaned
+        self._async_unsub_refresh()
+        await super()._handle_refresh_interval(_now)
+
+    async def _async_update_data(self) -> dict[str, Any]:
         """Update the device data."""
-        async with self._lock:
-            await self._device.refresh()
 
-    async def apply(self) -> None:
-        """Apply changes to the device and update HA state."""
+        # Probe an offline device without holding the lock so commands aren't delayed
+        if self._backoff_active:
+            self._probe_count += 1
+            if not await self._async_check_reachable():
+                self._failed_probe_count += 1
+                self._update_backoff()
+                return self._get_state_snapshot()
+
+        # Skip polls while a write is pending so its changes aren't overwritten
+        if self._apply_task is not None and self.data is not None:
+            self._preempted_poll_count += 1
+            return self.data
+
+        start = time.monotonic()
+        async with self._lock.async_poll() as preempted:
+            # Use the state from a command issued while waiting
+            if preempted:
+                self._preempted_poll_count += 1
+                return self._get_state_snapshot()
+
+            async with self._scheduler.async_request():
+                acquired = time.monotonic()
+
+                # Renew V3 sessions during polls so commands don't wait on a handshake
+                if self._session is not None and self._session.renewal_due:
+                    try:
+                        await self._session.async_authenticate(self._device)
+                    except AuthenticationError as e:
+                        _LOGGER.warning(
+                            "Failed to authenticate with device ID %s: %s", self._device.id, e)
+
+                request_energy = self._update_energy_requests()
+                try:
+                    await self._device.refresh()
+                except Exception:
+                    self._refresh_metrics.record(
+                        acquired - start, time.monotonic() - acquired, error=True)
+                    raise
+                finally:
+                    # Restored state is replaced once the device is queried
+                    restored, self._restored = self._restored, False
+
+        self._refresh_metrics.record(
+            acquired - start, time.monotonic() - acquired, error=not self._device.online)
+
+        # Schedule the next energy request at the fastest sensor interval
+        if request_energy and self._device.online:
+            self._energy_updated = True
+            self._next_energy_update = time.monotonic() + \
+                min(self._energy_update_intervals)
+
+        self._adjust_update_interval()
+        self._update_backoff()
+
+        # Listeners are only notified if the snapshot changed
+        snapshot = self._confirmed_data = self._get_state_snapshot()
+        if snapshot == self.data:
+            self._unchanged_update_count += 1
+
+            # Entities showing restored state still need to be updated
+            if restored:
+                super().async_update_listeners()
+
+        return snapshot
+
+    async def _async_apply(self) -> None:
+        """Apply all changes made during the coalescing window."""
+
+        # Allow other changes to accumulate before writing
+        await sleep(APPLY_COALESCE_WINDOW)
+
+        # Later changes must start a new write
+        self._apply_task = None
+        self._apply_count += 1
+        pending, self._pending_changes = self._pending_changes, {}
 
         # Apply changes to device
-        async with self._lock:
-            await self._device.apply()
+        start = time.monotonic()
+        async with self._lock.async_command(), self._scheduler.async_request():
+            acquired = time.monotonic()
+
+            # Restore requested values overwritten by a poll which was in progress
+            set_properties(self._device, pending)
 
-        # Update state
+            # Record the requested state to verify against the device response
+            requested = self._get_state_snapshot()
+
+            # Skip the write if the device already reported every requested value
+            if (self._device.online and self._confirmed_data is not None
+                    and not self._get_unconfirmed_changes(requested)):
+                discard_updates(self._device)
+                self._suppressed_apply_count += 1
+                _LOGGER.debug(
+                    "Skipped write to device ID %s without changes.", self._device.id)
+                return
+
+            try:
+                await self._device.apply()
+            except Exception:
+                self._apply_metrics.record(
+                    acquired - start, time.monotonic() - acquired, error=True)
+                if self._optimistic:
+                    self._rollback(requested)
+                raise
+
+        self._apply_metrics.record(
+            acquired - start, time.monotonic() - acquired, error=not self._device.online)
+
+        # Poll quickly while the device responds to the change
+        self._start_fast_updates()
+        self._update_backoff()
+
+        if self._optimistic:
+            await self._async_confirm(requested)
+            return
+
+        # Use the state from the apply response if it matches the request
+        snapshot = self._get_state_snapshot()
+        if (not self._refresh_after_apply and self._device.online
+                and not self._get_changes(requested, snapshot)):
+            self._skipped_refresh_count += 1
+            self._confirmed_data = snapshot
+            self.async_set_updated_data(self._confirmed_data)
+            return
+
+        # Otherwise update state with a full refresh
         await self.async_request_refresh()
 
+    def _get_changes(self, requested: Mapping[str, Any], state: Mapping[str, Any]) -> dict[str, Any]:
+        """Get requested properties which differ from a state snapshot."""
+        # Only compare writable properties, measurements can change at any time
+        return {
+            prop: requested[prop] for prop in self._STATE_PROPERTIES
+            if is_writable(self._device, prop) and state.get(prop) != requested[prop]
+        }
+
+    def _get_unconfirmed_changes(self, requested: Mapping[str, Any]) -> dict[str, Any]:
+        """Get requested properties which differ from the confirmed state."""
+        if self._confirmed_data is None:
+            return {}
+
+        return self._get_changes(requested, self._confirmed_data)
+
+    def _rollback(self, requested: Mapping[str, Any]) -> list[str]:
+        """Restore the confirmed state of properties the device didn't accept."""
+        confirmed = self._confirmed_data or {}
+        changes = self._get_unconfirmed_changes(requested)
+        self._rollback_count += 1
+
+        # Only restore properties which still hold the requested value
+        set_properties(self._device, {
+            prop: confirmed.get(prop) for prop, value in changes.items()
+            if getattr(self._device, prop, None) == value
+        })
+
+        # Rejected changes shouldn't be sent with the next write
+        discard_updates(self._device)
+
+        self.data = self._get_state_snapshot()
+        self.async_update_listeners()
+
+        return sorted(changes)
+
+    async def _async_confirm(self, requested: Mapping[str, Any]) -> None:
+        """Confirm the device reflects an optimistic update or roll it back."""
+
+        changes = self._get_unconfirmed_changes(requested)
+
+        def _reflected() -> bool:
+            return self._device.online and all(
+                getattr(self._device, prop, None) == value for prop, value in changes.items())
+
+        # Query the device if the apply response didn't include the changes
+        if self._device.online and not _reflected():
+            try:
+                async with timeout(OPTIMISTIC_CONFIRM_TIMEOUT):
+                    async with self._lock.async_poll(), self._scheduler.async_request():
+                        await self._device.refresh()
+            except TimeoutError:
+                _LOGGER.warning(
+                    "Timed out confirming changes to device ID %s.", self._device.id)
+
+        if _reflected():
+            self._confirmed_data = self._get_state_snapshot()
+            self.async_set_updated_data(self._confirmed_data)
+            return
+
+        properties = self._rollback(requested)
+        raise HomeAssistantError(
+            translation_domain=DOMAIN,
+            translation_key="apply_not_confirmed",
+            translation_placeholders={
+                "id": str(self._device.id),
+                "properties": ", ".join(properties) or "state",
+            },
+        )
+
+    async def apply(self) -> None:
+        """Apply changes to the device and update HA state."""
+
+        # Track requested values until they are written
+        snapshot = self._get_state_snapshot()
+        if self.data is not None:
+            self._pending_changes.update({
+                prop: snapshot[prop] for prop in self._STATE_PROPERTIES
+                if prop != "online" and (prop in self._pending_changes
+                                         or snapshot[prop] != self.data.get(prop))
+            })
+
+        # Show the requested state immediately and confirm it once applied
+        if self._optimistic:
+            self._optimistic_count += 1
+            if self._confirmed_data is None and not self._restored:
+                self._confirmed_data = self.data
+            self.data = snapshot
+            self.async_update_listeners()
+
+        # Merge with a pending write if possible
+        if (task := self._apply_task) is None:
+            task = self._apply_task = self._last_apply_task = self.hass.async_create_background_task(
+                self._async_apply(), f"{DOMAIN} {self._device.id} apply")
+        else:
+            self._coalesced_apply_count += 1
+
+        # Shield the write so a cancelled caller doesn't cancel other callers
+        await shield(task)
+
+    def configure(self,
+                  *,
+                  min_update_interval: float,
+                  max_update_interval: float,
+                  refresh_after_apply: bool,
+                  optimistic: bool,
+                  ) -> None:
+        """Update the configuration of a running coordinator."""
+        self._min_update_interval = min_update_interval
+        self._max_update_interval = max(
+            min_update_interval, max_update_interval)
+        self._refresh_after_apply = refresh_after_apply
+        self._optimistic = optimistic
+
+        # Clamp the current interval unless backing off an offline device
+        if self.update_interval is not None and not self._backoff_active:
+            interval = max(self._min_update_interval,
+                           min(self.update_interval.total_seconds(), self._max_update_interval))
+            self.update_interval = datetime.timedelta(seconds=interval)
+
+    @callback
+    def async_restore_state(self) -> None:
+        """Use the last known device state until the first refresh."""
+        self.data = self._get_state_snapshot()
+        self._restored = True
+
+    async def async_update_capabilities(self, store: MideaCapabilityStore, protocol_version: int) -> bool:
+        """Query and cache device capabilities without interrupting commands."""
+        async with self._lock.async_poll(), self._scheduler.async_request():
+            return await store.async_update(self._device, protocol_version)
+
+    def get_diagnostics(self) -> dict[str, Any]:
+        """Get diagnostic information about the coordinator."""
+        return {
+            "update_interval": self.update_interval.total_seconds() if self.update_interval else None,
+            "apply_coalesce_window": APPLY_COALESCE_WINDOW,
+            "apply_count": self._apply_count,
+            "coalesced_apply_count": self._coalesced_apply_count,
+            "refresh_after_apply": self._refresh_after_apply,
+            "skipped_refresh_count": self._skipped_refresh_count,
+            "suppressed_apply_count": self._suppressed_apply_count,
+            "unchanged_update_count": self._unchanged_update_count,
+            "preempted_poll_count": self._preempted_poll_count,
+            "optimistic": self._optimistic,
+            "optimistic_count": self._optimistic_count,
+            "rollback_count": self._rollback_count,
+            "restored_state": self._restored,
+            "session": self._session.get_diagnostics() if self._session else None,
+            "energy_update_interval": min(self._energy_update_intervals, default=None),
+            "refresh_metrics": self._refresh_metrics.as_dict(),
+            "apply_metrics": self._apply_metrics.as_dict(),
+            "backoff": {
+                "active": self._backoff_active,
+                "consecutive_failures": self._failure_count,
+                "interval": self._backoff_interval,
+                "probe_count": self._probe_count,
+                "failed_probe_count": self._failed_probe_count,
+            },
+        }
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update listeners which depend on changed device properties."""
+
+        previous_data = self._notified_data
+        previous_success = self._notified_success
+        self._notified_data = self.data
+        self._notified_success = self.last_update_success
+
+        # Update all listeners if the changes can't be isolated
+        if (previous_data is None or self.data is None
+                or previous_success != self.last_update_success):
+            super().async_update_listeners()
+            return
+
+        changed = {
+            prop for prop, value in self.data.items()
+            if previous_data.get(prop) != value
+        }
+
+        # Availability of every entity depends on the device being online
+        if "online" in changed:
+            super().async_update_listeners()
+            return
+
+        # Listeners without a context depend on all properties
+        for update_callback, properties in list(self._listeners.values()):
+            if properties is None or not changed.isdisjoint(properties):
+                update_callback()
+
+    @property
+    def apply_in_progress(self) -> bool:
+        """Return True if a write is pending or in progress."""
+        return self._last_apply_task is not None and not self._last_apply_task.done()
+
+    @property
+    def restored(self) -> bool:
+        """Return True if state is restored and not yet refreshed."""
+        return self._restored
+
+    @property
+    def min_update_interval(self) -> float:
+        """Return the minimum update interval."""
+        return self._min_update_interval
+
+    @property
+    def refresh_metrics(self) -> OperationMetrics:
+        """Return latency metrics of device refreshes."""
+        return self._refresh_metrics
+
+    @property
+    def apply_metrics(self) -> OperationMetrics:
+        """Return latency metrics of device applies."""
+        return self._apply_metrics
+
     @property
     def device(self) -> MideaDevice:
         """Fetch the device object."""
         return self._device
 
-    def register_energy_sensor(self) -> None:
+    def register_energy_sensor(self, update_interval: float) -> None:
         """Record that an energy sensor is active."""
 
         if not hasattr(self._device, "enable_energy_usage_requests"):
             raise TypeError("Device does not support energy sensors.")
 
-        self._energy_sensors += 1
+        self._energy_update_intervals.append(update_interval)
 
-        # Enable requests
-        self._device.enable_energy_usage_requests = True
+        # Request energy on the next refresh
+        self._next_energy_update = 0.0
 
-    def unregister_energy_sensor(self) -> None:
+    def unregister_energy_sensor(self, update_interval: float) -> None:
         """Record that an energy sensor is inactive."""
 
         if not hasattr(self._device, "enable_energy_usage_requests"):
             raise TypeError("Device does not support energy sensors.")
 
-        self._energy_sensors -= 1
+        self._energy_update_intervals.remove(update_interval)
 
         # Disable requests if last sensor
-        self._device.enable_energy_usage_requests = self._energy_sensors > 0
+        if not self._energy_update_intervals:
+            self._device.enable_energy_usage_requests = False
 
 
 class MideaCoordinatorEntity(CoordinatorEntity[MideaDeviceUpdateCoordinator], Generic[MideaDevice]):
     """Coordinator entity for Midea Smart AC."""
 
-    def __init__(self, coordinator: MideaDeviceUpdateCoordinator[MideaDevice]) -> None:
-        super().__init__(coordinator)
+    def __init__(self,
+                 coordinator: MideaDeviceUpdateCoordinator[MideaDevice],
+                 properties: Iterable[str] | None = None
+                 ) -> None:
+        # Only receive updates when dependent device properties change
+        super().__init__(coordinator,
+                         frozenset(properties) if properties is not None else None)
 
         # Save reference to device
         self._device: MideaDevice = coordinator.device
 
+    async def async_added_to_hass(self) -> None:
+        """Run when entity about to be added to hass."""
+        await super().async_added_to_hass()
+
+        # Apply option changes without reloading the entry
+        self.async_on_remove(async_dispatcher_connect(
+            self.hass,
+            SIGNAL_OPTIONS_UPDATED.format(self._device.id),
+            self._async_options_updated,
+        ))
+
+    @callback
+    def _async_options_updated(self, options: Mapping[str, Any]) -> None:
+        """Apply updated options to the entity."""
+
     @property
     def available(self) -> bool:
         """Check device availability."""
-        return self._device.online
+        return self._device.online or self.coordinator.restored
+
+    @property
+    def assumed_state(self) -> bool:
+        """Assume state while the last known state is restored."""
+        return self.coordinator.restored
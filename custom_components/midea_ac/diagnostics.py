@@ -8,7 +8,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_TOKEN
 from homeassistant.core import HomeAssistant
 
-from .const import CONF_KEY, DOMAIN
+from .const import CONF_KEY, DATA_SCHEDULER, DATA_STARTUP, DOMAIN
 
 _REDACT = [
     CONF_KEY,
@@ -45,5 +45,8 @@ async def async_get_config_entry_diagnostics(
 
             # Dump supported features
             **feature_info
-        }
+        },
+        "coordinator": coordinator.get_diagnostics(),
+        "scheduler": hass.data[DOMAIN][DATA_SCHEDULER].get_diagnostics(),
+        "startup": hass.data[DOMAIN][DATA_STARTUP].get_diagnostics(device.id),
     }
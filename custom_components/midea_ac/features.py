@@ -0,0 +1,102 @@
+"""Supported entities of Midea Smart AC devices."""
+from __future__ import annotations
+
+from homeassistant.const import Platform
+
+from .const import MideaDevice
+
+
+def get_supported_binary_sensors(device: MideaDevice) -> list[str]:
+    """Get the binary sensors supported by a device."""
+    supported = []
+    if hasattr(device, "filter_alert") and getattr(device, "supports_filter_reminder", False):
+        supported.append("filter_alert")
+
+    if hasattr(device, "self_clean_active") and getattr(device, "supports_self_clean", False):
+        supported.append("self_clean_active")
+
+    return supported
+
+
+def get_supported_buttons(device: MideaDevice) -> list[str]:
+    """Get the buttons supported by a device."""
+    supported = []
+    if hasattr(device, "start_self_clean") and getattr(device, "supports_self_clean", False):
+        supported.append("start_self_clean")
+
+    return supported
+
+
+def get_supported_numbers(device: MideaDevice) -> list[str]:
+    """Get the numbers supported by a device."""
+    supported = []
+    if getattr(device, "supports_custom_fan_speed", False):
+        supported.append("fan_speed")
+
+    return supported
+
+
+def get_supported_selects(device: MideaDevice) -> list[str]:
+    """Get the selects supported by a device."""
+    supported = []
+    if hasattr(device, "vertical_swing_angle") and getattr(device, "supports_vertical_swing_angle", False):
+        supported.append("vertical_swing_angle")
+
+    if hasattr(device, "horizontal_swing_angle") and getattr(device, "supports_horizontal_swing_angle", False):
+        supported.append("horizontal_swing_angle")
+
+    if hasattr(device, "rate_select") and len(getattr(device, "supported_rate_selects", [])) > 1:
+        supported.append("rate_select")
+
+    if hasattr(device, "aux_mode") and len(getattr(device, "supported_aux_modes", [])) > 1:
+        supported.append("aux_mode")
+
+    if hasattr(device, "cascade_mode") and getattr(device, "supports_cascade", False):
+        supported.append("cascade_mode")
+
+    # Purifiers with 3 or more modes use a select
+    if hasattr(device, "purifier") and len(getattr(device, "supported_purifier_modes", [])) > 2:
+        supported.append("purifier")
+
+    return supported
+
+
+def get_supported_switches(device: MideaDevice) -> list[str]:
+    """Get the switches supported by a device."""
+    supported = []
+    if hasattr(device, "toggle_display"):
+        # Many devices don't report display control so always create the switch
+        supported.extend(["display", "follow_me"])
+
+    if hasattr(device, "breeze_away") and getattr(device, "supports_breeze_away", False):
+        supported.append("breeze_away")
+
+    if hasattr(device, "breeze_mild") and getattr(device, "supports_breeze_mild_away", False):
+        supported.append("breeze_mild")
+
+    if hasattr(device, "breezeless") and getattr(device, "supports_breezeless", False):
+        supported.append("breezeless")
+
+    if hasattr(device, "flash_cool") and getattr(device, "supports_flash_cool", False):
+        supported.append("flash_cool")
+
+    if hasattr(device, "purifier"):
+        # AC has on/off purifier
+        if getattr(device, "supports_purifier", False):
+            supported.append("purifier")
+
+        # Create switch for CC purifier if only 2 modes supported
+        if len(getattr(device, "supported_purifier_modes", [])) == 2:
+            supported.append("purifier_mode")
+
+    return supported
+
+
+# Platforms which only create entities for supported features
+PLATFORM_ENTITIES = {
+    Platform.BINARY_SENSOR: get_supported_binary_sensors,
+    Platform.BUTTON: get_supported_buttons,
+    Platform.NUMBER: get_supported_numbers,
+    Platform.SELECT: get_supported_selects,
+    Platform.SWITCH: get_supported_switches,
+}
@@ -0,0 +1,90 @@
+"""Latency metrics for Midea Smart AC."""
+
+from bisect import bisect_left
+from typing import Any
+
+# Upper bounds of histogram buckets in seconds
+_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0)
+
+
+class LatencyHistogram:
+    """Fixed bucket histogram of latencies."""
+
+    def __init__(self) -> None:
+        # Extra bucket for latencies beyond the last bound
+        self._counts = [0] * (len(_BUCKETS) + 1)
+        self._count = 0
+        self._max = 0.0
+
+    def record(self, latency: float) -> None:
+        """Record a latency in seconds."""
+        self._counts[bisect_left(_BUCKETS, latency)] += 1
+        self._count += 1
+        self._max = max(self._max, latency)
+
+    @property
+    def count(self) -> int:
+        """Return the number of recorded latencies."""
+        return self._count
+
+    @property
+    def max(self) -> float | None:
+        """Return the maximum recorded latency."""
+        return self._max if self._count else None
+
+    def percentile(self, percent: float) -> float | None:
+        """Estimate a percentile from the bucket bounds."""
+        if not self._count:
+            return None
+
+        # Find the first bucket containing the requested rank
+        rank = percent / 100 * self._count
+        total = 0
+        for bound, count in zip(_BUCKETS, self._counts):
+            total += count
+            if total >= rank:
+                # Estimate can't exceed the observed maximum
+                return min(bound, self._max)
+
+        return self._max
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the histogram as a dictionary."""
+        return {
+            "count": self._count,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "max": self.max,
+            "buckets": {
+                **{f"le_{bound}": count for bound, count in zip(_BUCKETS, self._counts)},
+                "inf": self._counts[-1],
+            },
+        }
+
+
+class OperationMetrics:
+    """Latency and error metrics of a device operation."""
+
+    def __init__(self) -> None:
+        self.lock_wait = LatencyHistogram()
+        self.request = LatencyHistogram()
+        self.total = LatencyHistogram()
+        self.errors = 0
+
+    def record(self, lock_wait: float, request: float, *, error: bool = False) -> None:
+        """Record the timing of a single operation."""
+        self.lock_wait.record(lock_wait)
+        self.request.record(request)
+        self.total.record(lock_wait + request)
+
+        if error:
+            self.errors += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the metrics as a dictionary."""
+        return {
+            "lock_wait": self.lock_wait.as_dict(),
+            "request": self.request.as_dict(),
+            "total": self.total.as_dict(),
+            "errors": self.errors,
+        }
@@ -2,15 +2,20 @@
 from __future__ import annotations
 
 import logging
+import time
+from asyncio import Task, shield, sleep
+from typing import Any, Mapping
 
 from homeassistant.components.number import NumberEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import PERCENTAGE
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import CONF_FAN_SPEED_STEP, DOMAIN
+from .const import (CONF_FAN_SPEED_STEP, CONF_NUMBER_DEBOUNCE_WINDOW, DOMAIN,
+                    NUMBER_DEBOUNCE_WINDOW)
 from .coordinator import MideaCoordinatorEntity, MideaDeviceUpdateCoordinator
+from .features import get_supported_numbers
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -29,10 +34,12 @@ async def async_setup_entry(
     device = coordinator.device
 
     # Create entity if supported
-    if getattr(device, "supports_custom_fan_speed", False):
+    if "fan_speed" in get_supported_numbers(device):
         add_entities([MideaFanSpeedNumber(
             coordinator,
-            config_entry.options.get(CONF_FAN_SPEED_STEP, 1)
+            config_entry.options.get(CONF_FAN_SPEED_STEP, 1),
+            config_entry.options.get(
+                CONF_NUMBER_DEBOUNCE_WINDOW, NUMBER_DEBOUNCE_WINDOW)
         )])
 
 
@@ -43,12 +50,36 @@ class MideaFanSpeedNumber(MideaCoordinatorEntity, NumberEntity):
 
     def __init__(self,
                  coordinator: MideaDeviceUpdateCoordinator,
-                 step_size: float = 1
+                 step_size: float = 1,
+                 debounce_window: float = NUMBER_DEBOUNCE_WINDOW
                  ) -> None:
-        MideaCoordinatorEntity.__init__(self, coordinator)
+        MideaCoordinatorEntity.__init__(
+            self, coordinator, ["fan_speed", "power_state"])
 
         self._step_size = step_size
 
+        # Debounced write state
+        self._debounce_window = debounce_window
+        self._pending_value: float | None = None
+        self._write_deadline = 0.0
+        self._write_task: Task | None = None
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel any pending write when removed."""
+        await super().async_will_remove_from_hass()
+
+        if self._write_task is not None:
+            self._write_task.cancel()
+            self._write_task = None
+
+    @callback
+    def _async_options_updated(self, options: Mapping[str, Any]) -> None:
+        """Apply updated options to the entity."""
+        self._step_size = options.get(CONF_FAN_SPEED_STEP, 1)
+        self._debounce_window = options.get(
+            CONF_NUMBER_DEBOUNCE_WINDOW, NUMBER_DEBOUNCE_WINDOW)
+        self.async_write_ha_state()
+
     @property
     def device_info(self) -> dict:
         """Return info for device registry."""
@@ -93,6 +124,10 @@ class MideaFanSpeedNumber(MideaCoordinatorEntity, NumberEntity):
     @property
     def native_value(self) -> float:
 
+        # Show a value which is waiting to be written
+        if self._pending_value is not None:
+            return self._pending_value
+
         speed = self._device.fan_speed
 
         # Convert enum to integer
@@ -104,6 +139,36 @@ class MideaFanSpeedNumber(MideaCoordinatorEntity, NumberEntity):
     async def async_set_native_value(self, value: float) -> None:
         """Set a new fan speed value."""
 
+        if self._debounce_window <= 0:
+            self._device.fan_speed = value
+
+            # Apply via the coordinator
+            await self.coordinator.apply()
+            return
+
+        # Show the value immediately and restart the debounce window
+        self._pending_value = value
+        self._write_deadline = time.monotonic() + self._debounce_window
+        self.async_write_ha_state()
+
+        # Merge with a pending write if possible
+        if (task := self._write_task) is None:
+            task = self._write_task = self.hass.async_create_background_task(
+                self._async_debounced_write(), f"{DOMAIN} {self._device.id} fan speed")
+
+        # Shield the write so a cancelled caller doesn't cancel other callers
+        await shield(task)
+
+    async def _async_debounced_write(self) -> None:
+        """Write the last value once no new values are set for the debounce window."""
+
+        while (remaining := self._write_deadline - time.monotonic()) > 0:
+            await sleep(remaining)
+
+        # Later values must start a new write
+        self._write_task = None
+        value, self._pending_value = self._pending_value, None
+
         self._device.fan_speed = value
 
         # Apply via the coordinator
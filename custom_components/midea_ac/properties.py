@@ -0,0 +1,33 @@
+"""Device property helpers for Midea Smart AC."""
+
+from typing import Any, Mapping
+
+from .const import MideaDevice
+
+
+def is_writable(device: MideaDevice, prop: str) -> bool:
+    """Return True if a device property has a public setter."""
+    attr = getattr(type(device), prop, None)
+    return isinstance(attr, property) and attr.fset is not None
+
+
+def set_properties(device: MideaDevice, values: Mapping[str, Any]) -> list[str]:
+    """Set writable device properties through their public setters."""
+    changed = []
+
+    # Disable modes first so mutually exclusive modes aren't cleared after being enabled
+    for prop, value in sorted(values.items(), key=lambda item: item[1] is True):
+        if not is_writable(device, prop) or getattr(device, prop) == value:
+            continue
+
+        setattr(device, prop, value)
+        changed.append(prop)
+
+    return changed
+
+
+def discard_updates(device: MideaDevice) -> None:
+    """Discard changes the device would send on the next apply."""
+    for attr in ("_updated_properties", "_updated_controls"):
+        if isinstance(updated := getattr(device, attr, None), set):
+            updated.clear()
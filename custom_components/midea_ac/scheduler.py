@@ -0,0 +1,180 @@
+"""Request scheduling across all Midea Smart AC devices."""
+
+import logging
+import time
+from asyncio import Condition, Semaphore, sleep
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
+
+from .const import MAX_CONCURRENT_REQUESTS
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class MideaDeviceLock:
+    """Device access lock which gives commands priority over polls."""
+
+    def __init__(self) -> None:
+        self._condition = Condition()
+        self._locked = False
+        self._pending_commands = 0
+        self._command_count = 0
+
+    def locked(self) -> bool:
+        """Return True if the lock is held."""
+        return self._locked
+
+    async def _release(self) -> None:
+        async with self._condition:
+            self._locked = False
+            self._condition.notify_all()
+
+    @asynccontextmanager
+    async def async_command(self) -> AsyncIterator[None]:
+        """Acquire the lock for a command ahead of any waiting polls."""
+
+        async with self._condition:
+            # Wake waiting polls so they can be dropped
+            self._command_count += 1
+            self._pending_commands += 1
+            self._condition.notify_all()
+            try:
+                await self._condition.wait_for(lambda: not self._locked)
+            finally:
+                self._pending_commands -= 1
+            self._locked = True
+
+        try:
+            yield
+        finally:
+            await self._release()
+
+    @asynccontextmanager
+    async def async_poll(self) -> AsyncIterator[bool]:
+        """Acquire the lock for a poll once no commands are waiting.
+
+        Yields True if a command was issued while the poll was waiting, in
+        which case the poll should use the response of the command instead.
+        """
+
+        async with self._condition:
+            command_count = self._command_count
+            await self._condition.wait_for(
+                lambda: not self._locked and not self._pending_commands)
+            self._locked = True
+
+        try:
+            yield self._command_count != command_count
+        finally:
+            await self._release()
+
+
+class MideaRequestScheduler:
+    """Stagger polls and limit concurrent LAN requests across devices."""
+
+    def __init__(self, max_concurrent_requests: int = MAX_CONCURRENT_REQUESTS) -> None:
+        self._max_concurrent_requests = max_concurrent_requests
+        self._semaphore = Semaphore(max_concurrent_requests)
+
+        # Polled devices and the start of the last scheduled poll
+        self._device_count = 0
+        self._last_poll = 0.0
+        self._last_poll_spacing = 0.0
+
+        # Metrics
+        self._in_flight = 0
+        self._queue_depth = 0
+        self._max_queue_depth = 0
+        self._request_count = 0
+        self._total_delay = 0.0
+        self._last_delay = 0.0
+        self._max_delay = 0.0
+        self._last_poll_delay = 0.0
+        self._max_poll_delay = 0.0
+
+    def register(self) -> None:
+        """Record that a device is being polled."""
+        self._device_count += 1
+
+    def unregister(self) -> None:
+        """Record that a device is no longer being polled."""
+        self._device_count -= 1
+
+    def get_poll_spacing(self, update_interval: float) -> float:
+        """Return the minimum time before the poll of a device at an update interval."""
+        if not self._device_count:
+            return 0.0
+
+        # Spread polls evenly over the current interval of the polling device
+        return update_interval / self._device_count
+
+    async def async_wait_for_poll(self, update_interval: float) -> None:
+        """Wait for the next available poll slot of a device."""
+
+        now = time.monotonic()
+        spacing = self.get_poll_spacing(update_interval)
+        slot = max(now, self._last_poll + spacing)
+        self._last_poll = slot
+        self._last_poll_spacing = spacing
+
+        # Record how long the poll is delayed to stagger it
+        self._last_poll_delay = slot - now
+        self._max_poll_delay = max(self._max_poll_delay, slot - now)
+
+        if slot > now:
+            self._queue_depth += 1
+            self._max_queue_depth = max(
+                self._max_queue_depth, self._queue_depth)
+            try:
+                await sleep(slot - now)
+            finally:
+                self._queue_depth -= 1
+
+    @asynccontextmanager
+    async def async_request(self) -> AsyncIterator[None]:
+        """Limit the number of concurrent requests to devices."""
+
+        start = time.monotonic()
+
+        # Wait for a free slot, tracking the number of waiting requests
+        if self._semaphore.locked():
+            self._queue_depth += 1
+            self._max_queue_depth = max(
+                self._max_queue_depth, self._queue_depth)
+            try:
+                await self._semaphore.acquire()
+            finally:
+                self._queue_depth -= 1
+        else:
+            await self._semaphore.acquire()
+
+        # Record how long the request waited to start
+        delay = time.monotonic() - start
+        self._request_count += 1
+        self._total_delay += delay
+        self._last_delay = delay
+        self._max_delay = max(self._max_delay, delay)
+
+        self._in_flight += 1
+        try:
+            yield
+        finally:
+            self._in_flight -= 1
+            self._semaphore.release()
+
+    def get_diagnostics(self) -> dict[str, Any]:
+        """Get diagnostic information about the scheduler."""
+        return {
+            "devices": self._device_count,
+            "last_poll_spacing": self._last_poll_spacing,
+            "max_concurrent_requests": self._max_concurrent_requests,
+            "in_flight": self._in_flight,
+            "queue_depth": self._queue_depth,
+            "max_queue_depth": self._max_queue_depth,
+            "request_count": self._request_count,
+            "last_delay": self._last_delay,
+            "max_delay": self._max_delay,
+            "average_delay": self._total_delay / self._request_count if self._request_count else 0.0,
+            "last_poll_delay": self._last_poll_delay,
+            "max_poll_delay": self._max_poll_delay,
+        }
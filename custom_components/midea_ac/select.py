@@ -12,6 +12,7 @@ from msmart.utils import MideaIntEnum
 
 from .const import CONF_SWING_ANGLE_RTL, DOMAIN
 from .coordinator import MideaCoordinatorEntity, MideaDeviceUpdateCoordinator
+from .features import get_supported_selects
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -31,14 +32,15 @@ async def async_setup_entry(
     device_class = type(device)
 
     # Create entities for supported features
+    supported = get_supported_selects(device)
     entities = []
-    if hasattr(device, "vertical_swing_angle") and getattr(device, "supports_vertical_swing_angle", False):
+    if "vertical_swing_angle" in supported:
         entities.append(MideaEnumSelect(coordinator,
                                         "vertical_swing_angle",
                                         device_class.SwingAngle
                                         ))
 
-    if hasattr(device, "horizontal_swing_angle") and getattr(device, "supports_horizontal_swing_angle", False):
+    if "horizontal_swing_angle" in supported:
         entities.append(MideaEnumSelect(coordinator,
                                         "horizontal_swing_angle",
                                         device_class.SwingAngle,
@@ -46,35 +48,33 @@ async def async_setup_entry(
                                             CONF_SWING_ANGLE_RTL) else None
                                         ))
 
-    supported_rates = getattr(device, "supported_rate_selects", [])
-    if hasattr(device, "rate_select") and len(supported_rates) > 1:
+    if "rate_select" in supported:
         entities.append(MideaEnumSelect(coordinator,
                                         "rate_select",
                                         device_class.RateSelect,
-                                        options=supported_rates
+                                        options=device.supported_rate_selects
                                         ))
 
-    supported_aux_modes = getattr(device, "supported_aux_modes", [])
-    if hasattr(device, "aux_mode") and len(supported_aux_modes) > 1:
+    if "aux_mode" in supported:
         entities.append(MideaEnumSelect(coordinator,
                                         "aux_mode",
                                         device_class.AuxHeatMode,
-                                        options=supported_aux_modes
+                                        options=device.supported_aux_modes
                                         ))
 
-    if hasattr(device, "cascade") and getattr(device, "supports_cascade", False):
+    if "cascade_mode" in supported:
         entities.append(MideaEnumSelect(coordinator,
-                                        "cascade",
-                                        device_class.CascadeMode
+                                        "cascade_mode",
+                                        device_class.CascadeMode,
+                                        translation_key="cascade"
                                         ))
 
     # Add select for purifier with 3 or more modes
-    supported_purifier_modes = getattr(device, "supported_purifier_modes", [])
-    if hasattr(device, "purifier") and len(supported_purifier_modes) > 2:
+    if "purifier" in supported:
         entities.append(MideaEnumSelect(coordinator,
                                         "purifier",
                                         device_class.PurifierMode,
-                                        options=supported_purifier_modes
+                                        options=device.supported_purifier_modes
                                         ))
 
     add_entities(entities)
@@ -90,7 +90,8 @@ class MideaEnumSelect(MideaCoordinatorEntity, SelectEntity):
                  *,
                  translation_key: str | None = None,
                  options: List[MideaIntEnum] | None = None) -> None:
-        MideaCoordinatorEntity.__init__(self, coordinator)
+        MideaCoordinatorEntity.__init__(
+            self, coordinator, [prop, "power_state"])
 
         self._prop = prop
         self._enum_class = enum_class
@@ -138,5 +139,5 @@ class MideaEnumSelect(MideaCoordinatorEntity, SelectEntity):
         setattr(self._device, self._prop,
                 self._enum_class.get_from_name(option.upper()))
 
-        # Apply via the coordinator
+        # Apply via the coordinator so concurrent selections share a write
         await self.coordinator.apply()
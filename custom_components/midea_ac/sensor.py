@@ -2,23 +2,62 @@
 from __future__ import annotations
 
 import logging
+import time
+from typing import Any, Callable, Mapping
 
 from homeassistant.components.sensor import (SensorDeviceClass, SensorEntity,
                                              SensorStateClass)
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import (PERCENTAGE, UnitOfEnergy, UnitOfPower,
-                                 UnitOfTemperature)
-from homeassistant.core import HomeAssistant
+from homeassistant.const import (CONF_SCAN_INTERVAL, PERCENTAGE,
+                                 EntityCategory, UnitOfEnergy, UnitOfPower,
+                                 UnitOfTemperature, UnitOfTime)
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
 from msmart.utils import MideaIntEnum
 
 from .const import (CONF_ENERGY_DATA_FORMAT, CONF_ENERGY_DATA_SCALE,
-                    CONF_ENERGY_SENSOR, CONF_POWER_SENSOR, DOMAIN,
-                    EnergyFormat)
+                    CONF_ENERGY_SENSOR, CONF_HUMIDITY_DEADBAND,
+                    CONF_MAX_QUIET_TIME, CONF_MIN_PUBLISH_INTERVAL,
+                    CONF_POWER_DEADBAND, CONF_POWER_SENSOR, CONF_SENSOR_FILTER,
+                    CONF_TEMPERATURE_DEADBAND, DOMAIN, ENERGY_UPDATE_INTERVAL,
+                    POWER_UPDATE_INTERVAL, SENSOR_MAX_QUIET_TIME, EnergyFormat,
+                    MideaDevice)
 from .coordinator import MideaCoordinatorEntity, MideaDeviceUpdateCoordinator
+from .metrics import OperationMetrics
 
 _LOGGER = logging.getLogger(__name__)
 
+# Default update interval of each energy sensor config
+_ENERGY_UPDATE_INTERVALS = {
+    CONF_ENERGY_SENSOR: ENERGY_UPDATE_INTERVAL,
+    CONF_POWER_SENSOR: POWER_UPDATE_INTERVAL,
+}
+
+
+def _get_filter_config(options: Mapping[str, Any], key: str | None) -> tuple[float, float, float]:
+    """Get the deadband, minimum publish interval and maximum quiet time of a filtered sensor."""
+    config = options.get(CONF_SENSOR_FILTER) or {}
+    max_quiet_time = config.get(CONF_MAX_QUIET_TIME, SENSOR_MAX_QUIET_TIME)
+
+    # Only sensors with a deadband option are filtered
+    if key is None:
+        return 0, 0, max_quiet_time
+
+    deadband = config.get(key, 0)
+    min_publish_interval = config.get(CONF_MIN_PUBLISH_INTERVAL, 0)
+    return deadband, min_publish_interval, max_quiet_time
+
+
+def _get_energy_config(device: MideaDevice, options: Mapping[str, Any], key: str) -> tuple[EnergyFormat, float, float]:
+    """Get the format, scale and update interval of an energy sensor config."""
+    config = options.get(key)
+    format = type(device).EnergyDataFormat.get_from_name(
+        config.get(CONF_ENERGY_DATA_FORMAT).upper())
+    scale = config.get(CONF_ENERGY_DATA_SCALE)
+    interval = config.get(CONF_SCAN_INTERVAL, _ENERGY_UPDATE_INTERVALS[key])
+    return format, scale, interval
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -41,6 +80,8 @@ async def async_setup_entry(
             SensorDeviceClass.TEMPERATURE,
             UnitOfTemperature.CELSIUS,
             "indoor_temperature",
+            deadband_key=CONF_TEMPERATURE_DEADBAND,
+            options=config_entry.options,
         ),
         MideaSensor(
             coordinator,
@@ -48,6 +89,8 @@ async def async_setup_entry(
             SensorDeviceClass.TEMPERATURE,
             UnitOfTemperature.CELSIUS,
             "outdoor_temperature",
+            deadband_key=CONF_TEMPERATURE_DEADBAND,
+            options=config_entry.options,
         ),
     ]
 
@@ -58,26 +101,22 @@ async def async_setup_entry(
             SensorDeviceClass.HUMIDITY,
             PERCENTAGE,
             "indoor_humidity",
+            deadband_key=CONF_HUMIDITY_DEADBAND,
+            options=config_entry.options,
         ))
 
     # Only add energy sensors if device supports energy requests
     if hasattr(device, "enable_energy_usage_requests"):
-        def _get_energy_config(key: str) -> tuple[EnergyFormat, float]:
-            config = config_entry.options.get(key)
-            format = type(device).EnergyDataFormat.get_from_name(
-                config.get(CONF_ENERGY_DATA_FORMAT).upper())
-            scale = config.get(CONF_ENERGY_DATA_SCALE)
-            return format, scale
-
         # Configure energy format
-        energy_data_format, energy_scale = _get_energy_config(
-            CONF_ENERGY_SENSOR)
+        energy_data_format, energy_scale, energy_interval = _get_energy_config(
+            device, config_entry.options, CONF_ENERGY_SENSOR)
         _LOGGER.info(
-            "Using energy format %r (scale: %f) for device ID %s.", energy_data_format, energy_scale, coordinator.device.id)
+            "Using energy format %r (scale: %f, interval: %d) for device ID %s.", energy_data_format, energy_scale, energy_interval, coordinator.device.id)
 
-        power_data_format, power_scale = _get_energy_config(CONF_POWER_SENSOR)
+        power_data_format, power_scale, power_interval = _get_energy_config(
+            device, config_entry.options, CONF_POWER_SENSOR)
         _LOGGER.info(
-            "Using power format %r (scale: %f) for device ID %s.", power_data_format, power_scale, coordinator.device.id)
+            "Using power format %r (scale: %f, interval: %d) for device ID %s.", power_data_format, power_scale, power_interval, coordinator.device.id)
 
         entities.extend(
             [
@@ -88,8 +127,10 @@ async def async_setup_entry(
                     SensorDeviceClass.ENERGY,
                     UnitOfEnergy.KILO_WATT_HOUR,
                     "total_energy_usage",
+                    config_key=CONF_ENERGY_SENSOR,
                     format=energy_data_format,
                     scale=energy_scale,
+                    update_interval=energy_interval,
                     state_class=SensorStateClass.TOTAL,
                 ),
                 MideaEnergySensor(
@@ -98,8 +139,10 @@ async def async_setup_entry(
                     SensorDeviceClass.ENERGY,
                     UnitOfEnergy.KILO_WATT_HOUR,
                     "current_energy_usage",
+                    config_key=CONF_ENERGY_SENSOR,
                     format=energy_data_format,
                     scale=energy_scale,
+                    update_interval=energy_interval,
                     state_class=SensorStateClass.TOTAL_INCREASING,
                 ),
                 MideaEnergySensor(
@@ -108,11 +151,22 @@ async def async_setup_entry(
                     SensorDeviceClass.POWER,
                     UnitOfPower.WATT,
                     "real_time_power_usage",
+                    config_key=CONF_POWER_SENSOR,
                     format=power_data_format,
                     scale=power_scale,
+                    update_interval=power_interval,
+                    deadband_key=CONF_POWER_DEADBAND,
+                    options=config_entry.options,
                 )
             ])
 
+    # Latency and error metrics of device requests
+    for operation in ["refresh", "apply"]:
+        entities.extend([
+            MideaLatencySensor(coordinator, operation),
+            MideaErrorCountSensor(coordinator, operation),
+        ])
+
     add_entities(entities)
 
 
@@ -127,8 +181,10 @@ class MideaSensor(MideaCoordinatorEntity, SensorEntity):
                  translation_key: str | None = None,
                  *,
                  state_class: SensorStateClass = SensorStateClass.MEASUREMENT,
+                 deadband_key: str | None = None,
+                 options: Mapping[str, Any] | None = None,
                  ) -> None:
-        MideaCoordinatorEntity.__init__(self, coordinator)
+        MideaCoordinatorEntity.__init__(self, coordinator, [prop])
 
         self._prop = prop
         self._device_class = device_class
@@ -136,6 +192,85 @@ class MideaSensor(MideaCoordinatorEntity, SensorEntity):
         self._unit = unit
         self._attr_translation_key = translation_key
 
+        # Deadband filter state
+        self._deadband_key = deadband_key
+        self._deadband, self._min_publish_interval, self._max_quiet_time = _get_filter_config(
+            options or {}, deadband_key)
+        self._published_value: float | None = None
+        self._published_online = False
+        self._published_time = 0.0
+        self._cancel_publish: Callable[[], None] | None = None
+
+    @callback
+    def _async_options_updated(self, options: Mapping[str, Any]) -> None:
+        """Apply updated options to the entity."""
+        self._deadband, self._min_publish_interval, self._max_quiet_time = _get_filter_config(
+            options, self._deadband_key)
+        self._async_publish()
+
+    async def async_added_to_hass(self) -> None:
+        """Run when entity about to be added to hass."""
+        await super().async_added_to_hass()
+
+        self._published_value = self._get_value()
+        self._published_online = self._device.online
+        self._published_time = time.monotonic()
+        self.async_on_remove(self._async_cancel_publish)
+
+    @callback
+    def _async_cancel_publish(self) -> None:
+        """Cancel a scheduled publish of a held back value."""
+        if self._cancel_publish is not None:
+            self._cancel_publish()
+            self._cancel_publish = None
+
+    @callback
+    def _async_publish(self, _now: Any = None) -> None:
+        """Publish the current value of the sensor."""
+        self._async_cancel_publish()
+
+        self._published_value = self._get_value()
+        self._published_online = self._device.online
+        self._published_time = time.monotonic()
+        self.async_write_ha_state()
+
+    @property
+    def _filtered(self) -> bool:
+        """Return True if published values are filtered."""
+        return self._deadband > 0 or self._min_publish_interval > 0
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Publish values which move beyond the deadband or have been held back too long."""
+        value = self._get_value()
+        published = self._published_value
+
+        # Publish immediately if not filtered or availability changes
+        if (not self._filtered or value is None or published is None
+                or self._device.online != self._published_online):
+            self._async_publish()
+            return
+
+        # Publish changes beyond the deadband at most once per minimum interval
+        if value != published and abs(value - published) >= self._deadband:
+            delay = self._published_time + self._min_publish_interval - time.monotonic()
+            if delay <= 0:
+                self._async_publish()
+                return
+
+            # Replace a later publish scheduled by the quiet time
+            self._async_cancel_publish()
+            self._cancel_publish = async_call_later(
+                self.hass, delay, self._async_publish)
+            return
+
+        # Publish a held back value once the quiet time expires
+        if self._cancel_publish is None and self._max_quiet_time > 0:
+            delay = max(0, self._published_time +
+                        self._max_quiet_time - time.monotonic())
+            self._cancel_publish = async_call_later(
+                self.hass, delay, self._async_publish)
+
     @property
     def device_info(self) -> dict:
         """Return info for device registry."""
@@ -177,10 +312,17 @@ class MideaSensor(MideaCoordinatorEntity, SensorEntity):
         """Return the native units of this entity."""
         return self._unit
 
+    def _get_value(self) -> float | None:
+        """Return the current value of the device property."""
+        return getattr(self._device, self._prop, None)
+
     @property
     def native_value(self) -> float | None:
-        """Return the current native value."""
-        return getattr(self._device, self._prop, None)
+        """Return the last published value."""
+        if self._filtered:
+            return self._published_value
+
+        return self._get_value()
 
 
 class MideaEnergySensor(MideaSensor):
@@ -188,22 +330,40 @@ class MideaEnergySensor(MideaSensor):
 
     def __init__(self,
                  *args,
+                 config_key: str,
                  format: MideaIntEnum,
                  scale: float = 1.0,
+                 update_interval: float = ENERGY_UPDATE_INTERVAL,
                  **kwargs) -> None:
         MideaSensor.__init__(self, *args, **kwargs)
 
+        self._config_key = config_key
         self._format = format
         self._scale = scale
+        self._update_interval = update_interval
         self._attr_entity_registry_enabled_default = False
 
+    @callback
+    def _async_options_updated(self, options: Mapping[str, Any]) -> None:
+        """Apply updated options to the entity."""
+        self._format, self._scale, update_interval = _get_energy_config(
+            self._device, options, self._config_key)
+
+        # Re-register with the coordinator at the new interval
+        if update_interval != self._update_interval:
+            self.coordinator.unregister_energy_sensor(self._update_interval)
+            self.coordinator.register_energy_sensor(update_interval)
+            self._update_interval = update_interval
+
+        MideaSensor._async_options_updated(self, options)
+
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
         # Call super method to ensure lifecycle is properly handled
         await super().async_added_to_hass()
 
         # Register energy sensor with coordinator
-        self.coordinator.register_energy_sensor()
+        self.coordinator.register_energy_sensor(self._update_interval)
 
     async def async_will_remove_from_hass(self) -> None:
         """Run when entity will be removed from hass."""
@@ -211,11 +371,10 @@ class MideaEnergySensor(MideaSensor):
         await super().async_will_remove_from_hass()
 
         # Unregister energy sensor with coordinator
-        self.coordinator.unregister_energy_sensor()
+        self.coordinator.unregister_energy_sensor(self._update_interval)
 
-    @property
-    def native_value(self) -> float | None:
-        """Return the scaled native value."""
+    def _get_value(self) -> float | None:
+        """Return the scaled value of the device property."""
         # Manually prepend 'get_' to the property.
         # This is so we don't have to change prop which causes unique ids to change
         get_method = getattr(self._device, f"get_{self._prop}", None)
@@ -228,3 +387,103 @@ class MideaEnergySensor(MideaSensor):
             return None
 
         return value * self._scale
+
+
+class MideaMetricSensor(MideaCoordinatorEntity, SensorEntity):
+    """Base class for request metric sensors of Midea AC."""
+
+    _attr_has_entity_name = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+
+    def __init__(self,
+                 coordinator: MideaDeviceUpdateCoordinator,
+                 operation: str,
+                 metric: str,
+                 ) -> None:
+        # Metrics aren't device properties so don't listen for changes
+        MideaCoordinatorEntity.__init__(self, coordinator, [])
+
+        self._operation = operation
+        self._attr_translation_key = f"{operation}_{metric}"
+        self._attr_unique_id = f"{self._device.id}-{operation}_{metric}"
+
+    @property
+    def device_info(self) -> dict:
+        """Return info for device registry."""
+        return {
+            "identifiers": {
+                (DOMAIN, self._device.id)
+            },
+        }
+
+    @property
+    def should_poll(self) -> bool:
+        """Poll the in-memory metrics instead of waiting for device changes."""
+        return True
+
+    async def async_update(self) -> None:
+        """Update the entity without refreshing the device."""
+
+    @property
+    def available(self) -> bool:
+        """Metrics remain available while the device is offline."""
+        return True
+
+    @property
+    def _metrics(self) -> OperationMetrics:
+        """Return the metrics of the operation."""
+        return getattr(self.coordinator, f"{self._operation}_metrics")
+
+
+class MideaLatencySensor(MideaMetricSensor):
+    """Request latency sensor for Midea AC."""
+
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+
+    def __init__(self,
+                 coordinator: MideaDeviceUpdateCoordinator,
+                 operation: str,
+                 ) -> None:
+        MideaMetricSensor.__init__(self, coordinator, operation, "latency")
+
+    @staticmethod
+    def _to_ms(value: float | None) -> float | None:
+        return round(value * 1000) if value is not None else None
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the 95th percentile of the total latency."""
+        return self._to_ms(self._metrics.total.percentile(95))
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Return additional latency percentiles."""
+        metrics = self._metrics
+        return {
+            "count": metrics.total.count,
+            "p50": self._to_ms(metrics.total.percentile(50)),
+            "p95": self._to_ms(metrics.total.percentile(95)),
+            "max": self._to_ms(metrics.total.max),
+            "lock_wait_p95": self._to_ms(metrics.lock_wait.percentile(95)),
+            "request_p95": self._to_ms(metrics.request.percentile(95)),
+        }
+
+
+class MideaErrorCountSensor(MideaMetricSensor):
+    """Request error count sensor for Midea AC."""
+
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+
+    def __init__(self,
+                 coordinator: MideaDeviceUpdateCoordinator,
+                 operation: str,
+                 ) -> None:
+        MideaMetricSensor.__init__(self, coordinator, operation, "errors")
+
+    @property
+    def native_value(self) -> int:
+        """Return the number of failed requests."""
+        return self._metrics.errors
@@ -0,0 +1,142 @@
+"""Domain services for Midea Smart AC."""
+from __future__ import annotations
+
+import logging
+import time
+from asyncio import Semaphore, gather, timeout
+from typing import Any
+
+import voluptuous as vol
+from homeassistant.components.climate import DATA_COMPONENT
+from homeassistant.core import (HomeAssistant, ServiceCall, ServiceResponse,
+                                SupportsResponse, callback)
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.service import async_extract_entity_ids
+
+from .climate import SET_STATE_ATTRS, SET_STATE_FIELDS, MideaClimateDevice
+from .const import (ATTR_MAX_CONCURRENCY, ATTR_RETRIES, ATTR_TIMEOUT, DOMAIN,
+                    GROUP_COMMAND_RETRIES, GROUP_COMMAND_TIMEOUT,
+                    GROUP_MAX_CONCURRENCY)
+
+_LOGGER = logging.getLogger(__name__)
+
+SERVICE_GROUP_SET_STATE = "group_set_state"
+
+GROUP_SET_STATE_SCHEMA = vol.All(
+    cv.make_entity_service_schema({
+        **SET_STATE_FIELDS,
+        vol.Optional(ATTR_MAX_CONCURRENCY, default=GROUP_MAX_CONCURRENCY): vol.All(
+            vol.Coerce(int), vol.Range(min=1)),
+        vol.Optional(ATTR_TIMEOUT, default=GROUP_COMMAND_TIMEOUT): vol.All(
+            vol.Coerce(float), vol.Range(min=1)),
+        vol.Optional(ATTR_RETRIES, default=GROUP_COMMAND_RETRIES): vol.All(
+            vol.Coerce(int), vol.Range(min=0)),
+    }),
+    cv.has_at_least_one_key(*SET_STATE_ATTRS),
+)
+
+
+async def _async_set_entity_state(entity: MideaClimateDevice,
+                                  state: dict[str, Any],
+                                  semaphore: Semaphore,
+                                  command_timeout: float,
+                                  retries: int) -> dict[str, Any]:
+    """Set the state of an entity and return the result."""
+
+    async with semaphore:
+        start = time.monotonic()
+        error = None
+        for attempt in range(1, retries + 2):
+            try:
+                async with timeout(command_timeout):
+                    await entity.async_set_state(**state)
+                error = None
+                break
+            except ServiceValidationError as e:
+                # Invalid values won't succeed on retry
+                error = str(e)
+                break
+            except TimeoutError:
+                error = f"Timed out after {command_timeout} seconds."
+
+                # Retrying would queue another write behind the one still running
+                if entity.coordinator.apply_in_progress:
+                    _LOGGER.debug("Not retrying %s while its write is in progress.",
+                                  entity.entity_id)
+                    break
+            except Exception as e:
+                error = str(e) or type(e).__name__
+
+            _LOGGER.debug("Attempt %d to set state of %s failed: %s",
+                          attempt, entity.entity_id, error)
+
+        return {
+            "success": error is None,
+            "latency": round(time.monotonic() - start, 3),
+            "attempts": attempt,
+            "error": error,
+        }
+
+
+async def _async_group_set_state(call: ServiceCall) -> ServiceResponse:
+    """Set the state of many entities with bounded concurrency."""
+
+    hass = call.hass
+    component = hass.data[DATA_COMPONENT]
+    state = {k: v for k, v in call.data.items() if k in SET_STATE_ATTRS}
+    semaphore = Semaphore(call.data[ATTR_MAX_CONCURRENCY])
+
+    entity_ids = sorted(await async_extract_entity_ids(hass, call))
+    entities = {
+        entity_id: entity for entity_id in entity_ids
+        if isinstance(entity := component.get_entity(entity_id), MideaClimateDevice)
+    }
+
+    results = dict(zip(entities, await gather(*(
+        _async_set_entity_state(entity, state, semaphore,
+                                call.data[ATTR_TIMEOUT], call.data[ATTR_RETRIES])
+        for entity in entities.values()
+    ))))
+
+    # Report targets which aren't Midea climate entities
+    for entity_id in entity_ids:
+        if entity_id not in results:
+            results[entity_id] = {
+                "success": False,
+                "latency": 0.0,
+                "attempts": 0,
+                "error": "Not a Midea Smart AC climate entity.",
+            }
+
+    failed = sum(1 for r in results.values() if not r["success"])
+    _LOGGER.info("Set state of %d entities with %d failure(s).",
+                 len(results), failed)
+
+    return {
+        "succeeded": len(results) - failed,
+        "failed": failed,
+        "results": results,
+    }
+
+
+@callback
+def async_unload_services(hass: HomeAssistant) -> None:
+    """Remove domain services."""
+    hass.services.async_remove(DOMAIN, SERVICE_GROUP_SET_STATE)
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register domain services if not already registered."""
+
+    if hass.services.has_service(DOMAIN, SERVICE_GROUP_SET_STATE):
+        return
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GROUP_SET_STATE,
+        _async_group_set_state,
+        schema=GROUP_SET_STATE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
@@ -0,0 +1,162 @@
+"""Authenticated V3 session management for Midea Smart AC."""
+
+import logging
+import time
+from typing import Any
+
+import msmart.lan
+from msmart.lan import LAN, AuthenticationError
+
+from .const import SESSION_EXPIRATION, SESSION_RENEWAL_FRACTION, MideaDevice
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _get_session_expiration() -> float:
+    """Get the V3 session expiration from msmart, falling back to a default."""
+    try:
+        return msmart.lan._LanProtocolV3.AUTHENTICATION_EXPIRATION.total_seconds()
+    except AttributeError:
+        return SESSION_EXPIRATION
+
+
+def _disconnect(lan: LAN) -> None:
+    """Close a LAN connection so the next request opens a fresh one."""
+    if not callable(disconnect := getattr(lan, "_disconnect", None)):
+        _LOGGER.debug("Unable to close connection, msmart internals changed.")
+        return
+
+    disconnect()
+
+
+class MideaSession:
+    """Authenticated session with a V3 device."""
+
+    def __init__(self, host: str, port: int, token: str, key: str) -> None:
+        self._host = host
+        self._port = port
+        self._token = token
+        self._key = key
+
+        # LAN connection shared by every device object using this session
+        self._lan: LAN | None = None
+        self._authenticated_at: float | None = None
+
+        # Metrics
+        self._handshake_count = 0
+        self._failed_handshake_count = 0
+        self._last_handshake_duration = 0.0
+        self._max_handshake_duration = 0.0
+        self._total_handshake_duration = 0.0
+
+    def matches(self, host: str, port: int, token: str, key: str) -> bool:
+        """Check if the session was created for the same connection and credentials."""
+        return (self._host, self._port, self._token, self._key) == (host, port, token, key)
+
+    def attach(self, device: MideaDevice) -> None:
+        """Share the session's connection with a device."""
+
+        # Devices keep their own connection if msmart internals changed
+        if not isinstance(getattr(device, "_lan", None), LAN):
+            _LOGGER.debug(
+                "Unable to share connection with device ID %s, msmart internals changed.", device.id)
+            return
+
+        if self._lan is None:
+            self._lan = device._lan
+        else:
+            device._lan = self._lan
+
+    @property
+    def age(self) -> float | None:
+        """Return the time in seconds since the last handshake."""
+        if self._authenticated_at is None:
+            return None
+
+        return time.monotonic() - self._authenticated_at
+
+    @property
+    def lifetime(self) -> float:
+        """Return the time in seconds until the session must be renewed."""
+        lifetime = _get_session_expiration()
+
+        # Connections are also re-established after their maximum lifetime
+        if self._lan is not None and (connection_lifetime := getattr(self._lan, "max_connection_lifetime", None)):
+            lifetime = min(lifetime, connection_lifetime)
+
+        return lifetime
+
+    @property
+    def renewal_due(self) -> bool:
+        """Check if the session should be renewed before it expires."""
+        if (age := self.age) is None:
+            return True
+
+        return age >= self.lifetime * SESSION_RENEWAL_FRACTION
+
+    async def async_authenticate(self, device: MideaDevice) -> None:
+        """Perform a handshake with the device on a fresh connection."""
+
+        # Reconnect so the connection lifetime restarts with the session
+        if self._authenticated_at is not None and self._lan is not None:
+            _disconnect(self._lan)
+
+        start = time.monotonic()
+        try:
+            await device.authenticate(self._token, self._key)
+        except AuthenticationError:
+            self._failed_handshake_count += 1
+            raise
+        finally:
+            duration = time.monotonic() - start
+            self._handshake_count += 1
+            self._last_handshake_duration = duration
+            self._max_handshake_duration = max(
+                self._max_handshake_duration, duration)
+            self._total_handshake_duration += duration
+
+        self._authenticated_at = time.monotonic()
+
+    def close(self) -> None:
+        """Close the session's connection."""
+        if self._lan is not None:
+            _disconnect(self._lan)
+        self._authenticated_at = None
+
+    def get_diagnostics(self) -> dict[str, Any]:
+        """Get diagnostic information about the session."""
+        return {
+            "age": self.age,
+            "lifetime": self.lifetime,
+            "renewal_due": self.renewal_due,
+            "handshake_count": self._handshake_count,
+            "failed_handshake_count": self._failed_handshake_count,
+            "last_handshake_duration": self._last_handshake_duration,
+            "max_handshake_duration": self._max_handshake_duration,
+            "average_handshake_duration": self._total_handshake_duration / self._handshake_count if self._handshake_count else 0.0,
+        }
+
+
+class MideaSessionManager:
+    """Keep V3 sessions across config entry reloads."""
+
+    def __init__(self) -> None:
+        self._sessions: dict[int, MideaSession] = {}
+
+    def async_get(self, device_id: int, host: str, port: int, token: str, key: str) -> MideaSession:
+        """Get the session of a device, creating one if needed."""
+
+        # Replace sessions whose connection or credentials changed
+        session = self._sessions.get(device_id)
+        if session is None or not session.matches(host, port, token, key):
+            if session is not None:
+                session.close()
+            session = self._sessions[device_id] = MideaSession(
+                host, port, token, key)
+
+        return session
+
+    def remove(self, device_id: int) -> None:
+        """Close and forget the session of a device."""
+        if (session := self._sessions.pop(device_id, None)) is not None:
+            session.close()
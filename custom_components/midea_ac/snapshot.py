@@ -0,0 +1,119 @@
+"""Persistent device state snapshots for Midea Smart AC."""
+
+import logging
+from asyncio import Lock
+from enum import Enum
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, MideaDevice
+from .properties import discard_updates, is_writable, set_properties
+
+_LOGGER = logging.getLogger(__name__)
+
+_STORAGE_KEY = f"{DOMAIN}.snapshots"
+_STORAGE_VERSION = 1
+_SAVE_DELAY = 60
+
+# Read-only properties and the attributes which back them
+_READ_ONLY_ATTRIBUTES = {
+    "indoor_temperature": "_indoor_temperature",
+    "outdoor_temperature": "_outdoor_temperature",
+    "indoor_humidity": "_indoor_humidity",
+    "display_on": "_display_on",
+    "filter_alert": "_filter_alert",
+    "self_clean_active": "_self_clean_active",
+    "error_code": "_error_code",
+    "total_energy_usage": "_total_energy_usage",
+    "current_energy_usage": "_current_energy_usage",
+    "real_time_power_usage": "_real_time_power_usage",
+}
+
+
+def _serialize_value(value: Any) -> Any:
+    """Convert a snapshot value to a JSON compatible type."""
+    if isinstance(value, Enum):
+        return value.value
+
+    if isinstance(value, tuple):
+        return [_serialize_value(v) for v in value]
+
+    return value
+
+
+class MideaSnapshotStore:
+    """Persist the last known state of devices across restarts."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._store = Store[dict[str, Any]](
+            hass, _STORAGE_VERSION, _STORAGE_KEY)
+        self._load_lock = Lock()
+        self._data: dict[str, Any] | None = None
+
+    async def async_load(self) -> dict[str, Any]:
+        """Load snapshots once for all devices."""
+        async with self._load_lock:
+            if self._data is None:
+                self._data = await self._store.async_load() or {}
+
+        return self._data
+
+    async def async_restore(self, device: MideaDevice) -> bool:
+        """Restore the last saved state of a device."""
+
+        data = await self.async_load()
+        snapshot = data.get(str(device.id))
+        if snapshot is None:
+            return False
+
+        values = {}
+        for prop, value in snapshot.items():
+            # Availability is only known once the device responds
+            if prop == "online":
+                continue
+
+            # Read-only properties are restored to their backing attribute
+            if (attr := _READ_ONLY_ATTRIBUTES.get(prop)) is not None:
+                current = getattr(device, attr, None)
+
+                # Energy properties store a value for each data format
+                if isinstance(current, dict):
+                    if isinstance(value, list):
+                        setattr(device, attr, dict(zip(current, value)))
+                elif hasattr(device, attr):
+                    setattr(device, attr, value)
+                continue
+
+            if not is_writable(device, prop):
+                continue
+
+            # Convert enums back from their values
+            current = getattr(device, prop)
+            if isinstance(current, Enum) and value is not None:
+                try:
+                    value = type(current)(value)
+                except ValueError:
+                    pass
+
+            values[prop] = value
+
+        # Restored values shouldn't be written back to the device
+        set_properties(device, values)
+        discard_updates(device)
+
+        return True
+
+    @callback
+    def async_save(self, device: MideaDevice, snapshot: dict[str, Any]) -> None:
+        """Save the current state of a device."""
+
+        # Snapshots must be loaded first to avoid overwriting other devices
+        if (data := self._data) is None:
+            raise RuntimeError("Snapshots must be loaded before saving.")
+
+        data[str(device.id)] = {
+            prop: _serialize_value(value) for prop, value in snapshot.items()
+        }
+        self._store.async_delay_save(lambda: data, _SAVE_DELAY)
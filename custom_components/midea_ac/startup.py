@@ -0,0 +1,137 @@
+"""Startup coordination across all Midea Smart AC devices."""
+
+import logging
+import time
+from asyncio import Semaphore, timeout
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
+
+from homeassistant.exceptions import ConfigEntryNotReady
+
+from .const import MAX_CONCURRENT_STARTUPS, STARTUP_PHASE_TIMEOUT
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class MideaDeviceStartup:
+    """Timings of a single device startup."""
+
+    def __init__(self, device_id: int, phase_timeout: float) -> None:
+        self._device_id = device_id
+        self._phase_timeout = phase_timeout
+
+        self.queue_delay = 0.0
+        self.duration = 0.0
+        self.phases: dict[str, float] = {}
+        self.result = "pending"
+
+    @property
+    def device_id(self) -> int:
+        """Return the ID of the device."""
+        return self._device_id
+
+    @asynccontextmanager
+    async def async_phase(self, name: str) -> AsyncIterator[None]:
+        """Time a startup phase and limit it to the phase timeout."""
+
+        start = time.monotonic()
+        try:
+            async with timeout(self._phase_timeout):
+                yield
+        except TimeoutError as e:
+            self.result = f"timeout ({name})"
+            raise ConfigEntryNotReady(
+                f"Timed out after {self._phase_timeout} seconds during startup phase '{name}'.") from e
+        finally:
+            self.phases[name] = time.monotonic() - start
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the startup timings as a dictionary."""
+        return {
+            "result": self.result,
+            "queue_delay": self.queue_delay,
+            "duration": self.duration,
+            "phases": dict(self.phases),
+        }
+
+
+class MideaStartupCoordinator:
+    """Limit concurrent device startups and report their timings."""
+
+    def __init__(self,
+                 max_concurrent_startups: int = MAX_CONCURRENT_STARTUPS,
+                 phase_timeout: float = STARTUP_PHASE_TIMEOUT) -> None:
+        self._max_concurrent_startups = max_concurrent_startups
+        self._phase_timeout = phase_timeout
+        self._semaphore = Semaphore(max_concurrent_startups)
+
+        # Latest startup of each device
+        self._startups: dict[int, MideaDeviceStartup] = {}
+
+        # Startups which overlap are summarized together
+        self._in_progress = 0
+        self._batch: list[MideaDeviceStartup] = []
+        self._batch_start = 0.0
+        self._last_summary: dict[str, Any] | None = None
+
+    @asynccontextmanager
+    async def async_startup(self, device_id: int) -> AsyncIterator[MideaDeviceStartup]:
+        """Wait for a startup slot and time the startup of a device."""
+
+        startup = MideaDeviceStartup(device_id, self._phase_timeout)
+        self._startups[device_id] = startup
+
+        # Start a new batch if no other startups are running
+        start = time.monotonic()
+        if not self._in_progress:
+            self._batch = []
+            self._batch_start = start
+        self._in_progress += 1
+        self._batch.append(startup)
+
+        try:
+            async with self._semaphore:
+                startup.queue_delay = time.monotonic() - start
+                try:
+                    yield startup
+                except BaseException:
+                    if startup.result == "pending":
+                        startup.result = "failed"
+                    raise
+
+                startup.result = "ok"
+        finally:
+            startup.duration = time.monotonic() - start
+            self._in_progress -= 1
+            if not self._in_progress:
+                self._summarize()
+
+    def _summarize(self) -> None:
+        """Log a summary of the last batch of startups."""
+
+        duration = time.monotonic() - self._batch_start
+        startups = sorted(
+            self._batch, key=lambda s: s.duration, reverse=True)
+        failed = [s for s in startups if s.result != "ok"]
+
+        self._last_summary = {
+            "devices": len(startups),
+            "failed": len(failed),
+            "duration": duration,
+            "startups": {s.device_id: s.as_dict() for s in startups},
+        }
+
+        _LOGGER.info("Started %d device(s) in %.2f seconds with %d failure(s): %s.",
+                     len(startups), duration, len(failed),
+                     ", ".join(f"{s.device_id} {s.duration:.2f} s {s.result}" for s in startups))
+
+    def get_diagnostics(self, device_id: int) -> dict[str, Any]:
+        """Get diagnostic information about the startup of a device."""
+        startup = self._startups.get(device_id)
+        return {
+            "max_concurrent_startups": self._max_concurrent_startups,
+            "phase_timeout": self._phase_timeout,
+            "in_progress": self._in_progress,
+            "device": startup.as_dict() if startup else None,
+            "last_summary": self._last_summary,
+        }
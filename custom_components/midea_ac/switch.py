@@ -12,6 +12,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN
 from .coordinator import MideaCoordinatorEntity, MideaDeviceUpdateCoordinator
+from .features import get_supported_switches
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -30,41 +31,32 @@ async def async_setup_entry(
     device = coordinator.device
 
     # Create switches for supported features
+    supported = get_supported_switches(device)
     entities = []
-    if hasattr(device, "toggle_display"):
-        # TODO Check supports_display_control ?
+    if "display" in supported:
         entities.append(MideaDisplaySwitch(coordinator))
-        entities.append(MideaFollowMeSwitch(coordinator))
-
-    if hasattr(device, "breeze_away") and getattr(device, "supports_breeze_away", False):
-        entities.append(MideaSwitch(coordinator, "breeze_away"))
-
-    if hasattr(device, "breeze_mild") and getattr(device, "supports_breeze_mild_away", False):
-        entities.append(MideaSwitch(coordinator, "breeze_mild"))
 
-    if hasattr(device, "breezeless") and getattr(device, "supports_breezeless", False):
-        entities.append(MideaSwitch(coordinator, "breezeless"))
-
-    if hasattr(device, "flash_cool") and getattr(device, "supports_flash_cool", False):
-        entities.append(MideaSwitch(coordinator, "flash_cool"))
-
-    if hasattr(device, "purifier"):
-        # AC has on/off purifier
-        if getattr(device, "supports_purifier", False):
-            entities.append(MideaSwitch(coordinator,
-                                        "purifier",
-                                        entity_category=EntityCategory.CONFIG))
+    if "follow_me" in supported:
+        entities.append(MideaFollowMeSwitch(coordinator))
 
-        # Create switch for CC purifier if only 2 modes supported
-        if len(getattr(device, "supported_purifier_modes", [])) == 2:
-            device_class = type(device)
-            entities.append(MideaSwitch(coordinator,
-                                        "purifier",
-                                        entity_category=EntityCategory.CONFIG,
-                                        state_map={
-                                            False: device_class.PurifierMode.OFF,
-                                            True: device_class.PurifierMode.ON,
-                                        }))
+    for prop in ["breeze_away", "breeze_mild", "breezeless", "flash_cool"]:
+        if prop in supported:
+            entities.append(MideaSwitch(coordinator, prop))
+
+    if "purifier" in supported:
+        entities.append(MideaSwitch(coordinator,
+                                    "purifier",
+                                    entity_category=EntityCategory.CONFIG))
+
+    if "purifier_mode" in supported:
+        device_class = type(device)
+        entities.append(MideaSwitch(coordinator,
+                                    "purifier",
+                                    entity_category=EntityCategory.CONFIG,
+                                    state_map={
+                                        False: device_class.PurifierMode.OFF,
+                                        True: device_class.PurifierMode.ON,
+                                    }))
 
     add_entities(entities)
 
@@ -75,7 +67,7 @@ class MideaDisplaySwitch(MideaCoordinatorEntity, SwitchEntity):
     _attr_translation_key = "display"
 
     def __init__(self, coordinator: MideaDeviceUpdateCoordinator) -> None:
-        MideaCoordinatorEntity.__init__(self, coordinator)
+        MideaCoordinatorEntity.__init__(self, coordinator, ["display_on"])
 
     async def _toggle_display(self) -> None:
         await self._device.toggle_display()
@@ -128,7 +120,7 @@ class MideaFollowMeSwitch(MideaCoordinatorEntity, SwitchEntity):
     _attr_translation_key = "follow_me"
 
     def __init__(self, coordinator: MideaDeviceUpdateCoordinator) -> None:
-        MideaCoordinatorEntity.__init__(self, coordinator)
+        MideaCoordinatorEntity.__init__(self, coordinator, ["follow_me"])
 
     async def _set_state(self, state) -> None:
         """Set the state of the property controlled by the switch."""
@@ -193,7 +185,8 @@ class MideaSwitch(MideaCoordinatorEntity, SwitchEntity):
                  state_map: Mapping[bool, Any] | None = None
                  ) -> None:
 
-        MideaCoordinatorEntity.__init__(self, coordinator)
+        MideaCoordinatorEntity.__init__(
+            self, coordinator, [prop, "power_state"])
 
         self._prop = prop
         self._entity_category = entity_category
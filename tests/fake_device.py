@@ -0,0 +1,490 @@
+"""Simulated Midea devices speaking the LAN protocol for tests and benchmarks."""
+
+import asyncio
+import logging
+import os
+import random
+import struct
+from dataclasses import dataclass
+from hashlib import sha256
+
+import msmart.crc8 as crc8
+from Crypto.Util.strxor import strxor
+from msmart.const import DeviceType, FrameType
+from msmart.frame import Frame
+from msmart.lan import Security, _LanProtocolV3, _Packet
+
+_LOGGER = logging.getLogger(__name__)
+
+_PacketType = _LanProtocolV3.PacketType
+
+# Capabilities reported by fake ACs: heat, cool, dry and auto modes,
+# low/medium/high/auto fan speeds, vertical swing, eco and 16-30 C range
+_AC_CAPABILITIES = bytes([
+    0xB5, 0x05,
+    0x14, 0x02, 0x01, 0x01,  # Modes
+    0x10, 0x02, 0x01, 0x05,  # Fan speeds
+    0x15, 0x02, 0x01, 0x00,  # Swing modes
+    0x12, 0x02, 0x01, 0x01,  # Eco
+    0x25, 0x02, 0x07, 0x20, 0x3C, 0x20, 0x3C, 0x20, 0x3C, 0x00,  # Temperatures
+    0x00, 0x00,
+])
+
+
+@dataclass
+class FakeNetworkConditions:
+    """Network conditions simulated by a fake device."""
+
+    # Seconds before each response is sent
+    latency: float = 0.0
+    # Maximum random seconds added to or removed from the latency
+    jitter: float = 0.0
+    # Probability of a request being dropped without a response
+    packet_loss: float = 0.0
+    # Probability of the connection being closed instead of responding
+    disconnect_rate: float = 0.0
+
+
+class FakeAirConditioner:
+    """Simulated state of an air conditioner (0xAC)."""
+
+    device_type = DeviceType.AIR_CONDITIONER
+
+    def __init__(self) -> None:
+        self.power_on = False
+        self.target_temperature = 24.0
+        self.operational_mode = 2  # Cool
+        self.fan_speed = 102  # Auto
+        self.swing_mode = 0
+        self.eco = False
+        self.turbo = False
+        self.sleep = False
+        self.follow_me = False
+        self.purifier = False
+        self.freeze_protection = False
+        self.display_on = True
+        self.indoor_temperature = 24.0
+        self.outdoor_temperature = 30.0
+        self.target_humidity = 40
+        self.total_energy = 0.0
+        self.power = 0.0
+
+        # Number of frames received by type
+        self.query_count = 0
+        self.control_count = 0
+
+    def _response(self, frame_type: FrameType, body: bytes) -> bytes:
+        """Build a response frame with a payload CRC."""
+        return Frame(self.device_type, frame_type).tobytes(body + bytes([crc8.calculate(body)]))
+
+    def _state(self) -> bytes:
+        """Build a state response."""
+
+        fractional = self.target_temperature % 1
+        integral = int(self.target_temperature)
+        if 17 <= integral <= 30:
+            temperature, temperature_alt = (integral - 16) & 0xF, 0
+        else:
+            temperature, temperature_alt = 0, (integral - 12) & 0x1F
+
+        body = bytearray(24)
+        body[0] = 0xC0
+        body[1] = 0x1 if self.power_on else 0
+        body[2] = (temperature | (0x10 if fractional else 0)
+                   | (self.operational_mode & 0x7) << 5)
+        body[3] = self.fan_speed & 0x7F
+        body[7] = self.swing_mode & 0xF
+        body[8] = (0x20 if self.turbo else 0) | (
+            0x80 if self.follow_me else 0)
+        body[9] = (0x10 if self.eco else 0) | (0x20 if self.purifier else 0)
+        body[10] = 0x1 if self.sleep else 0
+        body[11] = int(self.indoor_temperature * 2 + 50)
+        body[12] = int(self.outdoor_temperature * 2 + 50)
+        body[13] = temperature_alt
+        body[14] = 0 if self.display_on else 0x70
+        body[19] = self.target_humidity & 0x7F
+        body[21] = 0x80 if self.freeze_protection else 0
+
+        return self._response(FrameType.QUERY, bytes(body))
+
+    def _set_state(self, body: bytes) -> None:
+        """Update the state from a set state command."""
+
+        self.power_on = bool(body[1] & 0x1)
+        self.operational_mode = (body[2] >> 5) & 0x7
+        self.target_temperature = (body[2] & 0xF) + 16.0
+        if temperature_alt := body[18] & 0x1F:
+            self.target_temperature = temperature_alt + 12.0
+        self.target_temperature += 0.5 if body[2] & 0x10 else 0.0
+        self.fan_speed = body[3] & 0x7F
+        self.swing_mode = body[7] & 0xF
+        self.follow_me = bool(body[8] & 0x80)
+        self.turbo = bool(body[8] & 0x20 or body[10] & 0x2)
+        self.eco = bool(body[9] & 0x80)
+        self.purifier = bool(body[9] & 0x20)
+        self.sleep = bool(body[10] & 0x1)
+        self.target_humidity = body[19] & 0x7F
+        self.freeze_protection = bool(body[21] & 0x80)
+
+    def _group_data(self, group: int) -> bytes:
+        """Build an energy or humidity group data response."""
+
+        def bcd(value: int) -> int:
+            return (value // 10) << 4 | value % 10
+
+        body = bytearray(24)
+        body[0] = 0xC1
+        body[3] = group
+        if group == 0x44:
+            # Total energy in hundredths of kWh and power in tenths of W
+            energy = int(self.total_energy * 100)
+            body[4:8] = bytes(bcd(energy // 100 ** i % 100)
+                              for i in range(3, -1, -1))
+            power = int(self.power * 10)
+            body[16:19] = bytes(bcd(power // 100 ** i % 100)
+                                for i in range(2, -1, -1))
+        elif group == 0x45:
+            body[4] = self.target_humidity
+
+        return self._response(FrameType.QUERY, bytes(body))
+
+    def handle(self, frame: bytes) -> bytes | None:
+        """Handle a command frame and return the response frame if any."""
+
+        frame_type = frame[9]
+        body = frame[10:-1]
+
+        if frame_type == FrameType.QUERY:
+            self.query_count += 1
+        else:
+            self.control_count += 1
+
+        if body[0] == 0xB5:
+            return self._response(FrameType.QUERY, _AC_CAPABILITIES)
+
+        if body[0] == 0x41 and body[1] == 0x21:
+            return self._group_data(body[3])
+
+        if body[0] == 0x41:
+            # Display toggle is sent as a query
+            if body[4] == 0x02:
+                self.display_on = not self.display_on
+            return self._state()
+
+        if body[0] == 0x40:
+            self._set_state(body)
+            return self._state()
+
+        if body[0] in (0xB0, 0xB1):
+            # No properties are supported
+            return self._response(FrameType(frame_type), bytes([body[0], 0]))
+
+        return None
+
+
+class FakeCommercialAirConditioner:
+    """Simulated state of a commercial air conditioner (0xCC)."""
+
+    device_type = DeviceType.COMMERCIAL_AC
+
+    def __init__(self) -> None:
+        # Current value of each control ID
+        self.controls = {
+            0x0000: 0,  # Power
+            0x0003: 128,  # Target temperature of 24 C
+            0x0012: 2,  # Cool
+            0x0015: 8,  # Auto fan speed
+            0x001C: 0,  # Vertical swing angle
+            0x001E: 0,  # Horizontal swing angle
+            0x0028: 0,  # Eco
+            0x002A: 0,  # Silent
+            0x002C: 0,  # Sleep
+            0x003A: 2,  # Purifier off
+            0x003F: 0,  # Beep
+            0x0040: 1,  # Display
+            0x0043: 2,  # Aux mode off
+        }
+        self.indoor_temperature = 24.0
+
+        # Number of frames received by type
+        self.query_count = 0
+        self.control_count = 0
+
+    def _query(self) -> bytes:
+        """Build a query response which includes the capabilities."""
+
+        controls = self.controls
+        body = bytearray(90)
+        body[0:2] = b"\x01\xfe"
+        body[8] = controls[0x0000]
+        body[9], body[10] = 114, 140  # 17 - 30 C
+        body[11] = controls[0x0003]
+        body[12:14] = int(self.indoor_temperature * 10).to_bytes(2, "big")
+        body[25] = 0xFF
+        body[26:31] = bytes([1, 2, 3, 5, 6])
+        body[31] = controls[0x0012]
+        body[32] = 1
+        body[34] = controls[0x0015]
+        body[40], body[41] = 1, controls[0x001C]
+        body[42], body[43] = 1, controls[0x001E]
+        body[55], body[56] = 1, controls[0x0028]
+        body[57], body[58] = 1, controls[0x002A]
+        body[59], body[60] = 1, controls[0x002C]
+        body[73], body[75] = 1, controls[0x003A]
+        body[80], body[81] = controls[0x003F], controls[0x0040]
+        body[82], body[83:87] = 1, bytes([0, 1, 2, 0])
+        body[87] = controls[0x0043]
+
+        return Frame(self.device_type, FrameType.QUERY).tobytes(bytes(body))
+
+    def _control(self, body: bytes) -> bytes:
+        """Apply controls and echo them back."""
+
+        # Each entry is a 2 byte ID, 1 byte size, value and 0xFF terminator
+        response = bytearray()
+        while len(body) >= 5:
+            (control, ) = struct.unpack(">H", body[0:2])
+            size = body[2]
+            value = body[3:3+size]
+            if size:
+                self.controls[control] = value[0]
+            response += body[0:3] + value + b"\xff"
+            body = body[4+size:]
+
+        return Frame(self.device_type, FrameType.CONTROL).tobytes(bytes(response))
+
+    def handle(self, frame: bytes) -> bytes | None:
+        """Handle a command frame and return the response frame if any."""
+
+        frame_type = frame[9]
+
+        if frame_type == FrameType.QUERY:
+            self.query_count += 1
+            return self._query()
+
+        if frame_type == FrameType.CONTROL:
+            self.control_count += 1
+            # Strip message ID and CRC
+            return self._control(frame[10:-3])
+
+        return None
+
+
+FakeDevice = FakeAirConditioner | FakeCommercialAirConditioner
+
+
+class _FakeLanProtocol(asyncio.Protocol):
+    """Server side of the Midea LAN protocol."""
+
+    def __init__(self, server: "FakeMideaServer") -> None:
+        self._server = server
+        self._transport: asyncio.Transport | None = None
+        self._buffer = bytearray()
+        self._local_key: bytes | None = None
+        self._tasks: set[asyncio.Task] = set()
+
+    def connection_made(self, transport) -> None:
+        self._transport = transport
+        self._server._connections.add(self)
+
+    def connection_lost(self, exc) -> None:
+        self._server._connections.discard(self)
+        for task in self._tasks:
+            task.cancel()
+
+    def close(self) -> None:
+        """Close the connection to the client."""
+        if self._transport is not None:
+            self._transport.close()
+
+    def data_received(self, data: bytes) -> None:
+        self._buffer += data
+
+        # Split the buffer into V2 or V3 packets
+        while len(self._buffer) >= 6:
+            if self._buffer[:2] == b"\x83\x70":
+                size = int.from_bytes(self._buffer[2:4], "big") + 8
+            elif self._buffer[:2] == b"\x5a\x5a":
+                size = int.from_bytes(self._buffer[4:6], "little")
+            else:
+                _LOGGER.warning("Discarding unknown data: %s",
+                                self._buffer.hex())
+                self._buffer.clear()
+                return
+
+            if len(self._buffer) < size:
+                return
+
+            packet = bytes(self._buffer[:size])
+            del self._buffer[:size]
+
+            task = asyncio.get_running_loop().create_task(self._async_handle(packet))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _async_handle(self, packet: bytes) -> None:
+        """Respond to a packet under the simulated network conditions."""
+
+        conditions = self._server.conditions
+        rand = self._server._random
+        self._server.request_count += 1
+
+        if rand.random() < conditions.disconnect_rate:
+            self._server.disconnect_count += 1
+            self.close()
+            return
+
+        if rand.random() < conditions.packet_loss:
+            self._server.dropped_count += 1
+            return
+
+        delay = conditions.latency + \
+            rand.uniform(-conditions.jitter, conditions.jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        if (response := self._process(packet)) is not None and self._transport and not self._transport.is_closing():
+            self._transport.write(response)
+
+    def _process(self, packet: bytes) -> bytes | None:
+        """Process a packet and return the response packet if any."""
+
+        if packet[:2] == b"\x5a\x5a":
+            # V3 devices don't accept unencrypted packets
+            if self._server.token is not None:
+                return None
+
+            return self._process_frame(packet)
+
+        packet_type = packet[5] & 0xF
+        if packet_type == _PacketType.HANDSHAKE_REQUEST:
+            return self._handshake(packet[8:])
+
+        if packet_type == _PacketType.ENCRYPTED_REQUEST and self._local_key is not None:
+            # Decrypt and verify the payload
+            header, payload = packet[:6], Security.decrypt_aes_cbc(
+                self._local_key, packet[6:-32])
+            if sha256(header + payload).digest() != packet[-32:]:
+                return self._encode(_PacketType.ERROR, b"")
+
+            pad = header[5] >> 4
+            if (response := self._process_frame(payload[2:len(payload)-pad])) is None:
+                return None
+
+            return self._encode(_PacketType.ENCRYPTED_RESPONSE, response)
+
+        return self._encode(_PacketType.ERROR, b"")
+
+    def _process_frame(self, packet: bytes) -> bytes | None:
+        """Pass a V2 packet to the device and wrap the response."""
+        if (response := self._server.device.handle(_Packet.decode(packet))) is None:
+            return None
+
+        return _Packet.encode(self._server.device_id, response)
+
+    def _handshake(self, token: bytes) -> bytes:
+        """Authenticate a client and generate the session key."""
+
+        if token != self._server.token:
+            self._server.failed_handshake_count += 1
+            return self._encode(_PacketType.ERROR, b"")
+
+        assert self._server.key is not None
+
+        self._server.handshake_count += 1
+        data = os.urandom(32)
+        self._local_key = strxor(data, self._server.key)
+        return self._encode(_PacketType.HANDSHAKE_RESPONSE,
+                            Security.encrypt_aes_cbc(self._server.key, data) + sha256(data).digest())
+
+    def _encode(self, packet_type: _PacketType, data: bytes) -> bytes:
+        """Encode a V3 packet."""
+
+        if packet_type != _PacketType.ENCRYPTED_RESPONSE:
+            header = b"\x83\x70" + len(data).to_bytes(2, "big") + \
+                bytes([0x20, packet_type])
+            return header + bytes(2) + data
+
+        assert self._local_key is not None
+
+        # Pad the packet ID and data to the block size
+        pad = (16 - (len(data) + 2) % 16) % 16
+        header = b"\x83\x70" + (len(data) + pad + 32).to_bytes(2, "big") + \
+            bytes([0x20, pad << 4 | packet_type])
+        payload = bytes(2) + data + bytes(pad)
+        return header + Security.encrypt_aes_cbc(self._local_key, payload) + sha256(header + payload).digest()
+
+
+class FakeMideaServer:
+    """Local server simulating a Midea device on the LAN.
+
+    Devices use the V3 protocol if a token and key are provided, otherwise V2.
+    """
+
+    def __init__(self,
+                 device: FakeDevice,
+                 device_id: int = 1234,
+                 *,
+                 token: bytes | None = None,
+                 key: bytes | None = None,
+                 conditions: FakeNetworkConditions | None = None,
+                 seed: int | None = None) -> None:
+        self.device = device
+        self.device_id = device_id
+        self.token = token
+        self.key = key
+        self.conditions = conditions or FakeNetworkConditions()
+
+        self._random = random.Random(seed)
+        self._server: asyncio.Server | None = None
+        self._connections: set[_FakeLanProtocol] = set()
+
+        self.request_count = 0
+        self.dropped_count = 0
+        self.disconnect_count = 0
+        self.handshake_count = 0
+        self.failed_handshake_count = 0
+
+    @classmethod
+    def generate_credentials(cls) -> tuple[bytes, bytes]:
+        """Generate a random V3 token and key."""
+        return os.urandom(64), os.urandom(32)
+
+    @property
+    def host(self) -> str:
+        return "127.0.0.1"
+
+    @property
+    def port(self) -> int:
+        assert self._server is not None
+        return self._server.sockets[0].getsockname()[1]
+
+    @property
+    def connection_count(self) -> int:
+        return len(self._connections)
+
+    async def start(self) -> None:
+        """Start listening on a free local port."""
+        loop = asyncio.get_running_loop()
+        self._server = await loop.create_server(
+            lambda: _FakeLanProtocol(self), self.host, 0)
+
+    def disconnect(self) -> None:
+        """Close all client connections."""
+        for connection in list(self._connections):
+            connection.close()
+
+    async def stop(self) -> None:
+        """Close all connections and stop listening."""
+        self.disconnect()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self) -> "FakeMideaServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.stop()
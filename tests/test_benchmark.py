@@ -0,0 +1,184 @@
+"""Benchmarks of many config entries against simulated devices.
+
+Set MIDEA_BENCHMARK=1 to run with 10, 100 and 500 entries. Results of each
+run are appended as a JSON line to the file in MIDEA_BENCHMARK_OUTPUT.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import statistics
+import time
+import tracemalloc
+from typing import Any
+
+import pytest
+from homeassistant.const import (CONF_HOST, CONF_ID, CONF_PORT, CONF_TOKEN,
+                                 EVENT_STATE_CHANGED)
+from homeassistant.core import Event, HomeAssistant
+from homeassistant.setup import async_setup_component
+from msmart.const import DeviceType
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.midea_ac.const import CONF_DEVICE_TYPE, CONF_KEY, DOMAIN
+
+from .fake_device import FakeAirConditioner, FakeMideaServer
+
+_LOGGER = logging.getLogger(__name__)
+
+_BENCHMARK = pytest.mark.skipif(
+    not os.environ.get("MIDEA_BENCHMARK"), reason="Set MIDEA_BENCHMARK=1 to run benchmarks.")
+
+# Number of commands issued during a poll cycle
+_COMMAND_COUNT = 10
+
+# Interval of the event loop lag sampler
+_LAG_INTERVAL = 0.01
+
+
+@pytest.fixture(autouse=True)
+def auto_socket_enabled(socket_enabled) -> None:
+    """Allow connections to the local fake devices."""
+
+
+def _summarize(values: list[float]) -> dict[str, Any]:
+    """Summarize a list of timings."""
+    if not values:
+        return {"count": 0, "p50": None, "p95": None, "max": None}
+
+    values = sorted(values)
+    return {
+        "count": len(values),
+        "p50": values[int(0.5 * (len(values) - 1))],
+        "p95": values[int(0.95 * (len(values) - 1))],
+        "max": values[-1],
+        "mean": statistics.fmean(values),
+    }
+
+
+async def _sample_loop_lag(lags: list[float]) -> None:
+    """Record how late the event loop wakes a sleeping task."""
+    loop = asyncio.get_running_loop()
+    while True:
+        start = loop.time()
+        await asyncio.sleep(_LAG_INTERVAL)
+        lags.append(max(0.0, loop.time() - start - _LAG_INTERVAL))
+
+
+def _write_results(results: dict[str, Any]) -> None:
+    """Log results and append them to the output file if configured."""
+    line = json.dumps(results, sort_keys=True)
+    _LOGGER.info("Benchmark results: %s", line)
+
+    if (path := os.environ.get("MIDEA_BENCHMARK_OUTPUT")):
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+
+
+@pytest.mark.parametrize("entry_count", [
+    2,
+    pytest.param(10, marks=_BENCHMARK),
+    pytest.param(100, marks=_BENCHMARK),
+    pytest.param(500, marks=_BENCHMARK),
+])
+async def test_benchmark(hass: HomeAssistant, entry_count: int) -> None:
+    """Benchmark setup, polling and commands with many devices."""
+
+    # Start a simulated device for each entry
+    servers = [FakeMideaServer(FakeAirConditioner(), 1000 + i)
+               for i in range(entry_count)]
+    await asyncio.gather(*(server.start() for server in servers))
+
+    entries = []
+    for server in servers:
+        entry = MockConfigEntry(
+            domain=DOMAIN,
+            unique_id=str(server.device_id),
+            data={
+                CONF_ID: str(server.device_id),
+                CONF_HOST: server.host,
+                CONF_PORT: server.port,
+                CONF_TOKEN: None,
+                CONF_KEY: None,
+                CONF_DEVICE_TYPE: DeviceType.AIR_CONDITIONER,
+            },
+        )
+        entry.add_to_hass(hass)
+        entries.append(entry)
+
+    # Set up all entries while tracking allocated memory
+    tracemalloc.start()
+    memory_start = tracemalloc.get_traced_memory()[0]
+    start = time.monotonic()
+    assert await async_setup_component(hass, DOMAIN, {})
+    await hass.async_block_till_done()
+    setup_time = time.monotonic() - start
+    memory = tracemalloc.get_traced_memory()[0] - memory_start
+    tracemalloc.stop()
+
+    coordinators = [hass.data[DOMAIN][entry.entry_id] for entry in entries]
+    assert all(c.device.online for c in coordinators)
+    entity_count = len(hass.states.async_all())
+
+    # Count state writes during the poll cycle
+    state_writes = 0
+
+    def _count_state_write(event: Event) -> None:
+        nonlocal state_writes
+        state_writes += 1
+
+    unsub = hass.bus.async_listen(EVENT_STATE_CHANGED, _count_state_write)
+
+    lags: list[float] = []
+    lag_task = hass.async_create_background_task(
+        _sample_loop_lag(lags), "loop lag sampler")
+
+    # Change the state of every device so each poll writes entity states
+    for server in servers:
+        server.device.indoor_temperature += 1
+
+    async def _command(coordinator) -> float:
+        start = time.monotonic()
+        coordinator.device.target_temperature = 20
+        await coordinator.apply()
+        return time.monotonic() - start
+
+    # Run a scheduled poll of every device now while commands are issued
+    for coordinator in coordinators:
+        coordinator._unschedule_refresh()
+
+    start = time.monotonic()
+    poll_cycle = asyncio.gather(
+        *(c._handle_refresh_interval() for c in coordinators))
+    command_latencies = await asyncio.gather(
+        *(_command(c) for c in coordinators[:_COMMAND_COUNT]))
+    await poll_cycle
+    poll_cycle_time = time.monotonic() - start
+    await hass.async_block_till_done()
+
+    unsub()
+    lag_task.cancel()
+
+    _write_results({
+        "entries": entry_count,
+        "entities": entity_count,
+        "setup_time": setup_time,
+        "poll_cycle_time": poll_cycle_time,
+        "command_latency": _summarize(command_latencies),
+        "loop_lag": _summarize(lags),
+        "state_writes": state_writes,
+        "state_writes_per_second": state_writes / poll_cycle_time,
+        "memory_per_device": memory / entry_count,
+        "memory_per_entity": memory / entity_count,
+    })
+
+    assert all(server.device.control_count == 1
+               and server.device.target_temperature == 20
+               for server in servers[:_COMMAND_COUNT])
+
+    for entry in entries:
+        assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+    await asyncio.gather(*(server.stop() for server in servers))
@@ -0,0 +1,81 @@
+"""Tests for the capability cache."""
+
+from unittest.mock import patch
+
+from homeassistant.core import HomeAssistant
+from msmart.device import AirConditioner as AC
+from msmart.device.AC.command import Response
+
+from custom_components.midea_ac.capabilities import MideaCapabilityStore
+
+_TEST_CAPABILITIES_RESPONSE = bytes.fromhex(
+    "aa29ac00000000000303b5071202010113020101140201011502010116020101170201001a020101dedb")
+
+
+async def _mock_get_capabilities(device: AC) -> None:
+    """Update device capabilities from a known response."""
+    device._update_capabilities(
+        Response.construct(_TEST_CAPABILITIES_RESPONSE))
+
+
+async def test_capabilities_cached(
+    hass: HomeAssistant,
+) -> None:
+    """Test capabilities are cached and restored for the same device."""
+
+    store = MideaCapabilityStore(hass)
+
+    device = AC("0.0.0.0", 1234, 6444)
+    with patch.object(AC, "get_capabilities", _mock_get_capabilities):
+        # Initial query changes capabilities
+        assert await store.async_update(device, 3)
+
+        # Subsequent query reports no change
+        assert not await store.async_update(device, 3)
+
+    # Capabilities are restored to a new device without a query
+    restored = AC("0.0.0.0", 1234, 6444)
+    assert await store.async_restore(restored, 3)
+    assert restored.capabilities_dict() == device.capabilities_dict()
+
+    # Other devices aren't restored
+    assert not await store.async_restore(AC("0.0.0.0", 5678, 6444), 3)
+
+
+async def test_capabilities_cache_invalidated(
+    hass: HomeAssistant,
+) -> None:
+    """Test cached capabilities are ignored after a version change."""
+
+    store = MideaCapabilityStore(hass)
+
+    device = AC("0.0.0.0", 1234, 6444)
+    with patch.object(AC, "get_capabilities", _mock_get_capabilities):
+        await store.async_update(device, 3)
+
+    with patch("custom_components.midea_ac.capabilities.MSMART_VERSION", "0.0.0"):
+        assert not await store.async_restore(AC("0.0.0.0", 1234, 6444), 3)
+
+    # Changing the configured protocol also invalidates the cache
+    assert not await store.async_restore(AC("0.0.0.0", 1234, 6444), 2)
+    assert await store.async_restore(AC("0.0.0.0", 1234, 6444), 3)
+
+
+async def test_capabilities_cache_invalid(
+    hass: HomeAssistant,
+) -> None:
+    """Test invalid cached capabilities are ignored."""
+
+    store = MideaCapabilityStore(hass)
+
+    device = AC("0.0.0.0", 1234, 6444)
+    with patch.object(AC, "get_capabilities", _mock_get_capabilities):
+        await store.async_update(device, 3)
+
+    # Cached data which can't be applied falls back to a query
+    with patch.object(AC, "_update_capabilities", side_effect=AttributeError):
+        assert not await store.async_restore(AC("0.0.0.0", 1234, 6444), 3)
+
+    # Corrupt cached data is also ignored
+    store._data["1234"]["capabilities"] = {"raw": None}
+    assert not await store.async_restore(AC("0.0.0.0", 1234, 6444), 3)
@@ -9,6 +9,7 @@ from homeassistant.components.climate.const import (PRESET_ECO, PRESET_SLEEP,
                                                     ClimateEntityFeature,
                                                     HVACMode)
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ServiceValidationError
 from msmart.device import AirConditioner as AC
 from msmart.device import CommercialAirConditioner as CC
 from msmart.utils import MideaIntEnum
@@ -54,6 +55,9 @@ async def test_base_config(
     assert climate_device.min_temp == config.min_target_temperature
     assert climate_device.max_temp == config.max_target_temperature
 
+    # Assert refreshes are left to the coordinator's schedule
+    assert not climate_device.should_poll
+
     # Assert HVAC modes is defined and OFF is always present
     assert climate_device.hvac_modes is not None
     assert HVACMode.OFF in climate_device.hvac_modes
@@ -236,3 +240,74 @@ async def test_preset_modes(
     # Assert configured modes are present
     for k, _ in config_modes.items():
         assert k in climate_device.preset_modes
+
+
+async def test_set_temperature_with_hvac_mode(
+    hass: HomeAssistant,
+):
+    """Test setting temperature and HVAC mode together applies once"""
+
+    # Mock the device
+    mock_device = AC("0.0.0.0", 0, 0)
+
+    # Mock the coordinator
+    mock_coordinator = MagicMock()
+    mock_coordinator.apply = AsyncMock()
+    mock_coordinator.device = mock_device
+
+    climate_device = MideaClimateACDevice(hass, mock_coordinator, {})
+
+    await climate_device.async_set_temperature(
+        temperature=22.3, hvac_mode=HVACMode.COOL)
+
+    # Assert both properties were updated in a single apply
+    assert mock_device.target_temperature == 22.5
+    assert mock_device.power_state is True
+    assert mock_device.operational_mode == AC.OperationalMode.COOL
+    mock_coordinator.apply.assert_awaited_once()
+
+
+async def test_set_state(
+    hass: HomeAssistant,
+):
+    """Test setting multiple properties validates them and applies once"""
+
+    # Mock the device
+    mock_device = AC("0.0.0.0", 0, 0)
+    mock_device._supports_eco = True
+    mock_device._supported_op_modes = [
+        AC.OperationalMode.COOL, AC.OperationalMode.HEAT]
+
+    # Mock the coordinator
+    mock_coordinator = MagicMock()
+    mock_coordinator.apply = AsyncMock()
+    mock_coordinator.device = mock_device
+
+    climate_device = MideaClimateACDevice(hass, mock_coordinator, {})
+
+    await climate_device.async_set_state(
+        hvac_mode=HVACMode.COOL,
+        temperature=21.2,
+        fan_mode="high",
+        preset_mode=PRESET_ECO,
+    )
+
+    # Assert all properties were updated in a single apply
+    assert mock_device.power_state is True
+    assert mock_device.operational_mode == AC.OperationalMode.COOL
+    assert mock_device.target_temperature == 21.0
+    assert mock_device.fan_speed == AC.FanSpeed.HIGH
+    assert mock_device.eco is True
+    mock_coordinator.apply.assert_awaited_once()
+
+    # Assert unsupported values are rejected without changing the device
+    with pytest.raises(ServiceValidationError):
+        await climate_device.async_set_state(
+            hvac_mode=HVACMode.HEAT, fan_mode="invalid")
+
+    with pytest.raises(ServiceValidationError):
+        await climate_device.async_set_state(
+            hvac_mode=HVACMode.HEAT, temperature=50)
+
+    assert mock_device.operational_mode == AC.OperationalMode.COOL
+    mock_coordinator.apply.assert_awaited_once()
@@ -2,15 +2,20 @@
 
 import asyncio
 import logging
+from contextlib import asynccontextmanager
+from datetime import timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from homeassistant.config_entries import ConfigEntryState
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from msmart.device import AirConditioner as AC
 from msmart.lan import _LanProtocol
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.midea_ac.const import DOMAIN
+from custom_components.midea_ac.coordinator import MideaDeviceUpdateCoordinator
 
 
 async def _setup_integration(hass: HomeAssistant, mock_config_entry: MockConfigEntry) -> MockConfigEntry:
@@ -68,14 +73,14 @@ async def test_concurrent_network_access_exception(
     # logging.getLogger("msmart").setLevel(logging.DEBUG)
     # logging.getLogger("custom_components.midea_ac").setLevel(logging.DEBUG)
 
-    # Patch the asyncio Lock object to be non-functional
+    # Patch the device lock to be non-functional
+    @asynccontextmanager
+    async def _no_lock():
+        yield False
+
     with (
-            patch.object(coordinator._lock, "acquire",
-                         AsyncMock(return_value=True)),
-            patch.object(coordinator._lock, "locked",
-                         MagicMock(return_value=False)),
-            patch.object(coordinator._lock, "release",
-                         MagicMock(return_value=None))
+            patch.object(coordinator._lock, "async_poll", _no_lock),
+            patch.object(coordinator._lock, "async_command", _no_lock),
     ):
         # Assert exception is thrown when concurrent access occurs
         with pytest.raises(AttributeError):
@@ -93,3 +98,516 @@ async def test_concurrent_network_access_exception(
     task2 = asyncio.create_task(coordinator.apply())
     await task1
     task2.cancel()
+
+
+async def test_adaptive_update_interval(
+    hass: HomeAssistant,
+) -> None:
+    """Test the update interval backs off when idle and speeds up after changes."""
+
+    device = AC("0.0.0.0", 0, 0)
+    device._online = True
+    coordinator = MideaDeviceUpdateCoordinator(
+        hass, device, min_update_interval=5, max_update_interval=60)
+
+    with patch.object(device, "refresh", AsyncMock()):
+        # Initial update records state and backs off
+        await coordinator._async_update_data()
+        assert coordinator.update_interval == timedelta(seconds=30)
+
+        # Back off is limited to the maximum interval
+        await coordinator._async_update_data()
+        await coordinator._async_update_data()
+        assert coordinator.update_interval == timedelta(seconds=60)
+
+        # An observed change should switch to the minimum interval
+        device._power_state = True
+        await coordinator._async_update_data()
+        assert coordinator.update_interval == timedelta(seconds=5)
+
+        # Interval remains at the minimum during the fast window
+        await coordinator._async_update_data()
+        assert coordinator.update_interval == timedelta(seconds=5)
+
+        # Back off resumes once the fast window expires
+        coordinator._fast_update_deadline = 0
+        await coordinator._async_update_data()
+        assert coordinator.update_interval == timedelta(seconds=10)
+
+    # Applying changes should switch to the minimum interval
+    with (patch.object(device, "apply", AsyncMock()),
+          patch.object(coordinator, "async_request_refresh", AsyncMock())):
+        device.power_state = False
+        await coordinator.apply()
+        assert coordinator.update_interval == timedelta(seconds=5)
+
+
+async def test_offline_backoff(
+    hass: HomeAssistant,
+) -> None:
+    """Test polling of an offline device backs off and resets on success."""
+
+    device = AC("0.0.0.0", 0, 0)
+    coordinator = MideaDeviceUpdateCoordinator(
+        hass, device, min_update_interval=5, max_update_interval=60)
+
+    with (patch.object(device, "refresh", AsyncMock()) as mock_refresh,
+          patch.object(coordinator, "_async_check_reachable", AsyncMock(return_value=False)) as mock_check):
+        # Back off after consecutive failures
+        for _ in range(3):
+            await coordinator._async_update_data()
+        assert mock_refresh.await_count == 3
+        assert coordinator.update_interval == timedelta(seconds=60)
+
+        # Unreachable devices are probed without a full refresh
+        for interval in [120, 240, 300]:
+            await coordinator._async_update_data()
+            assert coordinator.update_interval == timedelta(seconds=interval)
+        assert mock_refresh.await_count == 3
+
+        diagnostics = coordinator.get_diagnostics()["backoff"]
+        assert diagnostics["active"]
+        assert diagnostics["consecutive_failures"] == 6
+        assert diagnostics["failed_probe_count"] == 3
+
+        # A reachable device is refreshed and the backoff resets on success
+        async def _respond() -> None:
+            device._online = True
+        mock_check.return_value = True
+        mock_refresh.side_effect = _respond
+        await coordinator._async_update_data()
+        assert mock_refresh.await_count == 4
+        assert coordinator.update_interval == timedelta(seconds=60)
+
+        diagnostics = coordinator.get_diagnostics()["backoff"]
+        assert not diagnostics["active"]
+        assert diagnostics["consecutive_failures"] == 0
+        assert diagnostics["probe_count"] == 4
+
+
+async def test_apply_coalescing(
+    hass: HomeAssistant,
+) -> None:
+    """Test concurrent applies are merged into a single device write."""
+
+    device = AC("0.0.0.0", 0, 0)
+    coordinator = MideaDeviceUpdateCoordinator(hass, device)
+
+    with (patch.object(device, "apply", AsyncMock()) as mock_apply,
+          patch.object(coordinator, "async_request_refresh", AsyncMock()) as mock_refresh):
+        # Concurrent applies should result in a single write
+        await asyncio.gather(
+            coordinator.apply(),
+            coordinator.apply(),
+            coordinator.apply(),
+        )
+        mock_apply.assert_awaited_once()
+        mock_refresh.assert_awaited_once()
+
+        diagnostics = coordinator.get_diagnostics()
+        assert diagnostics["apply_count"] == 1
+        assert diagnostics["coalesced_apply_count"] == 2
+
+        # Sequential applies should result in separate writes
+        await coordinator.apply()
+        assert mock_apply.await_count == 2
+
+
+async def test_apply_uses_response_state(
+    hass: HomeAssistant,
+) -> None:
+    """Test the post-apply refresh is skipped when the response matches the request."""
+
+    device = AC("0.0.0.0", 0, 0)
+    device._online = True
+    coordinator = MideaDeviceUpdateCoordinator(hass, device)
+
+    with (patch.object(device, "apply", AsyncMock()) as mock_apply,
+          patch.object(coordinator, "async_request_refresh", AsyncMock()) as mock_refresh,
+          patch.object(coordinator, "async_set_updated_data") as mock_set_updated):
+        # Response matches request so no refresh is needed
+        device.power_state = True
+        await coordinator.apply()
+        mock_refresh.assert_not_awaited()
+        mock_set_updated.assert_called_once()
+
+        # Response doesn't match request so a refresh is required
+        def _reject_power() -> None:
+            device._power_state = True
+        mock_apply.side_effect = _reject_power
+        device.power_state = False
+        await coordinator.apply()
+        mock_refresh.assert_awaited_once()
+
+        # Every requested property must match, not only activity properties
+        def _reject_eco() -> None:
+            device._eco = False
+        mock_apply.side_effect = _reject_eco
+        device.eco = True
+        await coordinator.apply()
+        assert mock_refresh.await_count == 2
+
+        # Changed measurements in the response don't require a refresh
+        def _update_temperature() -> None:
+            device._indoor_temperature = 23.5
+        mock_apply.side_effect = _update_temperature
+        device.power_state = False
+        await coordinator.apply()
+        assert mock_refresh.await_count == 2
+
+        # No response so a refresh is required
+        mock_apply.side_effect = None
+        device._online = False
+        await coordinator.apply()
+        assert mock_refresh.await_count == 3
+
+    assert coordinator.get_diagnostics()["skipped_refresh_count"] == 2
+
+
+async def test_apply_suppressed_without_changes(
+    hass: HomeAssistant,
+) -> None:
+    """Test writes are skipped when the device already reports the requested state."""
+
+    device = AC("0.0.0.0", 0, 0)
+    coordinator = MideaDeviceUpdateCoordinator(hass, device)
+
+    async def _respond() -> None:
+        device._online = True
+
+    with (patch.object(device, "refresh", AsyncMock(side_effect=_respond)),
+          patch.object(device, "apply", AsyncMock()) as mock_apply,
+          patch.object(coordinator, "async_request_refresh", AsyncMock()) as mock_refresh):
+        await coordinator.async_refresh()
+
+        # Re-asserting the current state doesn't write to the device
+        device.target_temperature = device.target_temperature
+        await coordinator.apply()
+        mock_apply.assert_not_awaited()
+        mock_refresh.assert_not_awaited()
+
+        # Changed properties are written
+        device.target_temperature = device.target_temperature + 1
+        await coordinator.apply()
+        mock_apply.assert_awaited_once()
+
+        # Writes aren't skipped while the device is offline
+        device._online = False
+        await coordinator.apply()
+        assert mock_apply.await_count == 2
+
+    assert coordinator.get_diagnostics()["suppressed_apply_count"] == 1
+
+    # Suppressed writes don't leave stale changes for the next write
+    device._online = True
+    device.breezeless = device.breezeless
+    with (patch.object(device, "apply", AsyncMock()) as mock_apply,
+          patch.object(coordinator, "async_request_refresh", AsyncMock())):
+        await coordinator.apply()
+        mock_apply.assert_not_awaited()
+    assert not device._updated_properties
+
+
+async def test_apply_reverted_change(
+    hass: HomeAssistant,
+) -> None:
+    """Test a change reverted within the coalescing window isn't written."""
+
+    device = AC("0.0.0.0", 0, 0)
+    device._online = True
+    device._target_temperature = 22.0
+    coordinator = MideaDeviceUpdateCoordinator(hass, device)
+
+    with patch.object(device, "refresh", AsyncMock()):
+        await coordinator.async_refresh()
+
+    written = []
+
+    def _capture() -> None:
+        written.append(device.target_temperature)
+
+    with (patch.object(device, "apply", AsyncMock(side_effect=_capture)),
+          patch.object(coordinator, "async_request_refresh", AsyncMock())):
+        device.target_temperature = 24.0
+        task = hass.async_create_task(coordinator.apply())
+        await asyncio.sleep(0)
+
+        # Revert the change before the write
+        device.target_temperature = 22.0
+        await coordinator.apply()
+        await task
+
+    assert device.target_temperature == 22.0
+    assert not written
+
+
+async def test_apply_restores_polled_values(
+    hass: HomeAssistant,
+) -> None:
+    """Test requested values overwritten by a poll are restored before writing."""
+
+    device = AC("0.0.0.0", 0, 0)
+    device._online = True
+    coordinator = MideaDeviceUpdateCoordinator(hass, device)
+
+    with patch.object(device, "refresh", AsyncMock()):
+        await coordinator.async_refresh()
+
+    written = {}
+
+    def _capture() -> None:
+        written.update(fahrenheit=device.fahrenheit,
+                       breeze_away=device.breeze_away,
+                       breezeless=device.breezeless)
+
+    with (patch.object(device, "apply", AsyncMock(side_effect=_capture)),
+          patch.object(coordinator, "async_request_refresh", AsyncMock())):
+        device.fahrenheit = True
+        device.breezeless = True
+        task = hass.async_create_task(coordinator.apply())
+        await asyncio.sleep(0)
+
+        # Simulate a poll response received during the coalescing window
+        device._fahrenheit_unit = False
+        device._breeze_mode = AC.BreezeMode.BREEZE_AWAY
+        await task
+
+    assert written == {"fahrenheit": True,
+                       "breeze_away": False, "breezeless": True}
+    assert not hasattr(device, "_breezeless")
+
+
+async def test_optimistic_apply(
+    hass: HomeAssistant,
+) -> None:
+    """Test optimistic updates are shown immediately and rolled back if rejected."""
+
+    device = AC("0.0.0.0", 0, 0)
+    device._online = True
+    coordinator = MideaDeviceUpdateCoordinator(hass, device, optimistic=True)
+
+    with patch.object(device, "refresh", AsyncMock()):
+        await coordinator.async_refresh()
+    assert coordinator.data["power_state"] is False
+
+    with patch.object(device, "apply", AsyncMock()) as mock_apply:
+        # State is updated before the device responds
+        device.power_state = True
+        task = hass.async_create_task(coordinator.apply())
+        await asyncio.sleep(0)
+        assert coordinator.data["power_state"] is True
+        mock_apply.assert_not_awaited()
+
+        # Device confirms the change
+        await task
+        mock_apply.assert_awaited_once()
+        assert coordinator.data["power_state"] is True
+
+        # Device responds without the change so state is rolled back
+        target_temperature = device.target_temperature
+        device.target_temperature = target_temperature + 2
+
+        def _reject() -> None:
+            device._target_temperature = target_temperature
+        mock_apply.side_effect = _reject
+        with patch.object(device, "refresh", AsyncMock()) as mock_refresh:
+            with pytest.raises(HomeAssistantError):
+                await coordinator.apply()
+            mock_refresh.assert_awaited_once()
+        assert coordinator.data["target_temperature"] == target_temperature
+
+        # Device goes offline so state is rolled back
+        device.power_state = False
+        mock_apply.side_effect = lambda: setattr(device, "_online", False)
+        with pytest.raises(HomeAssistantError):
+            await coordinator.apply()
+        assert device.power_state is True
+        assert coordinator.data["power_state"] is True
+
+        # Properties backed by other attributes are also rolled back
+        device._online = True
+        device.fahrenheit = True
+        device.breezeless = True
+        with pytest.raises(HomeAssistantError):
+            await coordinator.apply()
+        assert device.fahrenheit is False
+        assert device.breezeless is False
+        assert not device._updated_properties
+
+    diagnostics = coordinator.get_diagnostics()
+    assert diagnostics["optimistic_count"] == 4
+    assert diagnostics["rollback_count"] == 3
+
+
+async def test_request_metrics(
+    hass: HomeAssistant,
+) -> None:
+    """Test refresh and apply latency and errors are recorded."""
+
+    device = AC("0.0.0.0", 0, 0)
+    coordinator = MideaDeviceUpdateCoordinator(hass, device)
+
+    async def _respond() -> None:
+        device._online = True
+
+    with (patch.object(device, "refresh", AsyncMock(side_effect=_respond)),
+          patch.object(device, "apply", AsyncMock()) as mock_apply,
+          patch.object(coordinator, "async_request_refresh", AsyncMock())):
+        await coordinator._async_update_data()
+        device.power_state = True
+        await coordinator.apply()
+
+        # Failed requests are counted as errors
+        mock_apply.side_effect = OSError
+        device.power_state = False
+        with pytest.raises(OSError):
+            await coordinator.apply()
+
+    assert coordinator.refresh_metrics.total.count == 1
+    assert coordinator.refresh_metrics.errors == 0
+    assert coordinator.apply_metrics.total.count == 2
+    assert coordinator.apply_metrics.errors == 1
+
+    diagnostics = coordinator.get_diagnostics()
+    assert diagnostics["refresh_metrics"]["total"]["count"] == 1
+    assert diagnostics["apply_metrics"]["errors"] == 1
+
+
+async def test_listeners_notified_on_change(
+    hass: HomeAssistant,
+) -> None:
+    """Test listeners are only notified when the device state changes."""
+
+    device = AC("0.0.0.0", 0, 0)
+    coordinator = MideaDeviceUpdateCoordinator(hass, device)
+
+    listener = MagicMock()
+    unsub = coordinator.async_add_listener(listener)
+
+    with patch.object(device, "refresh", AsyncMock()):
+        # First refresh always notifies
+        await coordinator.async_refresh()
+        assert listener.call_count == 1
+
+        # Unchanged state shouldn't notify
+        await coordinator.async_refresh()
+        assert listener.call_count == 1
+        assert coordinator.get_diagnostics()["unchanged_update_count"] == 1
+
+        # Changed state should notify
+        device._indoor_temperature = 21.5
+        await coordinator.async_refresh()
+        assert listener.call_count == 2
+
+        # Energy changes in any format should notify
+        device._real_time_power_usage = {
+            AC.EnergyDataFormat.BCD: None,
+            AC.EnergyDataFormat.BINARY: 150.0,
+        }
+        await coordinator.async_refresh()
+        assert listener.call_count == 3
+
+    unsub()
+
+
+async def test_listeners_notified_by_property(
+    hass: HomeAssistant,
+) -> None:
+    """Test listeners are only notified when their dependent properties change."""
+
+    device = AC("0.0.0.0", 0, 0)
+    device._online = True
+    coordinator = MideaDeviceUpdateCoordinator(hass, device)
+
+    climate_listener = MagicMock()
+    sensor_listener = MagicMock()
+    global_listener = MagicMock()
+    unsubs = [
+        coordinator.async_add_listener(
+            climate_listener, frozenset({"power_state", "target_temperature"})),
+        coordinator.async_add_listener(
+            sensor_listener, frozenset({"outdoor_temperature"})),
+        coordinator.async_add_listener(global_listener),
+    ]
+
+    with patch.object(device, "refresh", AsyncMock()):
+        # First refresh notifies all listeners
+        await coordinator.async_refresh()
+        assert climate_listener.call_count == 1
+        assert sensor_listener.call_count == 1
+        assert global_listener.call_count == 1
+
+        # Only the sensor depends on outdoor temperature
+        device._outdoor_temperature = 30.0
+        await coordinator.async_refresh()
+        assert climate_listener.call_count == 1
+        assert sensor_listener.call_count == 2
+        assert global_listener.call_count == 2
+
+        # Only the climate depends on power state
+        device._power_state = True
+        await coordinator.async_refresh()
+        assert climate_listener.call_count == 2
+        assert sensor_listener.call_count == 2
+        assert global_listener.call_count == 3
+
+        # Going offline affects all listeners
+        device._online = False
+        await coordinator.async_refresh()
+        assert climate_listener.call_count == 3
+        assert sensor_listener.call_count == 3
+        assert global_listener.call_count == 4
+
+    for unsub in unsubs:
+        unsub()
+
+
+async def test_energy_request_interval(
+    hass: HomeAssistant,
+) -> None:
+    """Test energy requests are made at their own interval and skipped while off."""
+
+    device = AC("0.0.0.0", 0, 0)
+    coordinator = MideaDeviceUpdateCoordinator(hass, device)
+
+    requests = []
+
+    async def _refresh() -> None:
+        requests.append(device.enable_energy_usage_requests)
+        device._online = True
+
+    with patch.object(device, "refresh", side_effect=_refresh):
+        # No requests without an energy sensor
+        await coordinator._async_update_data()
+        assert requests[-1] is False
+
+        # Initial request is made even if device is off
+        coordinator.register_energy_sensor(300)
+        coordinator.register_energy_sensor(60)
+        await coordinator._async_update_data()
+        assert requests[-1] is True
+
+        # No request until the interval elapses
+        device._power_state = True
+        await coordinator._async_update_data()
+        assert requests[-1] is False
+
+        coordinator._next_energy_update = 0
+        await coordinator._async_update_data()
+        assert requests[-1] is True
+
+        # No request while device is off
+        device._power_state = False
+        coordinator._next_energy_update = 0
+        await coordinator._async_update_data()
+        assert requests[-1] is False
+
+        # Fastest remaining sensor interval is used
+        coordinator.unregister_energy_sensor(60)
+        assert coordinator.get_diagnostics()["energy_update_interval"] == 300
+
+        # No requests once all sensors are removed
+        coordinator.unregister_energy_sensor(300)
+        device._power_state = True
+        await coordinator._async_update_data()
+        assert requests[-1] is False
@@ -0,0 +1,133 @@
+"""Tests against simulated devices on the local network."""
+
+import asyncio
+import logging
+import time
+
+import pytest
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import CONF_HOST, CONF_ID, CONF_PORT, CONF_TOKEN
+from homeassistant.core import HomeAssistant
+from msmart.const import DeviceType
+from msmart.device import AirConditioner as AC
+from msmart.device import CommercialAirConditioner as CC
+from msmart.lan import AuthenticationError
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.midea_ac.const import CONF_DEVICE_TYPE, CONF_KEY, DOMAIN
+
+from .fake_device import (FakeAirConditioner, FakeCommercialAirConditioner,
+                          FakeMideaServer, FakeNetworkConditions)
+
+logging.basicConfig(level=logging.DEBUG)
+_LOGGER = logging.getLogger(__name__)
+
+
+@pytest.fixture(autouse=True)
+def auto_socket_enabled(socket_enabled) -> None:
+    """Allow connections to the local fake devices."""
+
+
+async def test_v2_device() -> None:
+    """Test querying and controlling a V2 device."""
+
+    async with FakeMideaServer(FakeAirConditioner()) as server:
+        device = AC(server.host, server.device_id, server.port)
+
+        await device.get_capabilities()
+        assert device.supports_eco
+        assert AC.OperationalMode.HEAT in device.supported_operation_modes
+
+        await device.refresh()
+        assert device.online
+        assert device.power_state is False
+        assert device.target_temperature == 24.0
+        assert device.indoor_temperature == 24.0
+
+        # Commands update the simulated state
+        device.power_state = True
+        device.target_temperature = 21.5
+        device.operational_mode = AC.OperationalMode.HEAT
+        await device.apply()
+        assert server.device.power_on
+        assert server.device.target_temperature == 21.5
+        assert server.device.operational_mode == AC.OperationalMode.HEAT
+
+        # Device reconnects after the connection is lost
+        server.disconnect()
+        await asyncio.sleep(0.01)
+        await device.refresh()
+        assert device.online
+        assert device.power_state is True
+
+
+async def test_v3_device() -> None:
+    """Test authenticating with a V3 device."""
+
+    token, key = FakeMideaServer.generate_credentials()
+    async with FakeMideaServer(FakeCommercialAirConditioner(), token=token, key=key) as server:
+        device = CC(server.host, server.device_id, server.port)
+
+        # Unknown tokens are rejected
+        with pytest.raises(AuthenticationError):
+            await device.authenticate(bytes(64), key)
+        assert server.failed_handshake_count == 1
+
+        await device.authenticate(token, key)
+        assert server.handshake_count == 1
+
+        await device.get_capabilities()
+        await device.refresh()
+        assert device.online
+        assert device.target_temperature == 24.0
+
+        device.power_state = True
+        device.target_temperature = 20
+        await device.apply()
+        assert server.device.controls[0x0000] == 1
+        assert server.device.controls[0x0003] == 120
+
+
+async def test_network_latency() -> None:
+    """Test responses are delayed by the simulated latency."""
+
+    conditions = FakeNetworkConditions(latency=0.1, jitter=0.05)
+    async with FakeMideaServer(FakeAirConditioner(), conditions=conditions, seed=1) as server:
+        device = AC(server.host, server.device_id, server.port)
+
+        start = time.monotonic()
+        await device.refresh()
+        assert 0.05 <= time.monotonic() - start < 1
+        assert device.online
+        assert server.request_count == 1
+
+
+async def test_setup_entry(hass: HomeAssistant) -> None:
+    """Test setting up a config entry against a V3 device."""
+
+    token, key = FakeMideaServer.generate_credentials()
+    async with FakeMideaServer(FakeAirConditioner(), token=token, key=key) as server:
+        server.device.power_on = True
+
+        config_entry = MockConfigEntry(
+            domain=DOMAIN,
+            unique_id=str(server.device_id),
+            data={
+                CONF_ID: str(server.device_id),
+                CONF_HOST: server.host,
+                CONF_PORT: server.port,
+                CONF_TOKEN: token.hex(),
+                CONF_KEY: key.hex(),
+                CONF_DEVICE_TYPE: DeviceType.AIR_CONDITIONER,
+            }
+        )
+        config_entry.add_to_hass(hass)
+        await hass.config_entries.async_setup(config_entry.entry_id)
+        await hass.async_block_till_done()
+
+        assert config_entry.state is ConfigEntryState.LOADED
+        (entity_id,) = hass.states.async_entity_ids("climate")
+        assert hass.states.get(entity_id).state == "cool"
+
+        assert await hass.config_entries.async_unload(config_entry.entry_id)
+        await hass.async_block_till_done()
@@ -1,24 +1,31 @@
 """Tests for the integration init."""
 
+import asyncio
 import logging
 from typing import Any
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
+from homeassistant.const import (ATTR_ASSUMED_STATE, CONF_HOST, CONF_ID,
+                                 CONF_PORT, CONF_TOKEN, STATE_UNAVAILABLE)
 from homeassistant.core import HomeAssistant
 from msmart.const import DeviceType
+from msmart.device import AirConditioner as AC
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
+from custom_components.midea_ac.capabilities import MideaCapabilityStore
 from custom_components.midea_ac.const import (CONF_ADDITIONAL_OPERATION_MODES,
-                                              CONF_DEVICE_TYPE,
+                                              CONF_BEEP, CONF_DEVICE_TYPE,
                                               CONF_ENERGY_DATA_FORMAT,
                                               CONF_ENERGY_DATA_SCALE,
                                               CONF_ENERGY_SENSOR,
+                                              CONF_FAST_START, CONF_KEY,
                                               CONF_POWER_SENSOR,
                                               CONF_SHOW_ALL_PRESETS,
+                                              CONF_TEMP_STEP,
                                               CONF_USE_FAN_ONLY_WORKAROUND,
-                                              CONF_WORKAROUNDS, DOMAIN,
-                                              EnergyFormat)
+                                              CONF_WORKAROUNDS, DATA_SESSIONS,
+                                              DOMAIN, EnergyFormat)
 
 logging.basicConfig(level=logging.DEBUG)
 _LOGGER = logging.getLogger(__name__)
@@ -246,3 +253,190 @@ async def test_config_entry_migration_from_1(hass: HomeAssistant) -> None:
     assert mock_config_entry.version == 1
     assert mock_config_entry.minor_version == 5
     assert isinstance(mock_config_entry.unique_id, str)
+
+
+async def test_fast_start(hass: HomeAssistant, hass_storage: dict[str, Any]) -> None:
+    """Test setup uses the last known state and refreshes in the background."""
+
+    # Store cached capabilities and a state snapshot
+    device = AC("0.0.0.0", 1234, 6444)
+    hass_storage[f"{DOMAIN}.capabilities"] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": f"{DOMAIN}.capabilities",
+        "data": {
+            "1234": {
+                "version": MideaCapabilityStore._get_version(device, 2),
+                "capabilities": {"raw": {"cool_mode": True}},
+            },
+        },
+    }
+    hass_storage[f"{DOMAIN}.snapshots"] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": f"{DOMAIN}.snapshots",
+        "data": {
+            "1234": {
+                "online": True,
+                "power_state": True,
+                "operational_mode": AC.OperationalMode.COOL.value,
+                "target_temperature": 21.0,
+                "indoor_temperature": 24.5,
+                "fahrenheit": True,
+                "breezeless": True,
+            },
+        },
+    }
+
+    mock_config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        unique_id="1234",
+        data={
+            CONF_ID: "1234",
+            CONF_HOST: "localhost",
+            CONF_PORT: 6444,
+            CONF_TOKEN: None,
+            CONF_KEY: None,
+            CONF_DEVICE_TYPE: DeviceType.AIR_CONDITIONER,
+        },
+        options={CONF_FAST_START: True},
+    )
+
+    # Block the first refresh until released
+    release = asyncio.Event()
+
+    async def _refresh(*args, **kwargs) -> None:
+        await release.wait()
+
+    with (patch("custom_components.midea_ac.AC.get_capabilities") as mock_get_capabilities,
+          patch("custom_components.midea_ac.AC.refresh", AsyncMock(side_effect=_refresh))):
+        mock_config_entry.add_to_hass(hass)
+        assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+
+        # Setup shouldn't wait for the device
+        coordinator = hass.data[DOMAIN][mock_config_entry.entry_id]
+        assert coordinator.restored
+        assert not coordinator.device.online
+        assert coordinator.device.power_state is True
+        assert coordinator.device.operational_mode == AC.OperationalMode.COOL
+        assert coordinator.device.target_temperature == 21.0
+        assert coordinator.device.indoor_temperature == 24.5
+        assert coordinator.device.fahrenheit is True
+        assert coordinator.device.breezeless is True
+        assert not coordinator.device._updated_properties
+        mock_get_capabilities.assert_not_called()
+
+        # Restored state is shown as assumed
+        entity_id = hass.states.async_entity_ids("climate")[0]
+        state = hass.states.get(entity_id)
+        assert state.state == "cool"
+        assert state.attributes[ATTR_ASSUMED_STATE]
+
+        # Restored state is replaced once the device is queried
+        release.set()
+        await hass.async_block_till_done(wait_background_tasks=True)
+        assert not coordinator.restored
+        assert hass.states.get(entity_id).state == STATE_UNAVAILABLE
+
+    assert await hass.config_entries.async_unload(mock_config_entry.entry_id)
+
+
+async def test_options_applied_without_reload(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+) -> None:
+    """Test options which don't change entities are applied in place."""
+
+    with (patch("custom_components.midea_ac.AC.get_capabilities"),
+          patch("custom_components.midea_ac.AC.refresh")):
+        mock_config_entry.add_to_hass(hass)
+        await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+
+        coordinator = hass.data[DOMAIN][mock_config_entry.entry_id]
+        (entity_id,) = hass.states.async_entity_ids("climate")
+
+        # Temperature step and beep are applied to the running entities
+        options = {**mock_config_entry.options,
+                   CONF_TEMP_STEP: 0.5, CONF_BEEP: True}
+        hass.config_entries.async_update_entry(
+            mock_config_entry, options=options)
+        await hass.async_block_till_done()
+
+        assert hass.data[DOMAIN][mock_config_entry.entry_id] is coordinator
+        assert hass.states.get(entity_id).attributes["target_temp_step"] == 0.5
+        assert coordinator.device.beep
+
+        # Workarounds change entity features and require a reload
+        hass.config_entries.async_update_entry(
+            mock_config_entry, options={
+                **options,
+                CONF_WORKAROUNDS: {CONF_SHOW_ALL_PRESETS: True},
+            })
+        await hass.async_block_till_done()
+
+        assert hass.data[DOMAIN][mock_config_entry.entry_id] is not coordinator
+
+    assert await hass.config_entries.async_unload(mock_config_entry.entry_id)
+
+
+async def test_only_used_platforms_forwarded(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+) -> None:
+    """Test setup is only forwarded to platforms which create entities."""
+
+    with (patch("custom_components.midea_ac.AC.get_capabilities"),
+          patch("custom_components.midea_ac.AC.refresh")):
+        mock_config_entry.add_to_hass(hass)
+        await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+
+    # Default device doesn't support self clean or any select features
+    assert f"{DOMAIN}.climate" in hass.config.components
+    assert f"{DOMAIN}.sensor" in hass.config.components
+    assert f"{DOMAIN}.switch" in hass.config.components
+    assert f"{DOMAIN}.button" not in hass.config.components
+    assert f"{DOMAIN}.select" not in hass.config.components
+
+    assert await hass.config_entries.async_unload(mock_config_entry.entry_id)
+
+
+async def test_session_closed_on_unload(hass: HomeAssistant) -> None:
+    """Test V3 sessions are kept across reloads and closed on unload."""
+
+    mock_config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        unique_id="1234",
+        data={
+            CONF_ID: "1234",
+            CONF_HOST: "localhost",
+            CONF_PORT: 6444,
+            CONF_TOKEN: "00" * 64,
+            CONF_KEY: "00" * 32,
+            CONF_DEVICE_TYPE: DeviceType.AIR_CONDITIONER,
+        },
+    )
+
+    with (patch("custom_components.midea_ac.AC.authenticate"),
+          patch("custom_components.midea_ac.AC.get_capabilities"),
+          patch("custom_components.midea_ac.AC.refresh")):
+        mock_config_entry.add_to_hass(hass)
+        assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+
+        sessions = hass.data[DOMAIN][DATA_SESSIONS]
+        session = sessions.async_get(
+            1234, "localhost", 6444, "00" * 64, "00" * 32)
+
+        # Reloads reuse the session
+        with patch.object(session, "close") as mock_close:
+            assert await hass.config_entries.async_reload(mock_config_entry.entry_id)
+            await hass.async_block_till_done()
+            mock_close.assert_not_called()
+
+            # Unloading closes the session
+            assert await hass.config_entries.async_unload(mock_config_entry.entry_id)
+            await hass.async_block_till_done()
+            mock_close.assert_called_once()
@@ -0,0 +1,39 @@
+"""Tests for latency metrics."""
+
+from custom_components.midea_ac.metrics import (LatencyHistogram,
+                                                OperationMetrics)
+
+
+def test_latency_histogram() -> None:
+    """Test percentiles are estimated from the bucket bounds."""
+
+    histogram = LatencyHistogram()
+    assert histogram.percentile(50) is None
+    assert histogram.max is None
+
+    for latency in [0.01] * 10 + [0.3] * 8 + [1.5, 45.0]:
+        histogram.record(latency)
+
+    assert histogram.count == 20
+    assert histogram.percentile(50) == 0.05
+    assert histogram.percentile(90) == 0.5
+    assert histogram.percentile(95) == 2.0
+    assert histogram.percentile(100) == 45.0
+    assert histogram.max == 45.0
+
+    buckets = histogram.as_dict()["buckets"]
+    assert buckets["le_0.05"] == 10
+    assert buckets["inf"] == 1
+
+
+def test_operation_metrics() -> None:
+    """Test operation metrics record each phase and errors."""
+
+    metrics = OperationMetrics()
+    metrics.record(0.02, 0.2)
+    metrics.record(0.0, 0.04, error=True)
+
+    assert metrics.errors == 1
+    assert metrics.lock_wait.max == 0.02
+    assert metrics.request.max == 0.2
+    assert metrics.total.max == 0.22
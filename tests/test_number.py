@@ -0,0 +1,50 @@
+"""Tests for the number platform."""
+
+import asyncio
+import logging
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from homeassistant.core import HomeAssistant
+from msmart.device import AirConditioner as AC
+
+from custom_components.midea_ac.coordinator import MideaDeviceUpdateCoordinator
+from custom_components.midea_ac.number import MideaFanSpeedNumber
+
+logging.basicConfig(level=logging.DEBUG)
+_LOGGER = logging.getLogger(__name__)
+
+
+async def test_fan_speed_debounce(
+    hass: HomeAssistant,
+) -> None:
+    """Test only the final fan speed is written while the slider moves."""
+
+    device = AC("0.0.0.0", 0, 0)
+    coordinator = MideaDeviceUpdateCoordinator(hass, device)
+    coordinator.apply = AsyncMock()
+
+    number = MideaFanSpeedNumber(coordinator, debounce_window=0.05)
+    number.hass = hass
+
+    with patch.object(number, "async_write_ha_state", MagicMock()) as mock_write_state:
+        # Intermediate values are shown but not written
+        tasks = []
+        for value in (20, 40, 60):
+            tasks.append(hass.async_create_task(
+                number.async_set_native_value(value)))
+            await asyncio.sleep(0.01)
+            assert number.native_value == value
+        coordinator.apply.assert_not_awaited()
+        assert mock_write_state.call_count == 3
+
+        # Final value is written once the slider stops
+        await asyncio.gather(*tasks)
+        coordinator.apply.assert_awaited_once()
+        assert device.fan_speed == 60
+        assert number.native_value == 60
+
+    # Writes are immediate without a debounce window
+    number._debounce_window = 0
+    await number.async_set_native_value(80)
+    assert coordinator.apply.await_count == 2
+    assert device.fan_speed == 80
@@ -0,0 +1,106 @@
+"""Tests for the request scheduler."""
+
+import asyncio
+import logging
+
+from custom_components.midea_ac.scheduler import (MideaDeviceLock,
+                                                  MideaRequestScheduler)
+
+logging.basicConfig(level=logging.DEBUG)
+_LOGGER = logging.getLogger(__name__)
+
+
+async def test_poll_spacing() -> None:
+    """Test polls are spread over the update interval of the polling device."""
+
+    scheduler = MideaRequestScheduler()
+    assert scheduler.get_poll_spacing(10) == 0
+
+    scheduler.register()
+    scheduler.register()
+    assert scheduler.get_poll_spacing(10) == 5
+
+    # Idle devices are spread over their longer interval
+    assert scheduler.get_poll_spacing(60) == 30
+
+    scheduler.unregister()
+    assert scheduler.get_poll_spacing(10) == 10
+
+
+async def test_polls_staggered() -> None:
+    """Test simultaneous polls are staggered."""
+
+    scheduler = MideaRequestScheduler()
+    for _ in range(4):
+        scheduler.register()
+
+    # Polls should start at least 50 ms apart
+    loop = asyncio.get_running_loop()
+    start_times = []
+
+    async def _poll(update_interval: float) -> None:
+        await scheduler.async_wait_for_poll(update_interval)
+        start_times.append(loop.time())
+
+    await asyncio.gather(*[_poll(0.2) for _ in range(4)])
+
+    for a, b in zip(start_times, start_times[1:]):
+        assert b - a >= 0.045
+
+    assert scheduler.get_diagnostics()["max_poll_delay"] >= 0.14
+
+
+async def test_concurrent_requests_limited() -> None:
+    """Test the number of concurrent requests is limited."""
+
+    scheduler = MideaRequestScheduler(max_concurrent_requests=2)
+
+    in_flight = 0
+    max_in_flight = 0
+
+    async def _request() -> None:
+        nonlocal in_flight, max_in_flight
+        async with scheduler.async_request():
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+    await asyncio.gather(*[_request() for _ in range(6)])
+
+    assert max_in_flight == 2
+
+    diagnostics = scheduler.get_diagnostics()
+    assert diagnostics["request_count"] == 6
+    assert diagnostics["max_queue_depth"] == 4
+    assert diagnostics["queue_depth"] == 0
+    assert diagnostics["in_flight"] == 0
+
+
+async def test_commands_preempt_polls() -> None:
+    """Test commands jump ahead of waiting polls which are then dropped."""
+
+    lock = MideaDeviceLock()
+    order = []
+
+    async def _poll(name: str) -> None:
+        async with lock.async_poll() as preempted:
+            order.append((name, preempted))
+            await asyncio.sleep(0.01)
+
+    async def _command(name: str) -> None:
+        async with lock.async_command():
+            order.append((name, None))
+            await asyncio.sleep(0.01)
+
+    # Hold the lock with a poll while another poll and a command queue up
+    first = asyncio.create_task(_poll("poll1"))
+    await asyncio.sleep(0)
+    second = asyncio.create_task(_poll("poll2"))
+    await asyncio.sleep(0)
+    command = asyncio.create_task(_command("command"))
+    await asyncio.gather(first, second, command)
+
+    # In-flight poll finishes, command runs next and the waiting poll is dropped
+    assert order == [("poll1", False), ("command", None), ("poll2", True)]
+    assert not lock.locked()
@@ -0,0 +1,56 @@
+"""Tests for the select platform."""
+
+import asyncio
+import logging
+from unittest.mock import AsyncMock, patch
+
+from homeassistant.core import HomeAssistant
+from msmart.device import AirConditioner as AC
+
+from custom_components.midea_ac.coordinator import MideaDeviceUpdateCoordinator
+from custom_components.midea_ac.select import MideaEnumSelect
+
+logging.basicConfig(level=logging.DEBUG)
+_LOGGER = logging.getLogger(__name__)
+
+
+async def test_selects_share_write(
+    hass: HomeAssistant,
+) -> None:
+    """Test concurrent selections are merged into a single device write."""
+
+    device = AC("0.0.0.0", 0, 0)
+    coordinator = MideaDeviceUpdateCoordinator(hass, device)
+
+    vertical = MideaEnumSelect(
+        coordinator, "vertical_swing_angle", AC.SwingAngle)
+    horizontal = MideaEnumSelect(
+        coordinator, "horizontal_swing_angle", AC.SwingAngle)
+    cascade = MideaEnumSelect(coordinator, "cascade_mode", AC.CascadeMode,
+                              translation_key="cascade")
+
+    written = {}
+
+    async def _apply() -> None:
+        written.update(
+            vertical=device.vertical_swing_angle,
+            horizontal=device.horizontal_swing_angle,
+            cascade=device.cascade_mode,
+        )
+
+    with (patch.object(device, "apply", AsyncMock(side_effect=_apply)) as mock_apply,
+          patch.object(coordinator, "async_request_refresh", AsyncMock())):
+        await asyncio.gather(
+            vertical.async_select_option("pos_1"),
+            horizontal.async_select_option("pos_5"),
+            cascade.async_select_option("up"),
+        )
+
+    mock_apply.assert_awaited_once()
+    assert written == {
+        "vertical": AC.SwingAngle.POS_1,
+        "horizontal": AC.SwingAngle.POS_5,
+        "cascade": AC.CascadeMode.UP,
+    }
+    assert cascade.current_option == "up"
+    assert coordinator.get_diagnostics()["coalesced_apply_count"] == 2
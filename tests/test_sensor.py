@@ -0,0 +1,181 @@
+"""Tests for the sensor platform."""
+
+import asyncio
+import logging
+from unittest.mock import MagicMock, patch
+
+from homeassistant.components.sensor import SensorDeviceClass
+from homeassistant.const import UnitOfEnergy, UnitOfTemperature
+from homeassistant.core import HomeAssistant
+from msmart.device import AirConditioner as AC
+
+from custom_components.midea_ac.const import (CONF_ENERGY_DATA_FORMAT,
+                                              CONF_ENERGY_DATA_SCALE,
+                                              CONF_ENERGY_SENSOR,
+                                              CONF_MAX_QUIET_TIME,
+                                              CONF_MIN_PUBLISH_INTERVAL,
+                                              CONF_SENSOR_FILTER,
+                                              CONF_TEMPERATURE_DEADBAND,
+                                              EnergyFormat)
+from custom_components.midea_ac.coordinator import MideaDeviceUpdateCoordinator
+from custom_components.midea_ac.sensor import MideaEnergySensor, MideaSensor
+
+logging.basicConfig(level=logging.DEBUG)
+_LOGGER = logging.getLogger(__name__)
+
+
+async def test_sensor_deadband(
+    hass: HomeAssistant,
+) -> None:
+    """Test small changes are held back until the quiet time expires."""
+
+    device = AC("0.0.0.0", 0, 0)
+    device._online = True
+    device._indoor_temperature = 24.0
+    coordinator = MideaDeviceUpdateCoordinator(hass, device)
+
+    sensor = MideaSensor(
+        coordinator,
+        "indoor_temperature",
+        SensorDeviceClass.TEMPERATURE,
+        UnitOfTemperature.CELSIUS,
+        deadband_key=CONF_TEMPERATURE_DEADBAND,
+        options={CONF_SENSOR_FILTER: {
+            CONF_TEMPERATURE_DEADBAND: 0.5,
+            CONF_MAX_QUIET_TIME: 0.05,
+        }},
+    )
+    sensor.hass = hass
+    sensor.entity_id = "sensor.indoor_temperature"
+
+    with patch.object(sensor, "async_write_ha_state", MagicMock()) as mock_write_state:
+        await sensor.async_added_to_hass()
+        assert sensor.native_value == 24.0
+
+        # Changes within the deadband aren't published
+        device._indoor_temperature = 24.3
+        sensor._handle_coordinator_update()
+        assert sensor.native_value == 24.0
+        mock_write_state.assert_not_called()
+
+        # Changes beyond the deadband are published immediately
+        device._indoor_temperature = 25.0
+        sensor._handle_coordinator_update()
+        assert sensor.native_value == 25.0
+        mock_write_state.assert_called_once()
+
+        # Held back values are published after the quiet time
+        device._indoor_temperature = 25.2
+        sensor._handle_coordinator_update()
+        assert sensor.native_value == 25.0
+        await asyncio.sleep(0.1)
+        await hass.async_block_till_done()
+        assert sensor.native_value == 25.2
+        assert mock_write_state.call_count == 2
+
+        # Availability changes are published immediately
+        device._online = False
+        sensor._handle_coordinator_update()
+        assert mock_write_state.call_count == 3
+        device._online = True
+
+        # Unfiltered sensors publish every change
+        sensor._async_options_updated({})
+        device._indoor_temperature = 25.3
+        sensor._handle_coordinator_update()
+        assert sensor.native_value == 25.3
+
+    await sensor.async_remove()
+
+
+async def test_sensor_min_publish_interval(
+    hass: HomeAssistant,
+) -> None:
+    """Test changes are published at most once per minimum interval."""
+
+    device = AC("0.0.0.0", 0, 0)
+    device._online = True
+    device._indoor_temperature = 24.0
+    coordinator = MideaDeviceUpdateCoordinator(hass, device)
+
+    sensor = MideaSensor(
+        coordinator,
+        "indoor_temperature",
+        SensorDeviceClass.TEMPERATURE,
+        UnitOfTemperature.CELSIUS,
+        deadband_key=CONF_TEMPERATURE_DEADBAND,
+        options={CONF_SENSOR_FILTER: {CONF_MIN_PUBLISH_INTERVAL: 0.05}},
+    )
+    sensor.hass = hass
+    sensor.entity_id = "sensor.indoor_temperature"
+
+    with patch.object(sensor, "async_write_ha_state", MagicMock()) as mock_write_state:
+        await sensor.async_added_to_hass()
+
+        # Rapid changes are held back until the interval expires
+        for value in (24.5, 25.0, 25.5):
+            device._indoor_temperature = value
+            sensor._handle_coordinator_update()
+        assert sensor.native_value == 24.0
+        mock_write_state.assert_not_called()
+
+        # Only the latest value is published
+        await asyncio.sleep(0.1)
+        await hass.async_block_till_done()
+        assert sensor.native_value == 25.5
+        mock_write_state.assert_called_once()
+
+        # Changes after the interval are published immediately
+        await asyncio.sleep(0.1)
+        device._indoor_temperature = 26.0
+        sensor._handle_coordinator_update()
+        assert sensor.native_value == 26.0
+        assert mock_write_state.call_count == 2
+
+    await sensor.async_remove()
+
+
+async def test_energy_sensor_options_updated(
+    hass: HomeAssistant,
+) -> None:
+    """Test energy sensors remain unfiltered after an options update."""
+
+    device = AC("0.0.0.0", 0, 0)
+    device._online = True
+    coordinator = MideaDeviceUpdateCoordinator(hass, device)
+
+    sensor = MideaEnergySensor(
+        coordinator,
+        "total_energy_usage",
+        SensorDeviceClass.ENERGY,
+        UnitOfEnergy.KILO_WATT_HOUR,
+        config_key=CONF_ENERGY_SENSOR,
+        format=EnergyFormat.BCD,
+    )
+    sensor.hass = hass
+    sensor.entity_id = "sensor.total_energy_usage"
+
+    options = {
+        CONF_ENERGY_SENSOR: {
+            CONF_ENERGY_DATA_FORMAT: EnergyFormat.BCD,
+            CONF_ENERGY_DATA_SCALE: 1.0,
+        },
+        CONF_SENSOR_FILTER: {CONF_MIN_PUBLISH_INTERVAL: 60},
+    }
+
+    with (patch.object(device, "get_total_energy_usage", MagicMock(return_value=1.0)) as mock_energy,
+          patch.object(sensor, "async_write_ha_state", MagicMock()) as mock_write_state):
+        await sensor.async_added_to_hass()
+
+        # Apply a filter option while the entity is running
+        sensor._async_options_updated(options)
+        assert not sensor._filtered
+        assert mock_write_state.call_count == 1
+
+        # Changes are still published immediately
+        mock_energy.return_value = 2.0
+        sensor._handle_coordinator_update()
+        assert sensor.native_value == 2.0
+        assert mock_write_state.call_count == 2
+
+    await sensor.async_remove()
@@ -0,0 +1,119 @@
+"""Tests for domain services."""
+
+import asyncio
+import logging
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from homeassistant.const import CONF_HOST, CONF_ID, CONF_PORT, CONF_TOKEN
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+from msmart.const import DeviceType
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.midea_ac.const import CONF_DEVICE_TYPE, CONF_KEY, DOMAIN
+from custom_components.midea_ac.services import _async_set_entity_state
+
+from .fake_device import FakeAirConditioner, FakeMideaServer
+
+logging.basicConfig(level=logging.DEBUG)
+_LOGGER = logging.getLogger(__name__)
+
+
+@pytest.fixture(autouse=True)
+def auto_socket_enabled(socket_enabled) -> None:
+    """Allow connections to the local fake devices."""
+
+
+async def test_group_set_state(hass: HomeAssistant) -> None:
+    """Test setting the state of many devices returns a result for each."""
+
+    servers = [FakeMideaServer(FakeAirConditioner(), 1000 + i)
+               for i in range(3)]
+    await asyncio.gather(*(server.start() for server in servers))
+
+    for server in servers:
+        server.device.power_on = True
+        MockConfigEntry(
+            domain=DOMAIN,
+            unique_id=str(server.device_id),
+            data={
+                CONF_ID: str(server.device_id),
+                CONF_HOST: server.host,
+                CONF_PORT: server.port,
+                CONF_TOKEN: None,
+                CONF_KEY: None,
+                CONF_DEVICE_TYPE: DeviceType.AIR_CONDITIONER,
+            },
+        ).add_to_hass(hass)
+
+    assert await async_setup_component(hass, DOMAIN, {})
+    await hass.async_block_till_done()
+
+    entity_ids = sorted(hass.states.async_entity_ids("climate"))
+    assert len(entity_ids) == 3
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        "group_set_state",
+        {
+            "entity_id": entity_ids + ["climate.unknown"],
+            "hvac_mode": "off",
+            "max_concurrency": 2,
+        },
+        blocking=True,
+        return_response=True,
+    )
+
+    # Every device is switched off
+    assert all(not server.device.power_on for server in servers)
+    assert response["succeeded"] == 3
+    assert response["failed"] == 1
+    for entity_id in entity_ids:
+        assert response["results"][entity_id]["success"]
+        assert response["results"][entity_id]["attempts"] == 1
+    assert not response["results"]["climate.unknown"]["success"]
+
+    # Unsupported values fail without retrying
+    response = await hass.services.async_call(
+        DOMAIN,
+        "group_set_state",
+        {"entity_id": entity_ids[0], "fan_mode": "invalid", "retries": 3},
+        blocking=True,
+        return_response=True,
+    )
+    result = response["results"][entity_ids[0]]
+    assert not result["success"]
+    assert result["attempts"] == 1
+
+    # Service is removed with the last entry
+    for entry in hass.config_entries.async_entries(DOMAIN):
+        assert hass.services.has_service(DOMAIN, "group_set_state")
+        assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+    assert not hass.services.has_service(DOMAIN, "group_set_state")
+
+    await asyncio.gather(*(server.stop() for server in servers))
+
+
+async def test_timed_out_write_not_retried() -> None:
+    """Test writes which are still running aren't retried after a timeout."""
+
+    async def _set_state(**kwargs) -> None:
+        await asyncio.sleep(1)
+
+    entity = MagicMock()
+    entity.async_set_state = AsyncMock(side_effect=_set_state)
+    entity.coordinator.apply_in_progress = True
+
+    result = await _async_set_entity_state(
+        entity, {"hvac_mode": "off"}, asyncio.Semaphore(1), 0.01, 3)
+    assert not result["success"]
+    assert result["attempts"] == 1
+    entity.async_set_state.assert_awaited_once()
+
+    # Writes which were abandoned are retried
+    entity.coordinator.apply_in_progress = False
+    result = await _async_set_entity_state(
+        entity, {"hvac_mode": "off"}, asyncio.Semaphore(1), 0.01, 1)
+    assert result["attempts"] == 2
@@ -0,0 +1,112 @@
+"""Tests for V3 session management."""
+
+import time
+from unittest.mock import AsyncMock, patch
+
+from homeassistant.core import HomeAssistant
+from msmart.device import AirConditioner as AC
+from msmart.lan import AuthenticationError
+
+from custom_components.midea_ac.const import SESSION_EXPIRATION
+from custom_components.midea_ac.coordinator import MideaDeviceUpdateCoordinator
+from custom_components.midea_ac.session import MideaSessionManager
+
+_TOKEN = "00" * 64
+_KEY = "00" * 32
+
+
+async def test_session_reused() -> None:
+    """Test sessions and their connections are reused across device objects."""
+
+    sessions = MideaSessionManager()
+
+    session = sessions.async_get(1234, "0.0.0.0", 6444, _TOKEN, _KEY)
+    device = AC("0.0.0.0", 1234, 6444)
+    session.attach(device)
+
+    # A reloaded device shares the existing connection
+    assert sessions.async_get(1234, "0.0.0.0", 6444, _TOKEN, _KEY) is session
+    reloaded = AC("0.0.0.0", 1234, 6444)
+    session.attach(reloaded)
+    assert reloaded._lan is device._lan
+
+    # Changed credentials replace the session
+    assert sessions.async_get(
+        1234, "0.0.0.0", 6444, _TOKEN, "11" * 32) is not session
+
+
+async def test_session_renewal() -> None:
+    """Test sessions are renewed before they expire."""
+
+    session = MideaSessionManager().async_get(1234, "0.0.0.0", 6444, _TOKEN, _KEY)
+    device = AC("0.0.0.0", 1234, 6444)
+    session.attach(device)
+    assert session.renewal_due
+
+    with patch.object(device, "authenticate", AsyncMock()) as mock_authenticate:
+        await session.async_authenticate(device)
+        mock_authenticate.assert_awaited_once_with(_TOKEN, _KEY)
+    assert not session.renewal_due
+
+    # Connection lifetime limits the session lifetime
+    device.set_max_connection_lifetime(100)
+    assert session.lifetime == 100
+
+    session._authenticated_at = time.monotonic() - 95
+    assert session.renewal_due
+
+    # Failed handshakes are counted
+    with (patch.object(device, "authenticate", AsyncMock(side_effect=AuthenticationError)),
+          patch.object(device._lan, "_disconnect")):
+        try:
+            await session.async_authenticate(device)
+        except AuthenticationError:
+            pass
+
+    diagnostics = session.get_diagnostics()
+    assert diagnostics["handshake_count"] == 2
+    assert diagnostics["failed_handshake_count"] == 1
+
+
+async def test_session_renewed_by_poll(
+    hass: HomeAssistant,
+) -> None:
+    """Test the coordinator renews a session during a poll."""
+
+    session = MideaSessionManager().async_get(1234, "0.0.0.0", 6444, _TOKEN, _KEY)
+    device = AC("0.0.0.0", 1234, 6444)
+    session.attach(device)
+    coordinator = MideaDeviceUpdateCoordinator(hass, device, session=session)
+
+    with (patch.object(device, "authenticate", AsyncMock()) as mock_authenticate,
+          patch.object(device, "refresh", AsyncMock())):
+        await coordinator._async_update_data()
+        mock_authenticate.assert_awaited_once()
+
+        # Valid sessions aren't renewed
+        await coordinator._async_update_data()
+        mock_authenticate.assert_awaited_once()
+
+    assert coordinator.get_diagnostics()["session"]["handshake_count"] == 1
+
+
+async def test_session_without_msmart_internals() -> None:
+    """Test sessions degrade to separate connections if msmart internals change."""
+
+    session = MideaSessionManager().async_get(1234, "0.0.0.0", 6444, _TOKEN, _KEY)
+    device = AC("0.0.0.0", 1234, 6444)
+    lan = device._lan
+
+    # Devices keep their own connection
+    device._lan = None
+    session.attach(device)
+    device._lan = lan
+    reloaded = AC("0.0.0.0", 1234, 6444)
+    session.attach(reloaded)
+    assert reloaded._lan is not lan
+
+    # Default expiration is used and connections are left to msmart
+    with (patch("msmart.lan._LanProtocolV3", None),
+          patch.object(type(reloaded._lan), "_disconnect", None, create=True)):
+        assert session.lifetime == SESSION_EXPIRATION
+        session.close()
@@ -0,0 +1,79 @@
+"""Tests for the startup coordinator."""
+
+import asyncio
+import logging
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.setup import async_setup_component
+
+from custom_components.midea_ac.const import (CONF_MAX_CONCURRENT_STARTUPS,
+                                              DATA_STARTUP, DOMAIN)
+from custom_components.midea_ac.startup import MideaStartupCoordinator
+
+logging.basicConfig(level=logging.DEBUG)
+_LOGGER = logging.getLogger(__name__)
+
+
+async def test_concurrent_startups_limited() -> None:
+    """Test the number of concurrent startups is limited."""
+
+    startup_coordinator = MideaStartupCoordinator(max_concurrent_startups=2)
+
+    in_progress = 0
+    max_in_progress = 0
+
+    async def _startup(device_id: int) -> None:
+        nonlocal in_progress, max_in_progress
+        async with startup_coordinator.async_startup(device_id) as startup:
+            async with startup.async_phase("refresh"):
+                in_progress += 1
+                max_in_progress = max(max_in_progress, in_progress)
+                await asyncio.sleep(0.01)
+                in_progress -= 1
+
+    await asyncio.gather(*[_startup(id) for id in range(5)])
+
+    assert max_in_progress == 2
+
+    # All startups are summarized together
+    diagnostics = startup_coordinator.get_diagnostics(4)
+    assert diagnostics["in_progress"] == 0
+    assert diagnostics["device"]["result"] == "ok"
+    assert diagnostics["device"]["queue_delay"] >= 0.01
+    assert diagnostics["device"]["phases"]["refresh"] >= 0.01
+    assert diagnostics["last_summary"]["devices"] == 5
+    assert diagnostics["last_summary"]["failed"] == 0
+
+
+async def test_startup_limit_config(
+    hass: HomeAssistant,
+) -> None:
+    """Test the concurrent startup limit is configured for the domain."""
+
+    assert await async_setup_component(
+        hass, DOMAIN, {DOMAIN: {CONF_MAX_CONCURRENT_STARTUPS: 2}})
+
+    startup_coordinator = hass.data[DOMAIN][DATA_STARTUP]
+    assert startup_coordinator.get_diagnostics(
+        1234)["max_concurrent_startups"] == 2
+
+
+async def test_phase_timeout() -> None:
+    """Test a slow phase is aborted and the entry retried."""
+
+    startup_coordinator = MideaStartupCoordinator(phase_timeout=0.01)
+
+    with pytest.raises(ConfigEntryNotReady):
+        async with startup_coordinator.async_startup(1234) as startup:
+            async with startup.async_phase("authenticate"):
+                pass
+            async with startup.async_phase("capabilities"):
+                await asyncio.sleep(1)
+
+    diagnostics = startup_coordinator.get_diagnostics(1234)
+    assert diagnostics["device"]["result"] == "timeout (capabilities)"
+    assert diagnostics["device"]["phases"].keys() == {
+        "authenticate", "capabilities"}
+    assert diagnostics["last_summary"]["failed"] == 1
@@ -80,6 +80,9 @@ async def test_cc_purifier_switch(
     mock_config_entry.mock_state(hass, ConfigEntryState.LOADED)
     mock_config_entry.add_to_hass(hass)
 
+    # Mark the integration as set up so forwarding doesn't set up the entry
+    hass.config.components.add(DOMAIN)
+
     # Create a dummy device and force 2 purifier modes
     mock_device = CC("0.0.0.0", 0, 0)
     mock_device.power_state = True
@@ -125,6 +128,9 @@ async def test_cc_purifier_no_switch(
     mock_config_entry.mock_state(hass, ConfigEntryState.LOADED)
     mock_config_entry.add_to_hass(hass)
 
+    # Mark the integration as set up so forwarding doesn't set up the entry
+    hass.config.components.add(DOMAIN)
+
     # Create a dummy device and force 3 purifier modes
     mock_device = CC("0.0.0.0", 0, 0)
     mock_device.power_state = True